@@ -1,20 +1,25 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import os
 import shutil
 import subprocess
 import textwrap
 import threading
+import time
+import warnings
 from logging import Logger
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, Iterable, Mapping, cast
 
+from filelock import FileLock
 from pyproject_hooks import BuildBackendHookCaller
 
 from pdm.compat import tomllib
 from pdm.environments import PythonEnvironment
-from pdm.exceptions import BuildError
+from pdm.exceptions import BuildError, PDMDeprecationWarning
 from pdm.models.in_process import get_sys_config_paths
 from pdm.models.requirements import Requirement, parse_requirement
 from pdm.models.working_set import WorkingSet
@@ -154,7 +159,10 @@ class EnvBuilder:
         "requires": ["setuptools >= 40.8.0", "wheel"],
     }
 
-    _shared_envs: ClassVar[dict[int, str]] = {}
+    # Shared envs are recreated after this many seconds, to pick up newer backend releases.
+    SHARED_ENV_TTL: ClassVar[int] = 7 * 24 * 3600
+    SHARED_ENV_STAMP: ClassVar[str] = ".pdm-build-env"
+
     _overlay_envs: ClassVar[dict[str, str]] = {}
 
     if TYPE_CHECKING:
@@ -164,13 +172,30 @@ class EnvBuilder:
 
     @classmethod
     def get_shared_env(cls, key: int) -> str:
-        if key in cls._shared_envs:
-            logger.debug("Reusing shared build env: %s", cls._shared_envs[key])
-            return cls._shared_envs[key]
-        # We don't save the cache here, instead it will be done after the installation
-        # finished.
+        warnings.warn(
+            "EnvBuilder.get_shared_env() is deprecated and returns a new temporary directory, "
+            "use the instance method get_shared_env_path() instead.",
+            PDMDeprecationWarning,
+            stacklevel=2,
+        )
         return create_tracked_tempdir("-shared", "pdm-build-env-")
 
+    def get_shared_env_path(self, key: str) -> str:
+        """Get the shared env for the given key. Shared envs are persisted in the cache
+        directory so that they can be reused by later runs, until they expire.
+        """
+        path = self._env.project.cache("build_envs") / key
+        logger.debug("Using shared build env: %s", path)
+        return str(path)
+
+    def get_shared_env_key(self) -> str:
+        """Get the content-addressed key of the shared env, from the interpreter
+        and the requires list of the build system.
+        """
+        interpreter = self._env.interpreter
+        content = json.dumps([str(interpreter.executable), str(interpreter.version), sorted(set(self._requires))])
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()[:32]
+
     @classmethod
     def get_overlay_env(cls, key: str) -> str:
         if key not in cls._overlay_envs:
@@ -217,7 +242,7 @@ class EnvBuilder:
         self._prefix = _Prefix(
             self.executable,
             # Build backends with the same requires list share the cached base env.
-            shared=self.get_shared_env(hash(frozenset(self._requires))),
+            shared=self.get_shared_env_path(self.get_shared_env_key()),
             # Overlay envs are unique for each source to be built.
             overlay=self.get_overlay_env(os.path.normcase(self.src_dir).rstrip("\\/")),
         )
@@ -288,22 +313,39 @@ class EnvBuilder:
         return missing
 
     def install(self, requirements: Iterable[str], shared: bool = False) -> None:
+        if not shared:
+            self._install(requirements, self._prefix.overlay)
+            return
+        # The shared env may be being populated by other builds, in this process or not.
+        # Hold the lock so that no half-prepared env is used and only one of them installs.
+        with FileLock(f"{self._prefix.shared}.lock"):
+            self._expire_shared_env()
+            self._install(requirements, self._prefix.shared)
+            stamp = Path(self._prefix.shared, self.SHARED_ENV_STAMP)
+            if not stamp.exists():
+                stamp.parent.mkdir(parents=True, exist_ok=True)
+                stamp.touch()
+
+    def _expire_shared_env(self) -> None:
+        """Remove the shared env if it was stamped more than SHARED_ENV_TTL ago."""
+        path = self._prefix.shared
+        try:
+            created = os.path.getmtime(os.path.join(path, self.SHARED_ENV_STAMP))
+        except OSError:  # Not created yet, or not stamped. It is stamped after the install.
+            return
+        if time.time() - created > self.SHARED_ENV_TTL:
+            logger.debug("Shared build env %s is expired, recreating it", path)
+            shutil.rmtree(path, ignore_errors=True)
+
+    def _install(self, requirements: Iterable[str], path: str) -> None:
         from pdm.installers.core import install_requirements
 
         missing = list(self.check_requirements(requirements))
         if not missing:
             return
-        path = self._prefix.shared if shared else self._prefix.overlay
         env = PythonEnvironment(self._env.project, python=str(self._env.interpreter.path), prefix=path)
         install_requirements(missing, env)
 
-        if shared:
-            # The shared env is prepared and is safe to be cached now. This is to make
-            # sure no broken env is returned early when run in parallel mode.
-            key = hash(frozenset(requirements))
-            if key not in self._shared_envs:
-                self._shared_envs[key] = path
-
     def prepare_metadata(self, out_dir: str, config_settings: Mapping[str, Any] | None = None) -> str:
         """Prepare metadata and store in the out_dir.
         Some backends doesn't provide that API, in that case the metadata will be
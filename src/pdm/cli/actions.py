@@ -3,6 +3,7 @@ from __future__ import annotations
 import contextlib
 import datetime
 import hashlib
+import itertools
 import json
 import os
 import sys
@@ -28,11 +29,20 @@ from pdm.cli.utils import (
 from pdm.environments import BareEnvironment
 from pdm.exceptions import PdmException, PdmUsageError, ProjectError
 from pdm.models.candidates import Candidate
+from pdm.models.markers import evaluate_markers
 from pdm.models.repositories import LockedRepository
 from pdm.models.requirements import Requirement, parse_requirement
+from pdm.profiler import profiler
 from pdm.project import Project
-from pdm.project.lockfile import FLAG_CROSS_PLATFORM, FLAG_DIRECT_MINIMAL_VERSIONS, FLAG_INHERIT_METADATA
+from pdm.project.lockfile import (
+    FLAG_CROSS_PLATFORM,
+    FLAG_DIRECT_MINIMAL_VERSIONS,
+    FLAG_INHERIT_METADATA,
+    Compatibility,
+)
 from pdm.resolver import resolve
+from pdm.resolver.incremental import resolve_incremental
+from pdm.resolver.providers import BaseProvider
 from pdm.termui import logger
 
 
@@ -46,8 +56,14 @@ def do_lock(
     groups: list[str] | None = None,
     strategy_change: list[str] | None = None,
     hooks: HookManager | None = None,
+    incremental: bool | None = None,
 ) -> dict[str, Candidate]:
-    """Performs the locking process and update lockfile."""
+    """Performs the locking process and update lockfile.
+
+    If ``incremental`` is true, or the ``strategy.incremental`` config is set when it is None,
+    only the requirements changed since the last lock are resolved, keeping the rest of the
+    locked packages as they are. A full resolution is done if it is not possible.
+    """
     hooks = hooks or HookManager(project)
     check_project_file(project)
     if not project.config["strategy.inherit_metadata"]:
@@ -58,7 +74,10 @@ def do_lock(
         repo = project.get_repository()
         mapping: dict[str, Candidate] = {}
         dependencies: dict[tuple[str, str | None], list[Requirement]] = {}
-        with project.core.ui.open_spinner("Re-calculating hashes..."):
+        # The locked hashes are reused for the files whose links don't carry a hash,
+        # so only the new files are downloaded.
+        known_hashes: dict[str, str] = {}
+        with project.core.ui.open_spinner("Re-calculating hashes...") as spin:
             for key, candidate in locked_repo.packages.items():
                 reqs, python_requires, summary = locked_repo.candidate_info[key]
                 candidate.summary = summary
@@ -67,20 +86,46 @@ def do_lock(
                 dependencies[candidate.dep_key] = list(map(parse_requirement, reqs))
             with project.core.ui.logging("lock"):
                 for c in mapping.values():
+                    for item in c.hashes:
+                        # The files locked with URLs are only matched by the same URL
+                        known_hashes[item["url"] if "url" in item else item["file"]] = item["hash"]
                     c.hashes.clear()
-                fetch_hashes(repo, mapping)
-            lockfile = format_lockfile(
-                project, mapping, dependencies, groups=project.lockfile.groups, strategy=lock_strategy
-            )
-        project.write_lockfile(lockfile)
+                fetched = itertools.count(1)
+
+                def on_fetched(candidate: Candidate, elapsed: float) -> None:
+                    logger.info("Fetched hashes for %s in %.2fs", candidate, elapsed)
+                    spin.update(f"Re-calculating hashes... ({next(fetched)}/{len(mapping)})")
+
+                fetch_hashes(repo, mapping, known_hashes, on_fetched)
+            with profiler.phase("format_lockfile"):
+                lockfile = format_lockfile(
+                    project, mapping, dependencies, groups=project.lockfile.groups, strategy=lock_strategy
+                )
+        with profiler.phase("write_lockfile"):
+            project.write_lockfile(lockfile)
         return mapping
     # TODO: multiple dependency definitions for the same package.
 
-    provider = project.get_provider(
-        strategy,
-        tracked_names,
-        ignore_compatibility=FLAG_CROSS_PLATFORM in lock_strategy,
-        direct_minimal_versions=FLAG_DIRECT_MINIMAL_VERSIONS in lock_strategy,
+    def make_provider(strategy: str) -> BaseProvider:
+        return project.get_provider(
+            strategy,
+            tracked_names,
+            ignore_compatibility=FLAG_CROSS_PLATFORM in lock_strategy,
+            direct_minimal_versions=FLAG_DIRECT_MINIMAL_VERSIONS in lock_strategy,
+        )
+
+    if tracked_names is not None:
+        tracked_names = list(tracked_names)
+    if incremental is None:
+        incremental = bool(project.config["strategy.incremental"])
+    # The locked graph can only be reused if it was locked in the same way, and the
+    # eager strategy updates the dependencies of the tracked packages as well.
+    incremental = (
+        incremental
+        and strategy != "eager"
+        and project.lockfile.exists()
+        and project.lockfile.compatibility() == Compatibility.SAME
+        and project.lockfile.strategy == lock_strategy
     )
     if not requirements:
         requirements = [
@@ -88,7 +133,9 @@ def do_lock(
         ]
     if FLAG_CROSS_PLATFORM not in lock_strategy:
         this_env = project.environment.marker_environment
-        requirements = [req for req in requirements if not req.marker or req.marker.evaluate(this_env)]
+        requirements = [
+            req for req, ok in zip(requirements, evaluate_markers((r.marker for r in requirements), this_env)) if ok
+        ]
     resolve_max_rounds = int(project.config["strategy.resolve_max_rounds"])
     ui = project.core.ui
     with ui.logging("lock"):
@@ -97,15 +144,34 @@ def do_lock(
         try:
             with ui.open_spinner(title="Resolving dependencies") as spin:
                 reporter = project.get_reporter(requirements, tracked_names, spin)
-                resolver: Resolver = project.core.resolver_class(provider, reporter)
                 hooks.try_emit("pre_lock", requirements=requirements, dry_run=dry_run)
-                mapping, dependencies = resolve(
-                    resolver,
-                    requirements,
-                    project.environment.python_requires,
-                    resolve_max_rounds,
-                    inherit_metadata=FLAG_INHERIT_METADATA in lock_strategy,
-                )
+                result = None
+                with profiler.phase("resolve"):
+                    if incremental:
+                        # Prefer the locked pins for the changed requirements to keep the graph consistent
+                        provider = make_provider("reuse" if strategy == "all" and not tracked_names else strategy)
+                        result = resolve_incremental(
+                            project.core.resolver_class(provider, reporter),
+                            project.locked_repository,
+                            requirements,
+                            project.environment.python_requires,
+                            resolve_max_rounds,
+                            tracked_names or (),
+                            inherit_metadata=FLAG_INHERIT_METADATA in lock_strategy,
+                        )
+                        if result is None:
+                            logger.info("Unable to lock incrementally, resolving all dependencies")
+                    if result is None:
+                        provider = make_provider(strategy)
+                        resolver: Resolver = project.core.resolver_class(provider, reporter)
+                        result = resolve(
+                            resolver,
+                            requirements,
+                            project.environment.python_requires,
+                            resolve_max_rounds,
+                            inherit_metadata=FLAG_INHERIT_METADATA in lock_strategy,
+                        )
+                mapping, dependencies = result
                 spin.update("Fetching hashes for resolved packages...")
                 fetch_hashes(provider.repository, mapping)
         except ResolutionTooDeep:
@@ -123,10 +189,12 @@ def do_lock(
             ui.error(format_resolution_impossible(err))
             raise ResolutionImpossible("Unable to find a resolution") from None
         else:
-            data = format_lockfile(project, mapping, dependencies, groups=groups, strategy=lock_strategy)
+            with profiler.phase("format_lockfile"):
+                data = format_lockfile(project, mapping, dependencies, groups=groups, strategy=lock_strategy)
             if project.enable_write_lockfile:
                 ui.echo(f"{termui.Emoji.LOCK} Lock successful")
-            project.write_lockfile(data, write=not dry_run)
+            with profiler.phase("write_lockfile"):
+                project.write_lockfile(data, write=not dry_run)
             hooks.try_emit("post_lock", resolution=mapping, dry_run=dry_run)
 
     return mapping
@@ -140,9 +208,9 @@ def resolve_candidates_from_lockfile(
 ) -> dict[str, Candidate]:
     ui = project.core.ui
     resolve_max_rounds = int(project.config["strategy.resolve_max_rounds"])
-    reqs = [
-        req for req in requirements if not req.marker or req.marker.evaluate(project.environment.marker_environment)
-    ]
+    requirements = list(requirements)
+    marker_env = project.environment.marker_environment
+    reqs = [req for req, ok in zip(requirements, evaluate_markers((r.marker for r in requirements), marker_env)) if ok]
     with ui.logging("install-resolve"):
         with ui.open_spinner("Resolving packages from lockfile...") as spinner:
             reporter = BaseReporter()
@@ -175,8 +243,6 @@ def resolve_candidates_from_lockfile(
 
 def check_lockfile(project: Project, raise_not_exist: bool = True) -> str | None:
     """Check if the lock file exists and is up to date. Return the lock strategy."""
-    from pdm.project.lockfile import Compatibility
-
     if not project.lockfile.exists():
         if raise_not_exist:
             raise ProjectError("Lockfile does not exist, nothing to install")
@@ -341,6 +407,17 @@ def get_latest_version(project: Project) -> str | None:
     return latest_version
 
 
+def collect_caches(project: Project) -> None:
+    """Collect the least recently scanned cache if it is due, never failing the command."""
+    import sqlite3
+
+    interval = project.config["cache.gc_interval"] * 60 * 60
+    try:
+        project.make_cache_manager().gc_step(interval)
+    except (OSError, sqlite3.Error) as e:
+        logger.debug("Failed to collect the caches: %s", e)
+
+
 def check_update(project: Project) -> None:  # pragma: no cover
     """Check if there is a new version of PDM available"""
     from packaging.version import Version
@@ -0,0 +1,27 @@
+# The built-in commands as (name, module, help, aliases), to register them without importing
+# the command modules, which are imported only when the command is dispatched.
+BUILTIN_COMMANDS = (
+    ("add", "add", "Add package(s) to pyproject.toml and install them", ()),
+    ("build", "build", "Build artifacts for distribution", ()),
+    ("cache", "cache", "Control the caches of PDM", ()),
+    ("completion", "completion", "Generate completion scripts for the given shell", ()),
+    ("config", "config", "Display the current configuration", ()),
+    ("export", "export", "Export the locked packages set to other formats", ()),
+    ("fix", "fix", "Fix the project problems according to the latest version of PDM", ()),
+    ("import", "import_cmd", "Import project metadata from other formats", ()),
+    ("info", "info", "Show the project information", ()),
+    ("init", "init", "Initialize a pyproject.toml for PDM", ()),
+    ("install", "install", "Install dependencies from lock file", ()),
+    ("list", "list", "List packages installed in the current working set", ()),
+    ("lock", "lock", "Resolve and lock dependencies", ()),
+    ("publish", "publish", "Build and publish the project to PyPI", ()),
+    ("remove", "remove", "Remove packages from pyproject.toml", ()),
+    ("run", "run", "Run commands or scripts with local packages loaded", ()),
+    ("search", "search", "Search for PyPI packages", ()),
+    ("self", "self_cmd", "Manage the PDM program itself (previously known as plugin)", ("plugin",)),
+    ("show", "show", "Show the package information", ()),
+    ("sync", "sync", "Synchronize the current working set with lock file", ()),
+    ("update", "update", "Update package(s) in pyproject.toml", ()),
+    ("use", "use", "Use the given python version or path as base interpreter", ()),
+    ("venv", "venv", "Virtualenv management", ()),
+)
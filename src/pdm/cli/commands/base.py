@@ -49,7 +49,8 @@ class BaseCommand:
         help_text = cls.description or cls.__doc__
         name = name or cls.name or ""
         # Remove the existing subparser as it will raise an error on Python 3.11+
-        subparsers._name_parser_map.pop(name, None)
+        for key in [name, *kwargs.get("aliases", ())]:
+            subparsers._name_parser_map.pop(key, None)
         subactions = subparsers._get_subactions()
         subactions[:] = [action for action in subactions if action.dest != name]
         parser = subparsers.add_parser(
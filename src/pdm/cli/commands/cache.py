@@ -7,6 +7,7 @@ from pdm import termui
 from pdm.cli.commands.base import BaseCommand
 from pdm.cli.options import verbose_option
 from pdm.exceptions import PdmUsageError
+from pdm.models.cache_manager import CACHE_TYPES
 from pdm.project import Project
 
 
@@ -21,6 +22,8 @@ class Command(BaseCommand):
         RemoveCommand.register_to(subparsers, "remove")
         ListCommand.register_to(subparsers, "list")
         InfoCommand.register_to(subparsers, "info")
+        PruneCommand.register_to(subparsers, "prune")
+        GCCommand.register_to(subparsers, "gc")
         parser.set_defaults(search_parent=False)
         self.parser = parser
 
@@ -40,10 +43,6 @@ def find_files(parent: Path, pattern: str) -> Iterable[Path]:
             yield file
 
 
-def directory_size(directory: Path) -> int:
-    return sum(map(file_size, find_files(directory, "*")))
-
-
 def format_size(size: float) -> str:
     if size > 1000 * 1000:
         return f"{size / 1000.0 / 1000:.1f} MB"
@@ -60,7 +59,8 @@ def remove_cache_files(project: Project, pattern: str) -> None:
         raise PdmUsageError("Please provide a pattern")
 
     wheel_cache = project.cache("wheels")
-    files = list(find_files(wheel_cache, pattern))
+    # Skip the hidden manifests of the wheel cache
+    files = [file for file in find_files(wheel_cache, pattern) if not file.name.startswith(".")]
 
     if not files:
         raise PdmUsageError("No matching files found")
@@ -68,6 +68,7 @@ def remove_cache_files(project: Project, pattern: str) -> None:
     for file in files:
         os.unlink(file)
         project.core.ui.echo(f"Removed {file}", verbosity=termui.Verbosity.DETAIL)
+    project.make_cache_manager().invalidate(["wheels"])
     project.core.ui.echo(f"{len(files)} file{'s' if len(files) > 1 else ''} removed")
 
 
@@ -75,7 +76,7 @@ class ClearCommand(BaseCommand):
     """Clean all the files under cache directory"""
 
     arguments = (verbose_option,)
-    CACHE_TYPES = ("hashes", "http", "wheels", "metadata", "packages")
+    CACHE_TYPES = CACHE_TYPES
 
     def add_arguments(self, parser: argparse.ArgumentParser) -> None:
         parser.add_argument(
@@ -87,17 +88,9 @@ class ClearCommand(BaseCommand):
 
     @staticmethod
     def _clear_packages(root: Path) -> int:
-        from pdm.installers.packages import CachedPackage
-
-        cleared = 0
-        for subdir in root.iterdir():
-            if not subdir.is_dir():
-                continue
-            pkg = CachedPackage(subdir)
-            if not pkg.referrers:
-                pkg.cleanup()
-                cleared += 1
-        return cleared
+        from pdm.installers.packages import clear_unused_packages
+
+        return clear_unused_packages(root)
 
     @staticmethod
     def _clear_files(root: Path) -> int:
@@ -125,6 +118,7 @@ class ClearCommand(BaseCommand):
                         packages += self._clear_packages(project.cache(type_))
                     else:
                         files += self._clear_files(project.cache(type_))
+            project.make_cache_manager().invalidate(types or CACHE_TYPES)
             message = []
             if packages:
                 message.append(f"{packages} package{'s' if packages > 1 else ''}")
@@ -159,7 +153,9 @@ class ListCommand(BaseCommand):
 
     def handle(self, project: Project, options: argparse.Namespace) -> None:
         rows = [
-            (format_size(file_size(file)), file.name) for file in find_files(project.cache("wheels"), options.pattern)
+            (format_size(file_size(file)), file.name)
+            for file in find_files(project.cache("wheels"), options.pattern)
+            if not file.name.startswith(".")
         ]
         project.core.ui.display_columns(rows, [">Size", "Filename"])
 
@@ -170,22 +166,76 @@ class InfoCommand(BaseCommand):
     arguments = (verbose_option,)
 
     def handle(self, project: Project, options: argparse.Namespace) -> None:
+        manager = project.make_cache_manager()
+        # The usage is read from the cache index, unless it is older than the GC interval
+        max_age = (project.config["cache.gc_interval"] or 24) * 60 * 60
         with project.core.ui.open_spinner("Calculating cache files"):
-            output = [
-                f"[primary]Cache Root[/]: {project.cache_dir}, "
-                f"Total size: {format_size(directory_size(project.cache_dir))}"
-            ]
+            output = []
+            total_size = 0
             for name, description in [
                 ("hashes", "File Hash Cache"),
                 ("http", "HTTP Cache"),
                 ("wheels", "Wheels Cache"),
                 ("metadata", "Metadata Cache"),
                 ("packages", "Package Cache"),
+                ("build_envs", "Build Environment Cache"),
+                ("artifacts", "Artifact Cache"),
             ]:
-                cache_location = project.cache(name)
-                files = list(find_files(cache_location, "*"))
-                size = directory_size(cache_location)
-                output.append(f"  [primary]{description}[/]: {cache_location}")
-                output.append(f"    Files: {len(files)}, Size: {format_size(size)}")
+                usage = manager.get_usage(name, max_age=max_age)
+                total_size += usage.size
+                output.append(f"  [primary]{description}[/]: {project.cache(name)}")
+                output.append(f"    Files: {usage.files}, Size: {format_size(usage.size)}")
+            output.insert(0, f"[primary]Cache Root[/]: {project.cache_dir}, Total size: {format_size(total_size)}")
 
         project.core.ui.echo("\n".join(output))
+
+
+class PruneCommand(BaseCommand):
+    """Remove the cached artifacts that haven't been used for a while"""
+
+    arguments = (verbose_option,)
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=30,
+            help="Remove the artifacts not used in the last DAYS days, default: 30",
+        )
+
+    def handle(self, project: Project, options: argparse.Namespace) -> None:
+        if options.days < 0:
+            raise PdmUsageError("The number of days must be non-negative")
+        artifact_cache = project.make_artifact_cache()
+        with project.core.ui.open_spinner("Pruning artifact caches..."):
+            size_before = sum(map(file_size, artifact_cache.iter_files()))
+            removed = artifact_cache.prune(options.days * 24 * 60 * 60)
+            size_after = sum(map(file_size, artifact_cache.iter_files()))
+            project.make_cache_manager().invalidate(["artifacts"])
+        project.core.ui.echo(
+            f"{removed} file{'s' if removed != 1 else ''} removed, {format_size(size_before - size_after)} freed"
+        )
+
+
+class GCCommand(BaseCommand):
+    """Evict the least recently used entries from the caches exceeding their size limits"""
+
+    arguments = (verbose_option,)
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument("type", nargs="?", help="Only collect the given type of caches", choices=CACHE_TYPES)
+
+    def handle(self, project: Project, options: argparse.Namespace) -> None:
+        manager = project.make_cache_manager()
+        removed = freed = 0
+        with project.core.ui.open_spinner("Collecting caches..."):
+            for cache_type in [options.type] if options.type else CACHE_TYPES:
+                count, size = manager.collect(cache_type)
+                if count:
+                    project.core.ui.echo(
+                        f"Removed {count} entries from {cache_type} cache, {format_size(size)} freed",
+                        verbosity=termui.Verbosity.DETAIL,
+                    )
+                removed += count
+                freed += size
+        project.core.ui.echo(f"{removed} entr{'ies' if removed != 1 else 'y'} removed, {format_size(freed)} freed")
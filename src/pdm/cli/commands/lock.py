@@ -1,5 +1,8 @@
 import argparse
+import json
+import os
 import sys
+from pathlib import Path
 
 from pdm import termui
 from pdm.cli import actions
@@ -7,6 +10,7 @@ from pdm.cli.commands.base import BaseCommand
 from pdm.cli.filters import GroupSelection
 from pdm.cli.hooks import HookManager
 from pdm.cli.options import groups_group, lock_strategy_group, lockfile_option, no_isolation_option, skip_option
+from pdm.profiler import profiler
 from pdm.project import Project
 
 
@@ -49,6 +53,22 @@ class Command(BaseCommand):
             const="reuse-installed",
             help="Reuse installed packages if possible",
         )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            default=None,
+            help="Resolve only the requirements changed since the last lock, keeping the other "
+            "locked packages as they are [env var: PDM_INCREMENTAL_LOCK]",
+        )
+        parser.add_argument(
+            "--profile",
+            nargs="?",
+            const="-",
+            default=os.getenv("PDM_PROFILE") or None,
+            metavar="FILE",
+            help="Write a JSON report of the time spent in each phase of locking to FILE, "
+            "or to stderr if FILE is not given or is '-' [env var: PDM_PROFILE]",
+        )
 
     def handle(self, project: Project, options: argparse.Namespace) -> None:
         if options.check:
@@ -68,11 +88,27 @@ class Command(BaseCommand):
                 )
                 sys.exit(0)
         selection = GroupSelection.from_options(project, options)
-        actions.do_lock(
-            project,
-            refresh=options.refresh,
-            strategy=options.update_strategy,
-            groups=selection.all(),
-            strategy_change=options.strategy_change,
-            hooks=HookManager(project, options.skip),
-        )
+        if options.profile:
+            profiler.start()
+        try:
+            actions.do_lock(
+                project,
+                refresh=options.refresh,
+                strategy=options.update_strategy,
+                groups=selection.all(),
+                strategy_change=options.strategy_change,
+                hooks=HookManager(project, options.skip),
+                incremental=options.incremental,
+            )
+        finally:
+            if options.profile:
+                self._write_profile(project, options.profile, profiler.stop())
+
+    @staticmethod
+    def _write_profile(project: Project, dest: str, report: dict) -> None:
+        content = json.dumps(report, indent=2)
+        if dest == "-":
+            project.core.ui.echo(content, err=True, markup=False, highlight=False, soft_wrap=True)
+        else:
+            Path(dest).write_text(content + "\n", encoding="utf-8")
+            project.core.ui.echo(f"Profile report is written to [success]{dest}[/]", err=True)
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import glob
+import hashlib
 import itertools
+import json
 import os
 import re
 import shlex
 import signal
 import subprocess
 import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from types import FrameType
 from typing import TYPE_CHECKING, Mapping, NamedTuple, Sequence, cast
@@ -18,14 +24,16 @@ from pdm import termui
 from pdm.cli.commands.base import BaseCommand
 from pdm.cli.hooks import HookManager
 from pdm.cli.options import skip_option, venv_option
+from pdm.cli.script_hooks import run_script_if_present  # noqa: F401
 from pdm.cli.utils import check_project_file
 from pdm.exceptions import PdmUsageError
 from pdm.project import Project
-from pdm.signals import pdm_signals
 from pdm.utils import expand_env_vars, is_path_relative_to
 
 if TYPE_CHECKING:
-    from typing import Any, Callable, Iterator, TypedDict
+    from typing import Any, Iterable, Iterator, TypedDict
+
+    from pdm.environments.launch import LaunchRecord
 
     class EnvFileOptions(TypedDict, total=True):
         override: str
@@ -35,12 +43,21 @@ if TYPE_CHECKING:
         env_file: EnvFileOptions | str | None
         help: str
         site_packages: bool
+        depends: Sequence[str]
+        parallel: bool
+        jobs: int
+        inputs: Sequence[str]
+        outputs: Sequence[str]
+
+
+# The options that control how a task is scheduled instead of the process to run
+SCHEDULE_OPTIONS = ("depends", "parallel", "jobs", "inputs", "outputs")
 
 
 def exec_opts(*options: TaskOptions | None) -> dict[str, Any]:
     return dict(
         env={k: v for opts in options if opts for k, v in opts.get("env", {}).items()},
-        **{k: v for opts in options if opts for k, v in opts.items() if k not in ("env", "help")},
+        **{k: v for opts in options if opts for k, v in opts.items() if k not in ("env", "help", *SCHEDULE_OPTIONS)},
     )
 
 
@@ -99,11 +116,151 @@ class Task(NamedTuple):
         return self.options.get("help", fallback)
 
 
+class ParallelRun:
+    """The state shared by the steps of a parallel composite task."""
+
+    _output_lock = threading.Lock()
+
+    def __init__(self, label_width: int) -> None:
+        self.label_width = label_width
+        self.cancelled = threading.Event()
+        self._processes: set[subprocess.Popen[bytes]] = set()
+        self._lock = threading.Lock()
+
+    def start_process(self, *args: Any, **kwargs: Any) -> subprocess.Popen[bytes] | None:
+        """Start a process in its own process group unless the run is cancelled."""
+        if sys.platform == "win32":
+            kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            kwargs["start_new_session"] = True
+        with self._lock:
+            if self.cancelled.is_set():
+                return None
+            process = subprocess.Popen(*args, **kwargs)
+            self._processes.add(process)
+            return process
+
+    def finish_process(self, process: subprocess.Popen[bytes]) -> None:
+        with self._lock:
+            self._processes.discard(process)
+
+    def cancel(self) -> None:
+        """Skip the steps not started yet and terminate the process groups of the running
+        steps, so the subprocesses spawned by them don't keep the output pipes open.
+        """
+        with self._lock:
+            self.cancelled.set()
+            for process in self._processes:
+                with contextlib.suppress(OSError):
+                    if sys.platform == "win32":
+                        process.send_signal(signal.CTRL_BREAK_EVENT)
+                    else:
+                        os.killpg(process.pid, signal.SIGTERM)
+
+    def write_output(self, label: str, line: bytes) -> None:
+        text = line.decode("utf-8", errors="replace").rstrip("\r\n")
+        with self._output_lock:
+            sys.stdout.write(f"{label.ljust(self.label_width)} | {text}\n")
+            sys.stdout.flush()
+
+
+class TaskCache:
+    """Remember the fingerprints of the last successful runs of the tasks with ``inputs``.
+
+    The fingerprint covers the task definition, the arguments, the environment
+    variables, the lock file and the content of the input files. The hashes of the
+    input files are kept along with their mtime and size so unchanged files are not
+    read again.
+    """
+
+    def __init__(self, project: Project) -> None:
+        self.project = project
+
+    def _record_path(self, task: Task) -> Path:
+        key = json.dumps([str(self.project.root), task.name])
+        return self.project.cache("tasks") / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    def _load(self, task: Task) -> dict[str, Any]:
+        with contextlib.suppress(OSError, ValueError):
+            record = json.loads(self._record_path(task).read_text("utf-8"))
+            if isinstance(record, dict):
+                return record
+        return {}
+
+    def _glob(self, patterns: str | Sequence[str]) -> list[Path]:
+        """Return the files matching the patterns, the matched directories are
+        expanded to the files in them.
+        """
+        root = self.project.root
+        files: set[Path] = set()
+        for pattern in [patterns] if isinstance(patterns, str) else patterns:
+            # Path.glob() doesn't accept absolute patterns
+            if os.path.isabs(pattern):
+                matches: Iterable[Path] = map(Path, glob.glob(str(pattern), recursive=True))
+            else:
+                matches = root.glob(str(pattern))
+            for path in matches:
+                if path.is_dir():
+                    files.update(child for child in path.rglob("*") if child.is_file())
+                elif path.is_file():
+                    files.add(path)
+        return sorted(files)
+
+    def fingerprint(self, task: Task, args: Sequence[str], options: Mapping[str, Any]) -> tuple[str, dict[str, Any]]:
+        """Return the fingerprint of the task and the hashes of the input files."""
+        known_files = self._load(task).get("files", {})
+        root = self.project.root
+        files: dict[str, list[Any]] = {}
+        for path in self._glob(task.options.get("inputs", [])):
+            stat = path.stat()
+            name = path.relative_to(root).as_posix() if is_path_relative_to(path, root) else path.as_posix()
+            known = known_files.get(name)
+            if known and known[:2] == [stat.st_mtime_ns, stat.st_size]:
+                digest = known[2]
+            else:
+                digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            files[name] = [stat.st_mtime_ns, stat.st_size, digest]
+        lockfile = self.project.lockfile.path
+        env_file = options.get("env_file")
+        env_file_path = env_file if isinstance(env_file, str) or env_file is None else env_file["override"]
+        data = {
+            "task": [task.kind, task.args, dict(task.options)],
+            "args": list(args),
+            "options": dict(options),
+            "lockfile": _hash_file(lockfile),
+            "env_file": _hash_file(root / env_file_path) if env_file_path else None,
+            "inputs": {name: digest for name, (_, _, digest) in files.items()},
+        }
+        serialized = json.dumps(data, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest(), files
+
+    def is_up_to_date(self, task: Task, fingerprint: str) -> bool:
+        """Whether the task ran successfully with the same fingerprint and all outputs exist."""
+        if self._load(task).get("fingerprint") != fingerprint:
+            return False
+        outputs = task.options.get("outputs", [])
+        return all(self._glob(pattern) for pattern in ([outputs] if isinstance(outputs, str) else outputs))
+
+    def save(self, task: Task, fingerprint: str, files: dict[str, Any]) -> None:
+        from pdm.utils import atomic_open_for_write
+
+        with contextlib.suppress(OSError):
+            with atomic_open_for_write(self._record_path(task), encoding="utf-8") as fp:
+                json.dump({"fingerprint": fingerprint, "files": files}, fp)
+
+
+def _hash_file(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
 class TaskRunner:
     """The task runner for pdm project"""
 
     TYPES = ("cmd", "shell", "call", "composite")
-    OPTIONS = ("env", "env_file", "help", "site_packages")
+    OPTIONS = ("env", "env_file", "help", "site_packages", *SCHEDULE_OPTIONS)
 
     def __init__(self, project: Project, hooks: HookManager) -> None:
         self.project = project
@@ -113,6 +270,16 @@ class TaskRunner:
         )
         self.global_options = global_options.copy()
         self.hooks = hooks
+        # The step of a parallel run that the current thread is executing, if any
+        self._step = threading.local()
+        self._launch_record: LaunchRecord | None = None
+
+    @property
+    def launch_record(self) -> LaunchRecord:
+        """The facts of the project environment, cached across runs."""
+        if self._launch_record is None:
+            self._launch_record = self.project.get_launch_record()
+        return self._launch_record
 
     def get_task(self, script_name: str) -> Task | None:
         if script_name not in self.project.scripts:
@@ -145,7 +312,7 @@ class TaskRunner:
             if not os.path.isfile(abspath):
                 raise PdmUsageError(f"Command [success]'{command}'[/] is not a valid executable.")
             return abspath
-        result = self.project.environment.which(command)
+        result = self.launch_record.which(command)
         if not result:
             raise PdmUsageError(f"Command [success]'{command}'[/] is not found in your PATH.")
         return result
@@ -182,9 +349,9 @@ class TaskRunner:
                 process_env = {**process_env, **dotenv_env}
             else:
                 process_env = {**dotenv_env, **process_env}
-        project_env = project.environment
-        this_path = project_env.get_paths()["scripts"]
-        process_env.update(project_env.process_env)
+        launch_record = self.launch_record
+        this_path = launch_record.scripts
+        process_env.update(launch_record.env)
         if env:
             process_env.update(env)
         if shell:
@@ -196,12 +363,12 @@ class TaskRunner:
             command, *args = (expand_env_vars(arg, env=process_env) for arg in args)
             if command.endswith(".py"):
                 args = [command, *args]
-                command = str(project.environment.interpreter.executable)
+                command = launch_record.interpreter
             expanded_command = self.expand_command(command)
             real_command = os.path.realpath(expanded_command)
             process_cmd = [expanded_command, *args]
             if (
-                project_env.is_local
+                launch_record.is_local
                 and not site_packages
                 and (
                     os.path.basename(real_command).startswith("python")
@@ -213,6 +380,9 @@ class TaskRunner:
                 process_env["NO_SITE_PACKAGES"] = "1"
 
         cwd = project.root if chdir else None
+        parallel_run: ParallelRun | None = getattr(self._step, "run", None)
+        if parallel_run is not None:
+            return self._run_step_process(parallel_run, self._step.label, process_cmd, cwd, process_env, shell)
 
         def forward_signal(signum: int, frame: FrameType | None) -> None:
             if sys.platform == "win32" and signum == signal.SIGINT:
@@ -227,7 +397,51 @@ class TaskRunner:
         signal.signal(signal.SIGINT, handle_int)
         return process.returncode
 
+    @staticmethod
+    def _run_step_process(
+        parallel_run: ParallelRun,
+        label: str,
+        process_cmd: str | Sequence[str],
+        cwd: Path | None,
+        process_env: Mapping[str, str],
+        shell: bool,
+    ) -> int:
+        """Run the process of a parallel step, prefixing the output lines with the step label."""
+        process = parallel_run.start_process(
+            process_cmd,
+            cwd=cwd,
+            env=process_env,
+            shell=shell,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        if process is None:
+            return 1
+        try:
+            assert process.stdout is not None
+            for line in iter(process.stdout.readline, b""):
+                parallel_run.write_output(label, line)
+            process.wait()
+        finally:
+            parallel_run.finish_process(process)
+        return process.returncode
+
     def run_task(self, task: Task, args: Sequence[str] = (), opts: TaskOptions | None = None) -> int:
+        if not task.options.get("inputs"):
+            return self._run_task(task, args, opts)
+        # Skip the task if its inputs haven't changed since the last successful run
+        cache = TaskCache(self.project)
+        fingerprint, files = cache.fingerprint(task, args, exec_opts(self.global_options, task.options, opts))
+        if cache.is_up_to_date(task, fingerprint):
+            self.project.core.ui.echo(f"{task} is up to date, skipped", err=True)
+            return 0
+        code = self._run_task(task, args, opts)
+        if code == 0:
+            cache.save(task, fingerprint, files)
+        return code
+
+    def _run_task(self, task: Task, args: Sequence[str] = (), opts: TaskOptions | None = None) -> int:
         kind, _, value, options = task
         shell = False
         if kind == "cmd":
@@ -270,13 +484,16 @@ class TaskRunner:
             args = list(args)
             should_interpolate = any(RE_ARGS_PLACEHOLDER.search(script) for script in value)
             should_interpolate = should_interpolate or any(RE_PDM_PLACEHOLDER.search(script) for script in value)
-            code = 0
+            steps: list[tuple[str, list[str]]] = []
             for script in value:
                 if should_interpolate:
                     script, _ = interpolate(script, args)
                 split = shlex.split(script)
-                cmd = split[0]
-                subargs = split[1:] + ([] if should_interpolate else args)
+                steps.append((split[0], split[1:] + ([] if should_interpolate else args)))
+            if options.get("parallel"):
+                return self._run_parallel(steps, options)
+            code = 0
+            for cmd, subargs in steps:
                 code = self.run(cmd, subargs, options, chdir=True)
                 if code != 0:
                     return code
@@ -288,6 +505,100 @@ class TaskRunner:
             **exec_opts(self.global_options, options, opts),
         )
 
+    def _build_graph(self, steps: list[tuple[str, list[str]]]) -> dict[int, set[int]]:
+        """Return the indexes of the steps each step depends on, adding the
+        dependencies that are not steps of the composite task.
+        """
+        graph: dict[int, set[int]] = {}
+        index = 0
+        while index < len(steps):
+            task = self.get_task(steps[index][0])
+            depends = task.options.get("depends", []) if task is not None else []
+            graph[index] = set()
+            for dep in [depends] if isinstance(depends, str) else depends:
+                found = [i for i, (cmd, _) in enumerate(steps) if cmd == dep]
+                if not found:
+                    if self.get_task(dep) is None:
+                        raise PdmUsageError(f"Task {steps[index][0]} depends on unknown task {dep}")
+                    steps.append((dep, []))
+                    found = [len(steps) - 1]
+                graph[index].update(found)
+            index += 1
+        # Detect cycles by removing the steps without dependencies repeatedly
+        remaining = {i: set(deps) for i, deps in graph.items()}
+        while remaining:
+            ready = [i for i, deps in remaining.items() if not deps]
+            if not ready:
+                names = ", ".join(sorted({steps[i][0] for i in remaining}))
+                raise PdmUsageError(f"Circular dependencies among tasks: {names}")
+            for i in ready:
+                del remaining[i]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return graph
+
+    def _run_parallel(self, steps: list[tuple[str, list[str]]], options: TaskOptions) -> int:
+        """Run the steps of a composite task in parallel, each one starting once
+        the steps it depends on have succeeded. The first failure cancels the others.
+        """
+        graph = self._build_graph(steps)
+        commands = [cmd for cmd, _ in steps]
+        # Label the steps by the task names, or the full commands if not unique
+        labels = [cmd if commands.count(cmd) == 1 else shlex.join([cmd, *subargs]) for cmd, subargs in steps]
+        parallel_run = ParallelRun(max(map(len, labels)))
+        jobs = int(options.get("jobs") or os.cpu_count() or 1)
+
+        def run_step(index: int) -> int:
+            if parallel_run.cancelled.is_set():
+                return 1
+            self._step.run, self._step.label = parallel_run, labels[index]
+            try:
+                cmd, subargs = steps[index]
+                return self.run(cmd, subargs, options, chdir=True)
+            finally:
+                del self._step.run, self._step.label
+
+        def cancel(signum: int, frame: FrameType | None) -> None:
+            parallel_run.cancel()
+
+        in_main_thread = threading.current_thread() is threading.main_thread()
+        if in_main_thread:
+            handle_term = signal.signal(signal.SIGTERM, cancel)
+            handle_int = signal.signal(signal.SIGINT, cancel)
+        code = 0
+        pending = {i: set(deps) for i, deps in graph.items()}
+        running: dict[Future[int], int] = {}
+        try:
+            with ThreadPoolExecutor(jobs, thread_name_prefix="pdm-run") as executor:
+                while pending or running:
+                    if not parallel_run.cancelled.is_set():
+                        for i in [i for i, deps in pending.items() if not deps]:
+                            del pending[i]
+                            running[executor.submit(run_step, i)] = i
+                    if not running:
+                        break
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index = running.pop(future)
+                        try:
+                            result = future.result()
+                        except BaseException:
+                            parallel_run.cancel()
+                            raise
+                        if result != 0 and not code:
+                            code = result
+                            parallel_run.cancel()
+                        for deps in pending.values():
+                            deps.discard(index)
+        finally:
+            if in_main_thread:
+                signal.signal(signal.SIGTERM, handle_term)
+                signal.signal(signal.SIGINT, handle_int)
+        if parallel_run.cancelled.is_set() and not code:
+            # Cancelled by a signal
+            code = 1
+        return code
+
     def run(self, command: str, args: list[str], opts: TaskOptions | None = None, chdir: bool = False) -> int:
         if command in self.hooks.skip:
             return 0
@@ -412,22 +723,3 @@ class Command(BaseCommand):
         exit_code = runner.run(options.script, options.args)
         hooks.try_emit("post_run", script=options.script, args=options.args)
         sys.exit(exit_code)
-
-
-def run_script_if_present(script_name: str) -> Callable:
-    """Helper to create a signal handler to run specific script"""
-
-    def handler(sender: Project, hooks: HookManager, **kwargs: Any) -> None:
-        runner = TaskRunner(sender, hooks)
-        task = runner.get_task(script_name)
-        if task is None:
-            return
-        exit_code = runner.run_task(task)
-        if exit_code != 0:
-            sys.exit(exit_code)
-
-    return handler
-
-
-for hook in pdm_signals:
-    pdm_signals.signal(hook).connect(run_script_if_present(hook), weak=False)
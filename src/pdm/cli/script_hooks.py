@@ -0,0 +1,36 @@
+"""Run the user scripts named after the signals, such as ``pre_install``, when the
+signals are emitted. The handlers are connected when the core is imported, without
+importing the ``run`` command until a script is found.
+"""
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any, Callable
+
+from pdm.signals import pdm_signals
+
+if TYPE_CHECKING:
+    from pdm.cli.hooks import HookManager
+    from pdm.project import Project
+
+
+def run_script_if_present(script_name: str) -> Callable:
+    """Helper to create a signal handler to run specific script"""
+
+    def handler(sender: Project, hooks: HookManager, **kwargs: Any) -> None:
+        if script_name not in sender.scripts:
+            return
+        runner = importlib.import_module("pdm.cli.commands.run").TaskRunner(sender, hooks)
+        task = runner.get_task(script_name)
+        if task is None:
+            return
+        exit_code = runner.run_task(task)
+        if exit_code != 0:
+            sys.exit(exit_code)
+
+    return handler
+
+
+for hook in pdm_signals:
+    pdm_signals.signal(hook).connect(run_script_if_present(hook), weak=False)
@@ -7,7 +7,6 @@ import os
 import re
 import sys
 from collections import ChainMap, OrderedDict
-from concurrent.futures import ThreadPoolExecutor
 from fnmatch import fnmatch
 from gettext import gettext as _
 from json import dumps
@@ -19,6 +18,7 @@ from typing import (
     Iterable,
     Mapping,
     MutableMapping,
+    Sequence,
     cast,
     no_type_check,
 )
@@ -38,6 +38,7 @@ from pdm.models.requirements import (
     strip_extras,
 )
 from pdm.models.specifiers import PySpecSet, get_specifier
+from pdm.profiler import profiler
 from pdm.project.lockfile import FLAG_CROSS_PLATFORM, FLAG_INHERIT_METADATA, FLAG_STATIC_URLS
 from pdm.utils import (
     comparable_version,
@@ -178,6 +179,42 @@ class ErrorArgumentParser(ArgumentParser):
             raise PdmArgumentError(e) from e
 
 
+class LazySubParsersAction(argparse._SubParsersAction):
+    """A subparsers action whose subcommands can be registered with a name and
+    a help text only, and loaded when they are dispatched.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.loaders: dict[str, Callable[[], Any]] = {}
+
+    def add_parser(self, name: str, **kwargs: Any) -> argparse.ArgumentParser:
+        # A parser added later replaces the lazy one
+        for key in [name, *kwargs.get("aliases", ())]:
+            self.loaders.pop(key, None)
+        return super().add_parser(name, **kwargs)
+
+    def add_lazy_parser(self, name: str, help: str, loader: Callable[[], Any], aliases: Sequence[str] = ()) -> None:
+        """Add a placeholder parser for the subcommand, ``loader`` is called to
+        register the real one when the subcommand or any of its aliases is dispatched.
+        """
+        self.add_parser(name, description=help, help=help, aliases=list(aliases))
+        for key in [name, *aliases]:
+            self.loaders[key] = loader
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: str | None = None,
+    ) -> None:
+        loader = self.loaders.pop(values[0], None)
+        if loader is not None:
+            loader()
+        super().__call__(parser, namespace, values, option_string)
+
+
 @dc.dataclass(frozen=True)
 class Package:
     """An internal class for the convenience of dependency graph building."""
@@ -726,14 +763,15 @@ def merge_dictionary(target: MutableMapping[Any, Any], input: Mapping[Any, Any],
             target[key] = value
 
 
-def fetch_hashes(repository: BaseRepository, mapping: Mapping[str, Candidate]) -> None:
+def fetch_hashes(
+    repository: BaseRepository,
+    mapping: Mapping[str, Candidate],
+    known_hashes: Mapping[str, str] | None = None,
+    callback: Callable[[Candidate, float], None] | None = None,
+) -> None:
     """Fetch hashes for candidates in parallel"""
-
-    def do_fetch(candidate: Candidate) -> None:
-        candidate.hashes = repository.get_hashes(candidate)
-
-    with ThreadPoolExecutor() as executor:
-        executor.map(do_fetch, mapping.values())
+    with profiler.phase("fetch_hashes"):
+        repository.fetch_hashes(mapping.values(), known_hashes, callback)
 
 
 def is_pipx_installation() -> bool:
@@ -8,10 +8,10 @@ r"""
 from __future__ import annotations
 
 import argparse
+import functools
 import importlib
 import itertools
 import os
-import pkgutil
 import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
@@ -20,8 +20,10 @@ from resolvelib import Resolver
 
 from pdm import termui
 from pdm.__version__ import __version__
+from pdm.cli import script_hooks  # noqa: F401 - connects the user script hooks for all commands
+from pdm.cli.commands import BUILTIN_COMMANDS
 from pdm.cli.options import ignore_python_option, pep582_option, verbose_option
-from pdm.cli.utils import ArgumentParser, ErrorArgumentParser
+from pdm.cli.utils import ArgumentParser, ErrorArgumentParser, LazySubParsersAction
 from pdm.compat import importlib_metadata
 from pdm.exceptions import PdmArgumentError, PdmUsageError
 from pdm.installers import InstallManager, Synchronizer
@@ -36,8 +38,6 @@ if TYPE_CHECKING:
     from pdm.cli.commands.base import BaseCommand
     from pdm.project.config import ConfigItem
 
-COMMANDS_MODULE_PATH = importlib.import_module("pdm.cli.commands").__path__
-
 
 class Core:
     """A high level object that manages all classes and configurations"""
@@ -54,8 +54,8 @@ class Core:
     def __init__(self) -> None:
         self.version = __version__
         self.ui = termui.UI()
+        self.plugins_loaded = False
         self.init_parser()
-        self.load_plugins()
 
     def init_parser(self) -> None:
         self.parser = ErrorArgumentParser(
@@ -82,14 +82,21 @@ class Core:
         ignore_python_option.add_to_parser(self.parser)
         pep582_option.add_to_parser(self.parser)
 
-        self.subparsers = self.parser.add_subparsers(parser_class=ArgumentParser, title="commands", metavar="")
-        for _, name, _ in pkgutil.iter_modules(COMMANDS_MODULE_PATH):
-            module = importlib.import_module(f"pdm.cli.commands.{name}", __name__)
-            try:
-                klass = module.Command
-            except AttributeError:
-                continue
-            self.register_command(klass, klass.name or name)
+        subparsers = cast(
+            LazySubParsersAction,
+            self.parser.add_subparsers(
+                parser_class=ArgumentParser, title="commands", metavar="", action=LazySubParsersAction
+            ),
+        )
+        self.subparsers = subparsers
+        for name, module, help_text, aliases in BUILTIN_COMMANDS:
+            subparsers.add_lazy_parser(
+                name, help_text, functools.partial(self._load_command, name, module), aliases=aliases
+            )
+
+    def _load_command(self, name: str, module: str) -> None:
+        command = importlib.import_module(f"pdm.cli.commands.{module}").Command
+        self.register_command(command, name)
 
     def __call__(self, *args: Any, **kwargs: Any) -> None:
         return self.main(*args, **kwargs)
@@ -178,6 +185,8 @@ class Core:
 
         if args is None:
             args = []
+        if not self.plugins_loaded and not _is_version_request(args):
+            self.load_plugins()
         args = self._get_cli_args(args, obj)
         # Keep it for after project parsing to check if its a defined script
         root_script = None
@@ -218,6 +227,10 @@ class Core:
                 from pdm.cli.actions import check_update
 
                 check_update(project)
+            if project.config["cache.gc_interval"] > 0:
+                from pdm.cli.actions import collect_caches
+
+                collect_caches(project)
 
     def register_command(self, command: type[BaseCommand], name: str | None = None) -> None:
         """Register a subcommand to the subparsers,
@@ -269,6 +282,7 @@ class Core:
                 ...
             ```
         """
+        self.plugins_loaded = True
         self._add_project_plugins_library()
         entry_points: Iterable[importlib_metadata.EntryPoint] = itertools.chain(
             importlib_metadata.entry_points(group="pdm"),
@@ -283,6 +297,16 @@ class Core:
                 )
 
 
+def _is_version_request(args: list[str]) -> bool:
+    """Whether the arguments ask for the version only, which doesn't need the plugins."""
+    for arg in args:
+        if arg in ("-V", "--version"):
+            return True
+        if not arg.startswith("-"):
+            break
+    return False
+
+
 def main(args: list[str] | None = None) -> None:
     """The CLI entry function"""
     return Core().main(args or sys.argv[1:])
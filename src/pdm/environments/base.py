@@ -16,7 +16,7 @@ from typing import TYPE_CHECKING, Generator, no_type_check
 from pdm.exceptions import BuildError, PdmUsageError
 from pdm.models.in_process import get_pep508_environment, get_python_abis, get_uname, sysconfig_get_platform
 from pdm.models.python import PythonInfo
-from pdm.models.working_set import WorkingSet
+from pdm.models.working_set import WorkingSet, WorkingSetSnapshot
 from pdm.utils import deprecation_warning, get_trusted_hosts, is_pip_compatible_with_python
 
 if TYPE_CHECKING:
@@ -92,19 +92,29 @@ class BaseEnvironment(abc.ABC):
         new_path = os.pathsep.join([this_path, os.getenv("PATH", ""), python_root])
         return {"PATH": new_path, "PDM_PROJECT_ROOT": str(project.root)}
 
+    @cached_property
+    def facts_cache_dir(self) -> str:
+        """The directory to persist the facts of interpreters"""
+        return str(self.project.cache("interpreters"))
+
+    @cached_property
+    def working_set_snapshot(self) -> WorkingSetSnapshot:
+        """The persistent snapshot of installed distributions, shared by all environments"""
+        return WorkingSetSnapshot(self.project.cache("metadata") / "working_set.db")
+
     @cached_property
     def target_python(self) -> unearth.TargetPython:
         from unearth import TargetPython
 
         python_version = self.interpreter.version_tuple
-        python_abis = get_python_abis(str(self.interpreter.executable))
+        python_abis = get_python_abis(str(self.interpreter.executable), self.facts_cache_dir)
         tp = TargetPython(python_version, python_abis)
         # calculate the target platform tags
         with self._patch_target_python():
             tp.supported_tags()
         return tp
 
-    def _build_session(self, trusted_hosts: list[str]) -> PDMSession:
+    def _build_session(self, trusted_hosts: list[str], max_connections: int | None = None) -> PDMSession:
         from pdm.models.session import PDMSession
 
         ca_certs = self.project.config.get("pypi.ca_certs")
@@ -112,6 +122,7 @@ class BaseEnvironment(abc.ABC):
             cache_dir=self.project.cache("http"),
             trusted_hosts=trusted_hosts,
             ca_certificates=Path(ca_certs) if ca_certs is not None else None,
+            max_connections=max_connections,
         )
         certfn = self.project.config.get("pypi.client_cert")
         if certfn:
@@ -135,11 +146,11 @@ class BaseEnvironment(abc.ABC):
         if old_os_uname is not None:
 
             def uname() -> os.uname_result:
-                return get_uname(str(self.interpreter.path))
+                return get_uname(str(self.interpreter.executable), self.facts_cache_dir)
 
             os.uname = uname
         packaging.tags._32_BIT_INTERPRETER = self.interpreter.is_32bit
-        sysconfig.get_platform = partial(sysconfig_get_platform, str(self.interpreter.path))
+        sysconfig.get_platform = partial(sysconfig_get_platform, str(self.interpreter.executable), self.facts_cache_dir)
         try:
             yield
         finally:
@@ -154,12 +165,17 @@ class BaseEnvironment(abc.ABC):
         sources: list[RepositoryConfig] | None = None,
         ignore_compatibility: bool = False,
         minimal_version: bool = False,
+        session: PDMSession | None = None,
+        page_links: dict[tuple[str, bool], list[unearth.Link]] | None = None,
     ) -> Generator[unearth.PackageFinder, None, None]:
         """Return the package finder of given index sources.
 
         :param sources: a list of sources the finder should search in.
         :param ignore_compatibility: whether to ignore the python version
             and wheel tags.
+        :param session: the session to use, it won't be closed by the finder.
+            A new session is created if not given.
+        :param page_links: a mapping to share the links parsed from index pages.
         """
         from pdm.models.finder import PDMPackageFinder
 
@@ -172,9 +188,9 @@ class BaseEnvironment(abc.ABC):
                 f"{self.project.config['pypi.ignore_stored_index']}"
             )
 
-        trusted_hosts = get_trusted_hosts(sources)
-
-        session = self._build_session(trusted_hosts)
+        own_session = session is None
+        if session is None:
+            session = self._build_session(get_trusted_hosts(sources))
         finder = PDMPackageFinder(
             session=session,
             target_python=self.target_python,
@@ -187,6 +203,7 @@ class BaseEnvironment(abc.ABC):
             ),
             verbosity=self.project.core.ui.verbosity,
             minimal_version=minimal_version,
+            page_links=page_links,
         )
         finder.sources.clear()
         for source in sources:
@@ -198,17 +215,18 @@ class BaseEnvironment(abc.ABC):
         try:
             yield finder
         finally:
-            session.close()
+            if own_session:
+                session.close()
 
     def get_working_set(self) -> WorkingSet:
         """Get the working set based on local packages directory."""
         paths = self.get_paths()
-        return WorkingSet([paths["platlib"], paths["purelib"]])
+        return WorkingSet([paths["platlib"], paths["purelib"]], snapshot=self.working_set_snapshot)
 
     @cached_property
     def marker_environment(self) -> dict[str, str]:
         """Get environment for marker evaluation"""
-        return get_pep508_environment(str(self.interpreter.executable))
+        return get_pep508_environment(str(self.interpreter.executable), self.facts_cache_dir)
 
     def which(self, command: str) -> str | None:
         """Get the full path of the given executable against this environment."""
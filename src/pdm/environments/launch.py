@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from pdm.environments.base import BaseEnvironment
+    from pdm.project import Project
+
+# Bump this when the fields of the launch record change
+_RECORD_VERSION = 1
+
+
+class LaunchRecord(NamedTuple):
+    """The facts of the project environment needed to launch a process.
+
+    Resolving the interpreter and the environment takes several subprocess calls,
+    so the record is persisted under the project cache and reused as long as the
+    saved interpreter, the interpreter itself and the relevant settings are unchanged.
+    """
+
+    interpreter: str
+    version: str
+    scripts: str
+    is_local: bool
+    env: dict[str, str]
+
+    @classmethod
+    def from_environment(cls, environment: BaseEnvironment) -> LaunchRecord:
+        return cls(
+            str(environment.interpreter.executable),
+            str(environment.interpreter.version),
+            environment.get_paths()["scripts"],
+            environment.is_local,
+            environment.process_env,
+        )
+
+    @classmethod
+    def load(cls, project: Project) -> LaunchRecord | None:
+        """Load the record of the project if it is still valid."""
+        key = _get_cache_key(project)
+        if key is None:
+            return None
+        with contextlib.suppress(OSError, ValueError, TypeError):
+            data = json.loads(_get_record_path(project).read_text("utf-8"))
+            if data.pop("key") == key:
+                return cls(**data)
+        return None
+
+    def save(self, project: Project) -> None:
+        key = _get_cache_key(project)
+        if key is None:
+            return
+        from pdm.utils import atomic_open_for_write
+
+        with contextlib.suppress(OSError):
+            with atomic_open_for_write(_get_record_path(project), encoding="utf-8") as fp:
+                json.dump({"key": key, **self._asdict()}, fp)
+
+    def which(self, command: str) -> str | None:
+        """Get the full path of the given executable, like :meth:`BaseEnvironment.which`."""
+        if not os.path.isabs(command) and command.startswith("python"):
+            match = re.match(r"python(\d(?:\.\d{1,2})?)", command)
+            if not match or self.version.startswith(match.group(1)):
+                return self.interpreter
+        return shutil.which(command, path=self.env["PATH"])
+
+
+def _get_record_path(project: Project) -> Path:
+    digest = hashlib.sha256(str(project.root).encode("utf-8")).hexdigest()
+    return project.cache("launch") / f"{digest}.json"
+
+
+def _get_cache_key(project: Project) -> str | None:
+    """The key to validate the record against, or None if the interpreter isn't saved."""
+    saved_python = project._saved_python
+    if not saved_python or os.getenv("PDM_IGNORE_SAVED_PYTHON"):
+        return None
+    try:
+        stat = os.stat(saved_python)
+    except OSError:
+        return None
+    key = [
+        _RECORD_VERSION,
+        str(project.root),
+        saved_python,
+        stat.st_mtime_ns,
+        project.is_global,
+        bool(project.config["python.use_venv"]),
+        bool(project.global_config["global_project.user_site"]),
+        str(project.python_requires),
+        # The process env is derived from these variables
+        os.getenv("PATH", ""),
+        os.getenv("PYTHONPATH", ""),
+    ]
+    return hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
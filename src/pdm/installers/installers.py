@@ -4,26 +4,28 @@ import io
 import itertools
 import json
 import os
+import posixpath
 import shutil
 import warnings
 import zipfile
 from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterator
+from typing import TYPE_CHECKING, Any, Iterator, cast
 
 from installer._core import _determine_scheme, _process_WHEEL_file, install
 from installer.destinations import SchemeDictionaryDestination
 from installer.exceptions import InvalidWheelSource
-from installer.records import RecordEntry
+from installer.records import RecordEntry, parse_record_file
 from installer.sources import WheelFile as _WheelFile
 from installer.sources import _WheelFileValidationError
+from installer.utils import parse_entrypoints
 
 from pdm.exceptions import PDMWarning
 from pdm.installers.packages import CachedPackage
 from pdm.termui import logger
 
 if TYPE_CHECKING:
-    from typing import Any, BinaryIO, Callable, Iterable, Protocol
+    from typing import BinaryIO, Callable, Iterable, Protocol
 
     from installer.destinations import Scheme
     from installer.sources import WheelContentElement
@@ -80,16 +82,17 @@ def _is_namespace_package(root: str) -> bool:
     return not _namespace_package_lines.isdisjoint(init_py_lines)
 
 
-def _create_links_recursively(
-    source: str, destination: str, link_method: LinkMethod, link_individual: bool
-) -> Iterable[str]:
-    """Create symlinks recursively from source to destination.
+def _get_link_plan(source: str, link_individual: bool) -> list[tuple[str, str]]:
+    """Walk the source tree and return the (relpath, kind) of the entries to install,
+    where kind is "mkdir" for a directory to create, "dir" for a directory to link,
+    or "file" for a file to link.
     package(if not individual)  <-- link
         __init__.py
     namespace_package  <-- mkdir
         foo.py  <-- link
         bar.py  <-- link
     """
+    plan: list[tuple[str, str]] = []
     is_top = True
     for root, dirs, files in os.walk(source):
         bn = os.path.basename(root)
@@ -97,36 +100,50 @@ def _create_links_recursively(
             dirs[:] = []
             continue
         relpath = os.path.relpath(root, source)
-        destination_root = os.path.join(destination, relpath)
         if is_top:
             is_top = False
         elif not _is_namespace_package(root) and not link_individual:
             # A package, create link for the parent dir and don't proceed
             # for child directories
-            if os.path.exists(destination_root):
-                if not os.path.islink(destination_root):
-                    warnings.warn(f"Overwriting existing package: {destination_root}", PDMWarning, stacklevel=2)
-                if os.path.isdir(destination_root) and not os.path.islink(destination_root):
-                    shutil.rmtree(destination_root)
-                else:
-                    os.remove(destination_root)
-            link_method(root, destination_root, True)
-            yield relpath
+            plan.append((relpath, "dir"))
             dirs[:] = []
             continue
         # Otherwise, the directory is likely a namespace package,
         # mkdir and create links for all files inside.
-        if not os.path.exists(destination_root):
-            os.makedirs(destination_root)
-        for f in files:
-            if f.endswith(".pyc"):
-                continue
-            source_path = os.path.join(root, f)
-            destination_path = os.path.join(destination_root, f)
+        plan.append((relpath, "mkdir"))
+        plan.extend((os.path.join(relpath, f), "file") for f in files if not f.endswith(".pyc"))
+    return plan
+
+
+def _create_links(
+    source: str, destination: str, link_method: LinkMethod, plan: Iterable[tuple[str, str]]
+) -> Iterator[str]:
+    """Create the links of the plan from source to destination, yield the linked paths."""
+    for relpath, kind in plan:
+        destination_path = os.path.join(destination, relpath)
+        if kind == "mkdir":
+            if not os.path.exists(destination_path):
+                os.makedirs(destination_path)
+            continue
+        if kind == "dir":
             if os.path.exists(destination_path):
-                os.remove(destination_path)
-            link_method(source_path, destination_path, False)
-            yield os.path.join(relpath, f)
+                if not os.path.islink(destination_path):
+                    warnings.warn(f"Overwriting existing package: {destination_path}", PDMWarning, stacklevel=2)
+                if os.path.isdir(destination_path) and not os.path.islink(destination_path):
+                    shutil.rmtree(destination_path)
+                else:
+                    os.remove(destination_path)
+        elif os.path.exists(destination_path):
+            os.remove(destination_path)
+        link_method(os.path.join(source, relpath), destination_path, kind == "dir")
+        yield relpath
+
+
+def _create_links_recursively(
+    source: str, destination: str, link_method: LinkMethod, link_individual: bool
+) -> Iterable[str]:
+    """Create symlinks recursively from source to destination."""
+    yield from _create_links(source, destination, link_method, _get_link_plan(source, link_individual))
 
 
 class WheelFile(_WheelFile):
@@ -192,7 +209,9 @@ class InstallDestination(SchemeDictionaryDestination):
         return super().finalize_installation(scheme, record_file_path, records)
 
 
-def install_wheel(wheel: str, environment: BaseEnvironment, direct_url: dict[str, Any] | None = None) -> str:
+def install_wheel(
+    wheel: str, environment: BaseEnvironment, direct_url: dict[str, Any] | None = None, validate_record: bool = True
+) -> str:
     """Install a normal wheel file into the environment."""
     additional_metadata = None
     if direct_url is not None:
@@ -202,7 +221,9 @@ def install_wheel(wheel: str, environment: BaseEnvironment, direct_url: dict[str
         interpreter=str(environment.interpreter.executable),
         script_kind=_get_kind(environment),
     )
-    return _install_wheel(wheel=wheel, destination=destination, additional_metadata=additional_metadata)
+    return _install_wheel(
+        wheel=wheel, destination=destination, additional_metadata=additional_metadata, validate_record=validate_record
+    )
 
 
 def _get_link_method_and_individual(cache_method: str) -> tuple[LinkMethod | None, bool]:
@@ -219,7 +240,9 @@ def _get_link_method_and_individual(cache_method: str) -> tuple[LinkMethod | Non
     return None, False
 
 
-def install_wheel_with_cache(wheel: str, environment: BaseEnvironment, direct_url: dict[str, Any] | None = None) -> str:
+def install_wheel_with_cache(
+    wheel: str, environment: BaseEnvironment, direct_url: dict[str, Any] | None = None, validate_record: bool = True
+) -> str:
     """Only create .pth files referring to the cached package.
     If the cache doesn't exist, create one.
     """
@@ -239,13 +262,29 @@ def install_wheel_with_cache(wheel: str, environment: BaseEnvironment, direct_ur
             interpreter=interpreter,
             script_kind=script_kind,
         )
-        _install_wheel(wheel=wheel, destination=destination)
+        _install_wheel(wheel=wheel, destination=destination, validate_record=validate_record)
+        manifest = _write_link_manifest(wheel, package_cache)
+    else:
+        manifest = package_cache.manifest or _write_link_manifest(wheel, package_cache)
 
     additional_metadata = {"REFER_TO": package_cache.path.as_posix().encode()}
 
     if direct_url is not None:
         additional_metadata["direct_url.json"] = json.dumps(direct_url, indent=2).encode()
 
+    lib_path = package_cache.scheme()["purelib"]
+    if manifest is not None:
+        destination = InstallDestination(
+            scheme_dict=environment.get_paths(_get_dist_name(wheel)),
+            interpreter=interpreter,
+            script_kind=script_kind,
+        )
+        dist_info_dir = _install_from_manifest(
+            manifest, lib_path, destination, link_method, link_individual, wheel_stem, additional_metadata
+        )
+        package_cache.add_referrer(dist_info_dir)
+        return dist_info_dir
+
     def skip_files(source: WheelFile, element: WheelContentElement) -> bool:
         root_scheme = _process_WHEEL_file(source)
         scheme, path = _determine_scheme(element[0][0], source, root_scheme)
@@ -260,12 +299,8 @@ def install_wheel_with_cache(wheel: str, environment: BaseEnvironment, direct_ur
         )
 
     additional_contents: list[WheelContentElement] = []
-    lib_path = package_cache.scheme()["purelib"]
     if link_method is None:
-        # HACK: Prefix with aaa_ to make it processed as early as possible
-        filename = "aaa_" + wheel_stem.split("-")[0] + ".pth"
-        # use site.addsitedir() rather than a plain path to properly process .pth files
-        stream = io.BytesIO(f"import site;site.addsitedir({lib_path!r})\n".encode())
+        filename, stream = _get_site_pth(wheel_stem, lib_path)
         additional_contents.append(((filename, "", str(len(stream.getvalue()))), stream, False))
 
     destination = InstallDestination(
@@ -283,17 +318,131 @@ def install_wheel_with_cache(wheel: str, environment: BaseEnvironment, direct_ur
         excludes=skip_files,
         additional_contents=additional_contents,
         additional_metadata=additional_metadata,
+        validate_record=validate_record,
     )
     package_cache.add_referrer(dist_info_dir)
     return dist_info_dir
 
 
+def _get_site_pth(wheel_stem: str, lib_path: str) -> tuple[str, io.BytesIO]:
+    """Get the .pth file that adds the cached package to the site directories."""
+    # HACK: Prefix with aaa_ to make it processed as early as possible
+    filename = "aaa_" + wheel_stem.split("-")[0] + ".pth"
+    # use site.addsitedir() rather than a plain path to properly process .pth files
+    return filename, io.BytesIO(f"import site;site.addsitedir({lib_path!r})\n".encode())
+
+
+def _write_link_manifest(wheel: str, package_cache: CachedPackage) -> dict[str, Any] | None:
+    """Build the link manifest of a cached package from its RECORD, and save it.
+
+    Return None if the package can't be installed from the manifest, because
+    the wheel contains files outside of the library directories.
+    """
+    with WheelFile.open(Path(wheel)) as source:
+        root_scheme = _process_WHEEL_file(source)
+        dist_info_dir = source.dist_info_dir
+        data_dir = source.data_dir
+        namelist = source._zipfile.namelist()
+    for name in namelist:
+        parts = name.split("/")
+        if parts[0] == data_dir and len(parts) > 2 and parts[1] not in ("purelib", "platlib"):
+            return None
+
+    lib_path = package_cache.scheme()[root_scheme]
+    dist_info_path = os.path.join(lib_path, dist_info_dir)
+    with open(os.path.join(dist_info_path, "RECORD"), encoding="utf-8", newline="") as f:
+        records = [RecordEntry.from_elements(*row) for row in parse_record_file(f)]
+    entry_points: list[tuple[str, str, str, str]] = []
+    if os.path.isfile(entry_points_file := os.path.join(dist_info_path, "entry_points.txt")):
+        with open(entry_points_file, "rb") as f:
+            entry_points = list(parse_entrypoints(f.read().decode("utf-8")))
+    manifest: dict[str, Any] = {
+        "root_scheme": root_scheme,
+        "dist_info": dist_info_dir,
+        # The rows of the dist-info files to add to the RECORD as is
+        "dist_info_files": [
+            list(record.to_row())
+            for record in records
+            if record.path.startswith(f"{dist_info_dir}/") and record.path != f"{dist_info_dir}/RECORD"
+        ],
+        # The .pth files to copy when the package isn't linked
+        "pth_files": [
+            record.path
+            for record in records
+            if record.path.endswith(".pth") and not record.path.endswith("-nspkg.pth") and "../" not in record.path
+        ],
+        "entry_points": entry_points,
+        "links": {
+            "package": _get_link_plan(lib_path, False),
+            "individual": _get_link_plan(lib_path, True),
+        },
+    }
+    try:
+        package_cache.write_manifest(manifest)
+    except OSError as e:  # pragma: no cover
+        logger.debug("Failed to write the link manifest of %s: %s", package_cache.path, e)
+    return manifest
+
+
+def _install_from_manifest(
+    manifest: dict[str, Any],
+    lib_path: str,
+    destination: InstallDestination,
+    link_method: LinkMethod | None,
+    link_individual: bool,
+    wheel_stem: str,
+    additional_metadata: dict[str, bytes],
+) -> str:
+    """Install a cached package with the link manifest, without reading the wheel.
+
+    Return the .dist-info path
+    """
+    root_scheme = cast("Scheme", manifest["root_scheme"])
+    dist_info_dir: str = manifest["dist_info"]
+    root = destination.scheme_dict[root_scheme]
+    records: list[tuple[Scheme, RecordEntry]] = []
+
+    for name, module, attr, section in manifest["entry_points"]:
+        records.append((cast("Scheme", "scripts"), destination.write_script(name, module, attr, section)))
+
+    os.makedirs(os.path.join(root, dist_info_dir), exist_ok=True)
+    for path, hash_, size in manifest["dist_info_files"]:
+        target_path = os.path.join(root, path)
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        if os.path.lexists(target_path):
+            os.unlink(target_path)
+        shutil.copyfile(os.path.join(lib_path, path), target_path)
+        records.append((root_scheme, RecordEntry.from_elements(path, hash_, size)))
+
+    if link_method is None:
+        filename, stream = _get_site_pth(wheel_stem, lib_path)
+        records.append((root_scheme, destination.write_file(root_scheme, filename, stream, False)))
+        for path in manifest["pth_files"]:
+            with open(os.path.join(lib_path, path), "rb") as f:
+                records.append((root_scheme, destination.write_file(root_scheme, path, f, False)))
+    else:
+        plan = manifest["links"]["individual" if link_individual else "package"]
+        for relpath in _create_links(lib_path, root, link_method, plan):
+            records.append((root_scheme, RecordEntry(relpath.replace("\\", "/"), None, None)))
+
+    for filename, contents in additional_metadata.items():
+        with io.BytesIO(contents) as stream:
+            path = posixpath.join(dist_info_dir, filename)
+            records.append((root_scheme, destination.write_file(root_scheme, path, stream, False)))
+
+    record_file_path = posixpath.join(dist_info_dir, "RECORD")
+    records.append((root_scheme, RecordEntry(record_file_path, None, None)))
+    destination.finalize_installation(root_scheme, record_file_path, records)
+    return os.path.join(root, dist_info_dir)
+
+
 def _install_wheel(
     wheel: str,
     destination: InstallDestination,
     excludes: Callable[[WheelFile, WheelContentElement], bool] | None = None,
     additional_contents: Iterable[WheelContentElement] | None = None,
     additional_metadata: dict[str, bytes] | None = None,
+    validate_record: bool = True,
 ) -> str:
     """A lower level installation method that is copied from installer
     but is controlled by extra parameters.
@@ -302,7 +451,8 @@ def _install_wheel(
     """
     with WheelFile.open(wheel) as source:
         try:
-            source.validate_record()
+            if validate_record:
+                source.validate_record()
         except _WheelFileValidationError as e:
             formatted_issues = "\n".join(e.issues)
             warning = (
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import os
+from typing import TYPE_CHECKING, Iterable
 
 from pdm import termui
 from pdm.compat import Distribution
 from pdm.exceptions import UninstallError
 from pdm.installers.installers import install_wheel, install_wheel_with_cache
-from pdm.installers.uninstallers import BaseRemovePaths, StashedRemovePaths
+from pdm.installers.uninstallers import BaseRemovePaths, BulkRemovePaths, StashedRemovePaths
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from pdm.environments import BaseEnvironment
     from pdm.models.candidates import Candidate
 
@@ -23,6 +26,14 @@ class InstallManager:
         self.environment = environment
         self.use_install_cache = use_install_cache
 
+    def download(self, candidate: Candidate) -> None:
+        """Download the candidate to be installed, without building it"""
+        candidate.prepare(self.environment).obtain(allow_all=False)
+
+    def build(self, candidate: Candidate) -> None:
+        """Build the candidate into a wheel, downloading it if needed"""
+        candidate.prepare(self.environment).build()
+
     def install(self, candidate: Candidate) -> Distribution:
         """Install a candidate into the environment, return the distribution"""
         if self.use_install_cache and candidate.req.is_named and candidate.name not in self.NO_CACHE_PACKAGES:
@@ -31,8 +42,25 @@ class InstallManager:
         else:
             installer = install_wheel
         prepared = candidate.prepare(self.environment)
-        dist_info = installer(str(prepared.build()), self.environment, prepared.direct_url())
-        return Distribution.at(dist_info)
+        wheel = prepared.build()
+        # The wheels from the caches are validated when they are saved
+        validate_record = not (
+            self.environment.project.config["install.trust_cached_wheels"] and self._is_cached_wheel(wheel)
+        )
+        dist_info = installer(str(wheel), self.environment, prepared.direct_url(), validate_record=validate_record)
+        dist = Distribution.at(dist_info)
+        self.environment.working_set_snapshot.record(dist_info, dist.metadata["Name"], dist.version)
+        return dist
+
+    def _is_cached_wheel(self, wheel: Path) -> bool:
+        project = self.environment.project
+        for cache_dir in (project.cache_dir / "artifacts", project.cache_dir / "wheels"):
+            try:
+                if os.path.commonpath([wheel.resolve(), cache_dir.resolve()]) == str(cache_dir.resolve()):
+                    return True
+            except ValueError:  # On different drives
+                continue
+        return False
 
     def get_paths_to_remove(self, dist: Distribution) -> BaseRemovePaths:
         """Get the path collection to be removed from the disk"""
@@ -50,6 +78,40 @@ class InstallManager:
             termui.logger.info("Error occurred during uninstallation, roll back the changes now.")
             remove_path.rollback()
             raise UninstallError(e) from e
+        self._discard_from_snapshot(dist)
+
+    def uninstall_many(self, dists: Iterable[Distribution]) -> None:
+        """Perform the uninstallation for multiple distributions in one transaction,
+        either all of them are removed or none of them.
+
+        If a subclass overrides :meth:`uninstall`, it is called for each distribution
+        instead, without the transaction.
+        """
+        dists = list(dists)
+        if type(self).uninstall is not InstallManager.uninstall:
+            for dist in dists:
+                self.uninstall(dist)
+            return
+        if not dists:
+            return
+        remove_paths = BulkRemovePaths(self.environment)
+        for dist in dists:
+            termui.logger.info("Removing distribution %s", dist.metadata["Name"])
+            remove_paths.add(self.get_paths_to_remove(dist))
+        try:
+            remove_paths.remove()
+            remove_paths.commit()
+        except OSError as e:
+            termui.logger.info("Error occurred during uninstallation, roll back the changes now.")
+            remove_paths.rollback()
+            raise UninstallError(e) from e
+        for dist in dists:
+            self._discard_from_snapshot(dist)
+
+    def _discard_from_snapshot(self, dist: Distribution) -> None:
+        dist_path = getattr(dist, "_path", None)
+        if dist_path is not None:
+            self.environment.working_set_snapshot.discard(dist_path)
 
     def overwrite(self, dist: Distribution, candidate: Candidate) -> None:
         """An in-place update to overwrite the distribution with a new candidate"""
@@ -65,3 +127,5 @@ class InstallManager:
         except OSError as e:
             termui.logger.info("Error occurred during overwriting, roll back the changes now.")
             raise UninstallError(e) from e
+        if getattr(dist, "_path", None) != getattr(installed, "_path", None):
+            self._discard_from_snapshot(dist)
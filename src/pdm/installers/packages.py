@@ -1,11 +1,76 @@
 from __future__ import annotations
 
+import contextlib
+import json
 import os
 import shutil
+import sqlite3
+import tempfile
 from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from filelock import FileLock
 
 from pdm.termui import logger
-from pdm.utils import pdm_scheme
+from pdm.utils import atomic_open_for_write, pdm_scheme
+
+# Bump this when the format of the link manifest changes
+MANIFEST_VERSION = 1
+
+
+class ReferrerIndex:
+    """A central index of the referrers of the cached packages, stored in the root
+    of the package cache, so the references can be counted without reading the
+    referrer log of every package.
+
+    The referrer logs are the source of truth, the index is updated along with them.
+    """
+
+    INDEX_FILE = ".referrers.db"
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.root.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.root / self.INDEX_FILE, timeout=30)
+        try:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS referrers (package TEXT NOT NULL, path TEXT NOT NULL, "
+                    "PRIMARY KEY (package, path))"
+                )
+                conn.execute("CREATE TABLE IF NOT EXISTS packages (package TEXT PRIMARY KEY)")
+                yield conn
+        finally:
+            conn.close()
+
+    def update(self, package: str, referrers: Iterable[str]) -> None:
+        """Replace the referrers of the package"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM referrers WHERE package = ?", (package,))
+            conn.executemany("INSERT INTO referrers VALUES (?, ?)", [(package, path) for path in referrers])
+            conn.execute("INSERT OR REPLACE INTO packages VALUES (?)", (package,))
+
+    def discard(self, package: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM referrers WHERE package = ?", (package,))
+            conn.execute("DELETE FROM packages WHERE package = ?", (package,))
+
+    def load(self) -> dict[str, set[str]]:
+        """Get the referrers of all indexed packages"""
+        with self._connect() as conn:
+            result: dict[str, set[str]] = {
+                package: set() for (package,) in conn.execute("SELECT package FROM packages")
+            }
+            for package, path in conn.execute("SELECT package, path FROM referrers"):
+                result.setdefault(package, set()).add(path)
+        return result
+
+    def counts(self) -> dict[str, int]:
+        """Get the reference counts of all indexed packages"""
+        return {package: len(referrers) for package, referrers in self.load().items()}
 
 
 class CachedPackage:
@@ -15,44 +80,110 @@ class CachedPackage:
         $PACKAGE_ROOT/<dist_name>-<version>-<impl>-<abi>-<plat>/
 
     Under the directory there should be a text file named `referrers`.
-    Each line of the file is a distribution path that refers to this package.
+    It is an append-only log, each line is a distribution path that refers to this
+    package prefixed with `+`, or an unreferenced path prefixed with `-`. The log is
+    compacted once it grows too long. Changes to the log are serialized with a lock
+    shared by the whole package cache, and mirrored to the :class:`ReferrerIndex`.
+    A `manifest.json` file records what to link and write to install the package
+    into an environment, so that it doesn't need to be read from the wheel again.
     *Only wheel installations will be cached*
     """
 
-    def __init__(self, path: str | Path) -> None:
+    MANIFEST_FILE = "manifest.json"
+    REFERRERS_FILE = "referrers"
+    LOCK_FILE = ".referrers.lock"
+    # Compact the referrer log when it has this many more lines than live referrers
+    COMPACT_THRESHOLD = 32
+
+    def __init__(self, path: str | Path, index: ReferrerIndex | None = None) -> None:
         self.path = Path(os.path.normcase(os.path.expanduser(path))).resolve()
+        self.index = index or ReferrerIndex(self.path.parent)
+        self._lock = FileLock(self.path.parent / self.LOCK_FILE)
         self._referrers: set[str] | None = None
 
+    def _read_log(self) -> tuple[set[str], int]:
+        """Replay the referrer log, return the referrers and the number of lines."""
+        referrers: set[str] = set()
+        filepath = self.path / self.REFERRERS_FILE
+        if not filepath.is_file():
+            return referrers, 0
+        lines = [line.strip() for line in filepath.read_text("utf8").splitlines() if line.strip()]
+        for line in lines:
+            if line[0] == "-":
+                referrers.discard(line[1:])
+            elif line[0] == "+":
+                referrers.add(line[1:])
+            else:  # The format before the log
+                referrers.add(line)
+        return referrers, len(lines)
+
+    def get_referrers(self, exists: Callable[[str], bool] = os.path.exists) -> set[str]:
+        """Get the referrers that still exist, checked with the given function"""
+        return {path for path in self._read_log()[0] if exists(path)}
+
     @property
     def referrers(self) -> set[str]:
         """A set of entries in referrers file"""
         if self._referrers is None:
-            filepath = self.path / "referrers"
-            if not filepath.is_file():
-                return set()
-            self._referrers = {
-                line.strip()
-                for line in filepath.read_text("utf8").splitlines()
-                if line.strip() and os.path.exists(line.strip())
-            }
+            self._referrers = self.get_referrers()
         return self._referrers
 
+    def _append(self, line: str) -> None:
+        with open(self.path / self.REFERRERS_FILE, "a", encoding="utf8") as f:
+            f.write(line + "\n")
+
+    def _compact(self, referrers: set[str]) -> None:
+        """Rewrite the log with the given referrers only"""
+        fd, name = tempfile.mkstemp(prefix="referrers-", dir=self.path)
+        try:
+            with open(fd, "w", encoding="utf8") as f:
+                f.write("".join(f"+{path}\n" for path in sorted(referrers)))
+            os.replace(name, self.path / self.REFERRERS_FILE)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(name)
+            raise
+
+    def _update(self, path: str, add: bool) -> None:
+        path = os.path.normcase(os.path.expanduser(os.path.abspath(path)))
+        with self._lock:
+            referrers, lines = self._read_log()
+            referrers = {p for p in referrers if os.path.exists(p)}
+            if add:
+                referrers.add(path)
+            else:
+                referrers.discard(path)
+                if not referrers:
+                    self.cleanup()
+                    return
+            if lines + 1 - len(referrers) > self.COMPACT_THRESHOLD:
+                self._compact(referrers)
+            else:
+                self._append(f"+{path}" if add else f"-{path}")
+            self.index.update(self.path.name, referrers)
+            self._referrers = None
+
     def add_referrer(self, path: str) -> None:
         """Add a new referrer"""
-        path = os.path.normcase(os.path.expanduser(os.path.abspath(path)))
-        referrers = self.referrers | {path}
-        (self.path / "referrers").write_text("\n".join(sorted(referrers)) + "\n", "utf8")
-        self._referrers = None
+        self._update(path, add=True)
 
     def remove_referrer(self, path: str) -> None:
         """Remove a referrer"""
-        path = os.path.normcase(os.path.expanduser(os.path.abspath(path)))
-        referrers = self.referrers - {path}
-        if not referrers:
-            self.cleanup()
-        else:
-            (self.path / "referrers").write_text("\n".join(referrers) + "\n", "utf8")
-            self._referrers = None
+        self._update(path, add=False)
+
+    @property
+    def manifest(self) -> dict[str, Any] | None:
+        """The link manifest of the package, or None if it is missing or outdated"""
+        with contextlib.suppress(OSError, ValueError):
+            data = json.loads((self.path / self.MANIFEST_FILE).read_text("utf8"))
+            if data.get("version") == MANIFEST_VERSION:
+                return data
+        return None
+
+    def write_manifest(self, manifest: dict[str, Any]) -> None:
+        """Save the link manifest of the package"""
+        with atomic_open_for_write(self.path / self.MANIFEST_FILE, encoding="utf8") as fp:
+            json.dump({"version": MANIFEST_VERSION, **manifest}, fp)
 
     def scheme(self) -> dict[str, str]:
         """The install scheme for the package"""
@@ -60,4 +191,40 @@ class CachedPackage:
 
     def cleanup(self) -> None:
         logger.info("Clean up cached package %s since it is not used by any project.", self.path)
-        shutil.rmtree(self.path)
+        with self._lock:
+            shutil.rmtree(self.path)
+            self.index.discard(self.path.name)
+
+
+def clear_unused_packages(root: Path) -> int:
+    """Remove the cached packages not referred to by any distribution, return the
+    number of removed packages.
+
+    The referrers are taken from the central index, and each site directory is listed
+    once to check their existence. Only the packages that look unused, or aren't in
+    the index, have their referrer logs read.
+    """
+    listed: dict[str, set[str]] = {}
+
+    def exists(path: str) -> bool:
+        parent, name = os.path.split(path)
+        if parent not in listed:
+            try:
+                listed[parent] = {os.path.normcase(child) for child in os.listdir(parent)}
+            except OSError:
+                listed[parent] = set()
+        return name in listed[parent]
+
+    index = ReferrerIndex(root)
+    indexed = index.load()
+    cleared = 0
+    for subdir in root.iterdir():
+        if not subdir.is_dir():
+            continue
+        pkg = CachedPackage(subdir, index)
+        if any(exists(path) for path in indexed.get(pkg.path.name, ())):
+            continue
+        if not pkg.get_referrers(exists):
+            pkg.cleanup()
+            cleared += 1
+    return cleared
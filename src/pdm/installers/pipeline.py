@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import dataclasses
+import queue
+import threading
+from typing import Any, Callable, Generic, Iterable, Sequence, TypeVar
+
+_T = TypeVar("_T")
+_STOP = object()
+
+
+@dataclasses.dataclass(frozen=True)
+class Stage(Generic[_T]):
+    """A stage of the pipeline, processing jobs with its own worker threads.
+
+    :param name: the name of the stage, used to name the worker threads
+    :param func: the function to process a job
+    :param workers: the number of worker threads
+    """
+
+    name: str
+    func: Callable[[_T], Any]
+    workers: int = 1
+
+
+class Pipeline(Generic[_T]):
+    """Run jobs through a sequence of stages.
+
+    Each stage has its own workers and the stages are connected by bounded queues,
+    so a stage can work on the next jobs while the following stage is busy, and a
+    slow stage holds back the ones before it instead of piling up finished jobs.
+    The overall throughput is limited by the slowest stage.
+
+    A job that raises in a stage leaves the pipeline immediately. ``callback`` is
+    called with the job and the exception, or None if the job passed all stages.
+    After :meth:`cancel` is called, the jobs not yet started are dropped without
+    calling ``callback``.
+
+    :param stages: the stages to pass through, in order
+    :param parallel: if False, run the jobs one by one in the calling thread
+    """
+
+    def __init__(self, stages: Sequence[Stage[_T]], parallel: bool = True) -> None:
+        self.stages = stages
+        self.parallel = parallel
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def run(self, jobs: Iterable[_T], callback: Callable[[_T, Exception | None], Any]) -> None:
+        if not self.parallel:
+            for job in jobs:
+                self._run_sequential(job, callback)
+            return
+        # The first queue is fed up front, the others are bounded to apply back pressure
+        queues: list[queue.Queue[Any]] = [queue.Queue()]
+        queues.extend(queue.Queue(maxsize=2 * stage.workers) for stage in self.stages[1:])
+        workers: list[list[threading.Thread]] = []
+        for i, stage in enumerate(self.stages):
+            output = queues[i + 1] if i + 1 < len(queues) else None
+            threads = [
+                threading.Thread(
+                    target=self._work,
+                    args=(stage, queues[i], output, callback),
+                    name=f"pdm-{stage.name}-{n}",
+                    daemon=True,
+                )
+                for n in range(max(stage.workers, 1))
+            ]
+            for thread in threads:
+                thread.start()
+            workers.append(threads)
+        for job in jobs:
+            queues[0].put(job)
+        # Shut down the stages in order, once all jobs have left the previous one
+        for i, threads in enumerate(workers):
+            for _ in threads:
+                queues[i].put(_STOP)
+            for thread in threads:
+                thread.join()
+
+    def _run_sequential(self, job: _T, callback: Callable[[_T, Exception | None], Any]) -> None:
+        for stage in self.stages:
+            if self._cancelled.is_set():
+                return
+            try:
+                stage.func(job)
+            except Exception as e:
+                callback(job, e)
+                return
+        callback(job, None)
+
+    def _work(
+        self,
+        stage: Stage[_T],
+        input: queue.Queue[Any],
+        output: queue.Queue[Any] | None,
+        callback: Callable[[_T, Exception | None], Any],
+    ) -> None:
+        while True:
+            job = input.get()
+            if job is _STOP:
+                return
+            if self._cancelled.is_set():
+                continue
+            try:
+                stage.func(job)
+            except Exception as e:
+                callback(job, e)
+                continue
+            if output is None:
+                callback(job, None)
+            else:
+                output.put(job)
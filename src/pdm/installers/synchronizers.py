@@ -1,13 +1,11 @@
 from __future__ import annotations
 
 import dataclasses
-import functools
 import multiprocessing
 import traceback
-from concurrent.futures import Future, ThreadPoolExecutor
 from functools import cached_property
 from types import SimpleNamespace
-from typing import TYPE_CHECKING, Any, Callable, Collection, TypeVar
+from typing import TYPE_CHECKING, Collection
 
 from rich.progress import SpinnerColumn, TaskProgressColumn
 
@@ -15,64 +13,26 @@ from pdm import termui
 from pdm.environments import BaseEnvironment
 from pdm.exceptions import InstallationError
 from pdm.installers.manager import InstallManager
+from pdm.installers.pipeline import Pipeline, Stage
 from pdm.models.candidates import Candidate
 from pdm.models.reporter import BaseReporter, RichProgressReporter
 from pdm.models.requirements import FileRequirement, Requirement, parse_requirement, strip_extras
 from pdm.utils import is_editable, normalize_name
 
 if TYPE_CHECKING:
-    from rich.progress import Progress
+    from rich.progress import Progress, TaskID
 
     from pdm.compat import Distribution
 
 
-_T = TypeVar("_T")
+@dataclasses.dataclass
+class SyncJob:
+    """A job of the synchronization pipeline"""
 
-
-class DummyFuture:
-    _NOT_SET = object()
-
-    def __init__(self) -> None:
-        self._result = self._NOT_SET
-        self._exc: Exception | None = None
-
-    def set_result(self, result: Any) -> None:
-        self._result = result
-
-    def set_exception(self, exc: Exception) -> None:
-        self._exc = exc
-
-    def result(self) -> Any:
-        return self._result
-
-    def exception(self) -> Exception | None:
-        return self._exc
-
-    def add_done_callback(self: _T, func: Callable[[_T], Any]) -> None:
-        func(self)
-
-    def cancel(self) -> bool:
-        return False
-
-
-class DummyExecutor:
-    """A synchronous pool class to mimic ProcessPoolExecuter's interface.
-    functions are called and awaited for the result
-    """
-
-    def submit(self, func: Callable, *args: Any, **kwargs: Any) -> DummyFuture:
-        future = DummyFuture()
-        try:
-            future.set_result(func(*args, **kwargs))
-        except Exception as exc:
-            future.set_exception(exc)
-        return future
-
-    def __enter__(self: _T) -> _T:
-        return self
-
-    def __exit__(self, *args: Any, **kwargs: Any) -> None:
-        return
+    kind: str
+    key: str
+    task: TaskID | None = None
+    prepare_failed: bool = False
 
 
 def editables_candidate(environment: BaseEnvironment) -> Candidate | None:
@@ -218,8 +178,7 @@ class BaseSynchronizer:
         to_update: set[str] = set()
         to_remove: set[str] = set()
         to_add: set[str] = set()
-        locked_repository = self.environment.project.locked_repository
-        all_candidate_keys = list(locked_repository.all_candidates)
+        all_candidate_keys = self.environment.project.locked_repository.all_candidates
 
         for key, dist in working_set.items():
             if key == self.self_key and self.install_self:
@@ -261,21 +220,68 @@ class BaseSynchronizer:
             termui.logger.info("Updating %s@%s -> %s...", key, dist_version, can.version)
             manager.uninstall(dist)
             manager.install(can)
-        for key in to_remove:
-            dist = self.working_set[key]
+        to_remove_dists = [self.working_set[key] for key in to_remove]
+        for key, dist in zip(to_remove, to_remove_dists):
             termui.logger.info("Removing %s@%s...", key, dist.version)
-            manager.uninstall(dist)
+        manager.uninstall_many(to_remove_dists)
         termui.logger.info("Synchronization complete.")
 
 
 class Synchronizer(BaseSynchronizer):
-    def create_executor(
-        self,
-    ) -> ThreadPoolExecutor | DummyExecutor:
-        if self.parallel:
-            return ThreadPoolExecutor(max_workers=min(multiprocessing.cpu_count(), 8))
-        else:
-            return DummyExecutor()
+    def get_stages(self, progress: Progress) -> list[Stage[SyncJob]]:
+        """Get the stages of the pipeline to run the parallel jobs.
+
+        Packages are downloaded, built and installed in separate stages, each with
+        its own workers, so that network, CPU and disk bound work can overlap.
+        """
+        handlers = {
+            "add": self.install_candidate,
+            "update": self.update_candidate,
+            "remove": self.remove_distribution,
+        }
+
+        def install(job: SyncJob) -> None:
+            handlers[job.kind](job.key, progress)
+
+        if not self.parallel:
+            return [Stage("install", install)]
+        config = self.environment.project.config
+        cpu_count = multiprocessing.cpu_count()
+        return [
+            Stage("download", lambda job: self.prepare_candidate(job, progress), config["install.download_workers"]),
+            Stage(
+                "build",
+                lambda job: self.prepare_candidate(job, progress, build=True),
+                config["install.build_workers"] or cpu_count,
+            ),
+            Stage("install", install, config["install.install_workers"] or min(cpu_count, 8)),
+        ]
+
+    def prepare_candidate(self, job: SyncJob, progress: Progress, build: bool = False) -> None:
+        """Download the candidate of an add or update job, and build it if ``build``
+        is true, ahead of the installation.
+
+        Errors are not raised here but left to the install stage, which will retry
+        and report them in the usual way.
+        """
+        if job.kind == "remove" or job.prepare_failed:
+            return
+        can = self.candidates[job.key]
+        if job.task is None:
+            job.task = progress.add_task(f"Preparing {can.format()}...", text="", total=None)
+        can.prepare(self.environment, RichProgressReporter(progress, job.task))
+        try:
+            if build:
+                self.manager.build(can)
+            else:
+                self.manager.download(can)
+        except Exception as e:
+            termui.logger.debug("Failed to prepare %s: %s", can, e)
+            job.prepare_failed = True
+        finally:
+            if build or job.prepare_failed:
+                progress.update(job.task, visible=False)
+                can.prepare(self.environment, BaseReporter())
 
     def install_candidate(self, key: str, progress: Progress) -> Candidate:
         """Install candidate"""
@@ -345,6 +351,24 @@ class Synchronizer(BaseSynchronizer):
             progress.update(job, visible=False)
         return dist
 
+    def remove_distributions(self, keys: list[str], progress: Progress) -> list[Distribution]:
+        """Remove distributions with given names in one transaction."""
+        dists = [self.working_set[key] for key in keys]
+        job = progress.add_task(f"Removing {len(keys)} packages...", text="", total=None)
+        try:
+            self.manager.uninstall_many(dists)
+        except Exception:
+            progress.live.console.print(f"  [error]{termui.Emoji.FAIL}[/] Remove {len(keys)} packages failed")
+            raise
+        else:
+            for key, dist in zip(keys, dists):
+                progress.live.console.print(
+                    f"  [success]{termui.Emoji.SUCC}[/] Remove [req]{key}[/] [warning]{dist.version}[/] successful"
+                )
+        finally:
+            progress.update(job, visible=False)
+        return dists
+
     def _show_headline(self, packages: dict[str, list[str]]) -> None:
         add, update, remove = packages["add"], packages["update"], packages["remove"]
         if not any((add, update, remove)):
@@ -397,7 +421,8 @@ class Synchronizer(BaseSynchronizer):
             "remove": self.remove_distribution,
         }
         sequential_jobs = []
-        parallel_jobs = []
+        parallel_jobs: list[SyncJob] = []
+        bulk_removals: list[str] = []
 
         for kind in to_do:
             for key in to_do[kind]:
@@ -406,21 +431,24 @@ class Synchronizer(BaseSynchronizer):
                 elif key in self.candidates and self.candidates[key].req.editable:
                     # Editable packages are installed sequentially.
                     sequential_jobs.append((kind, key))
+                elif kind == "remove":
+                    # Removals are done in one transaction instead of a job per package
+                    bulk_removals.append(key)
                 else:
-                    parallel_jobs.append((kind, key))
+                    parallel_jobs.append(SyncJob(kind, key))
 
-        state = SimpleNamespace(errors=[], failed_jobs=[], jobs=[], mark_failed=False)
+        state = SimpleNamespace(errors=[], failed_jobs=[], pipeline=None, mark_failed=False)
 
-        def update_progress(future: Future | DummyFuture, kind: str, key: str) -> None:
-            error = future.exception()
+        def update_progress(job: SyncJob, error: Exception | None) -> None:
             if error:
                 exc_info = (type(error), error, error.__traceback__)
                 termui.logger.exception("Error occurs: ", exc_info=exc_info)
-                state.failed_jobs.append((kind, key))
-                state.errors.extend([f"{kind} [success]{key}[/] failed:\n", *traceback.format_exception(*exc_info)])
+                state.failed_jobs.append(SyncJob(job.kind, job.key))
+                state.errors.extend(
+                    [f"{job.kind} [success]{job.key}[/] failed:\n", *traceback.format_exception(*exc_info)]
+                )
                 if self.fail_fast:
-                    for future in state.jobs:
-                        future.cancel()
+                    state.pipeline.cancel()
                     state.mark_failed = True
 
         # get rich progress and live handler to deal with multiple spinners
@@ -434,13 +462,18 @@ class Synchronizer(BaseSynchronizer):
             live = progress.live
             for kind, key in sequential_jobs:
                 handlers[kind](key, progress)
+            if len(bulk_removals) > 1:
+                try:
+                    self.remove_distributions(bulk_removals, progress)
+                except Exception as e:
+                    # All changes are rolled back, remove the packages one by one instead
+                    termui.logger.debug("Failed to remove the packages in bulk: %s", e)
+                    parallel_jobs[:0] = [SyncJob("remove", key) for key in bulk_removals]
+            else:
+                parallel_jobs[:0] = [SyncJob("remove", key) for key in bulk_removals]
             for i in range(self.retry_times + 1):
-                state.jobs.clear()
-                with self.create_executor() as executor:
-                    for kind, key in parallel_jobs:
-                        future = executor.submit(handlers[kind], key, progress)
-                        future.add_done_callback(functools.partial(update_progress, kind=kind, key=key))
-                        state.jobs.append(future)
+                state.pipeline = Pipeline(self.get_stages(progress), parallel=self.parallel)
+                state.pipeline.run(parallel_jobs, update_progress)
                 if state.mark_failed or not state.failed_jobs or i == self.retry_times:
                     break
                 parallel_jobs, state.failed_jobs = state.failed_jobs, []
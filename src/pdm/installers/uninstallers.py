@@ -4,6 +4,7 @@ import abc
 import glob
 import os
 import shutil
+from functools import cached_property
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING, Iterable, NewType, TypeVar, cast
@@ -221,37 +222,55 @@ class BaseRemovePaths(abc.ABC):
                 self.refer_to = line
 
 
-class StashedRemovePaths(BaseRemovePaths):
-    """Stash the paths to temporarily location and remove them after commit"""
+class BulkRemovePaths:
+    """Remove the paths of multiple distributions in one transaction.
+
+    The paths of all distributions are compressed into one minimal set to rename
+    and stashed into one temporary directory under the environment prefix, so the
+    renames don't cross devices. The pth entries are removed with one rewrite of
+    the registry, so concurrent removals don't race on it. A single distribution
+    is removed by :class:`StashedRemovePaths` as a transaction of its own.
+    """
 
     PTH_REGISTRY = "easy-install.pth"
 
-    def __init__(self, dist: Distribution, environment: BaseEnvironment) -> None:
-        super().__init__(dist, environment)
-        self._pth_file = os.path.join(self.environment.get_paths()["purelib"], self.PTH_REGISTRY)
+    def __init__(self, environment: BaseEnvironment, removals: Iterable[BaseRemovePaths] = ()) -> None:
+        self.environment = environment
+        self.removals = list(removals)
         self._saved_pth: bytes | None = None
         self._stashed: list[tuple[str, str]] = []
-        self._tempdirs: dict[str, TemporaryDirectory] = {}
+        self._stash_dir: TemporaryDirectory | None = None
+
+    def add(self, removal: BaseRemovePaths) -> None:
+        self.removals.append(removal)
+
+    @cached_property
+    def _pth_file(self) -> str:
+        return os.path.join(self.environment.get_paths()["purelib"], self.PTH_REGISTRY)
 
     def remove(self) -> None:
         self._remove_pth()
         self._stash_files()
 
     def _remove_pth(self) -> None:
-        if not self._pth_entries:
+        entries = {entry for removal in self.removals for entry in removal._pth_entries}
+        if not entries:
             return
         with open(self._pth_file, "rb") as f:
             self._saved_pth = f.read()
         endline = "\r\n" if b"\r\n" in self._saved_pth else "\n"
         lines = self._saved_pth.decode().splitlines()
-        for item in self._pth_entries:
+        for item in entries:
             termui.logger.debug("Removing pth entry: %s", item)
-            lines.remove(item)
+        lines = [line for line in lines if line not in entries]
         with open(self._pth_file, "wb") as f:
             f.write((endline.join(lines) + endline).encode("utf8"))
 
     def _stash_files(self) -> None:
-        paths_to_rename = sorted(compress_for_rename(self._paths))
+        paths: set[NormalizedPath] = set()
+        for removal in self.removals:
+            paths.update(removal._paths)
+        paths_to_rename = sorted(compress_for_rename(paths))
         prefix = os.path.abspath(self.environment.get_paths()["prefix"])
 
         for old_path in paths_to_rename:
@@ -263,46 +282,73 @@ class StashedRemovePaths(BaseRemovePaths):
                 # Don't stash cache files, remove them directly
                 os.unlink(old_path)
                 continue
-            root = _get_file_root(old_path, prefix)
-            if root is None:
+            if _get_file_root(old_path, prefix) is None:
                 termui.logger.debug("File path %s is not under packages root %s, skip", old_path, prefix)
                 continue
-            if root not in self._tempdirs:
-                self._tempdirs[root] = TemporaryDirectory("-uninstall", "pdm-")
-            new_root = self._tempdirs[root].name
-            relpath = os.path.relpath(old_path, root)
-            new_path = os.path.join(new_root, relpath)
+            new_path = os.path.join(self._get_stash_dir(prefix), os.path.relpath(old_path, prefix))
             if is_dir and os.path.isdir(new_path):
                 os.rmdir(new_path)
             renames(old_path, new_path)
             self._stashed.append((old_path, new_path))
 
+    def _get_stash_dir(self, prefix: str) -> str:
+        if self._stash_dir is None:
+            try:
+                self._stash_dir = TemporaryDirectory("-uninstall", ".pdm-", dir=prefix)
+            except OSError:
+                self._stash_dir = TemporaryDirectory("-uninstall", "pdm-")
+        return self._stash_dir.name
+
     def commit(self) -> None:
-        for tempdir in self._tempdirs.values():
+        if self._stash_dir is not None:
             try:
-                tempdir.cleanup()
+                self._stash_dir.cleanup()
             except FileNotFoundError:
                 pass
-        self._tempdirs.clear()
+            self._stash_dir = None
         self._stashed.clear()
         self._saved_pth = None
-        if self.refer_to:
-            termui.logger.info("Unlink from cached package %s", self.refer_to)
-            CachedPackage(self.refer_to).remove_referrer(os.path.dirname(self.refer_to))
-            self.refer_to = None
+        for removal in self.removals:
+            if removal.refer_to:
+                termui.logger.info("Unlink from cached package %s", removal.refer_to)
+                CachedPackage(removal.refer_to).remove_referrer(os.path.dirname(removal.refer_to))
+                removal.refer_to = None
 
     def rollback(self) -> None:
-        if not self._stashed:
+        if not self._stashed and self._saved_pth is None:
             termui.logger.error("Can't rollback, not uninstalled yet")
             return
         if self._saved_pth is not None:
             with open(self._pth_file, "wb") as f:
                 f.write(self._saved_pth)
-        for old_path, new_path in self._stashed:
+            self._saved_pth = None
+        for old_path, new_path in reversed(self._stashed):
             termui.logger.debug("Rollback %s\n from %s", old_path, new_path)
             if os.path.isfile(old_path) or os.path.islink(old_path):
                 os.unlink(old_path)
             elif os.path.isdir(old_path):
                 shutil.rmtree(old_path)
             renames(new_path, old_path)
-        self.commit()
+        self._stashed.clear()
+        if self._stash_dir is not None:
+            self._stash_dir.cleanup()
+            self._stash_dir = None
+
+
+class StashedRemovePaths(BaseRemovePaths):
+    """Stash the paths to temporarily location and remove them after commit"""
+
+    PTH_REGISTRY = BulkRemovePaths.PTH_REGISTRY
+
+    def __init__(self, dist: Distribution, environment: BaseEnvironment) -> None:
+        super().__init__(dist, environment)
+        self._transaction = BulkRemovePaths(environment, [self])
+
+    def remove(self) -> None:
+        self._transaction.remove()
+
+    def commit(self) -> None:
+        self._transaction.commit()
+
+    def rollback(self) -> None:
+        self._transaction.rollback()
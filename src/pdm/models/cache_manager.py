@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import contextlib
+import itertools
+import os
+import shutil
+import sqlite3
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, Mapping, NamedTuple
+
+from pdm.termui import logger
+
+CACHE_TYPES = ("hashes", "http", "wheels", "metadata", "packages", "build_envs", "artifacts", "tasks", "lockfiles")
+# The caches whose entries are directories instead of files
+DIRECTORY_CACHES = ("packages", "build_envs")
+# The SQLite stores and their journals, which are kept open by running processes
+SQLITE_SUFFIXES = (".db", ".db-wal", ".db-shm", ".db-journal")
+
+
+class CacheUsage(NamedTuple):
+    files: int
+    size: int
+    scanned_at: float
+
+
+class CacheManager:
+    """Keep an index of the sizes and last access times of the cache entries,
+    and evict the least recently used entries of a cache exceeding its size limit.
+
+    An entry is a file, or a directory for the caches in :data:`DIRECTORY_CACHES`.
+    The SQLite stores, such as the metadata databases, are not managed by the index.
+    The access time of an entry is the latest access or modification time of its
+    files. The index is refreshed by :meth:`scan`, one cache type at a time, and
+    updated by :meth:`record` when a file is written, so the usage can be read
+    from it without walking the cache directories.
+
+    :param cache_dir: the root directory of the caches
+    :param limits: the size limits in bytes by cache type, 0 means unlimited
+    """
+
+    INDEX_FILE = "cache_index.db"
+    GC_STAMP_FILE = ".gc_stamp"
+
+    def __init__(self, cache_dir: Path, limits: Mapping[str, int]) -> None:
+        self.cache_dir = cache_dir
+        self.limits = limits
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.cache_dir / self.INDEX_FILE, timeout=30)
+        try:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS entries (path TEXT PRIMARY KEY, type TEXT NOT NULL, "
+                    "files INTEGER NOT NULL, size INTEGER NOT NULL, atime REAL NOT NULL)"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS usage (type TEXT PRIMARY KEY, files INTEGER NOT NULL, "
+                    "size INTEGER NOT NULL, scanned_at REAL NOT NULL)"
+                )
+                yield conn
+        finally:
+            conn.close()
+
+    def _iter_entries(self, cache_type: str) -> Iterable[tuple[Path, int, int, float]]:
+        """Walk the cache directory and yield (path, files, size, atime) of the entries."""
+        root = self.cache_dir / cache_type
+        if not root.is_dir():
+            return
+        if cache_type in DIRECTORY_CACHES:
+            for child in root.iterdir():
+                if child.is_dir() and not child.is_symlink():
+                    files, size, atime = 0, 0, 0.0
+                    # The lock file of a build environment is counted with it
+                    lock_file = [child.with_name(f"{child.name}.lock")] if cache_type == "build_envs" else []
+                    for file in itertools.chain(_walk_files(child), lock_file):
+                        try:
+                            stat = file.lstat()
+                        except FileNotFoundError:
+                            continue
+                        files += 1
+                        size += stat.st_size
+                        atime = max(atime, stat.st_atime, stat.st_mtime)
+                    yield child, files, size, atime
+            return
+        for file in _walk_files(root):
+            # Skip the temporary files being written and the SQLite stores
+            if file.name.startswith(".") or file.name.endswith(SQLITE_SUFFIXES):
+                continue
+            stat = file.lstat()
+            yield file, 1, stat.st_size, max(stat.st_atime, stat.st_mtime)
+
+    def scan(self, cache_type: str) -> CacheUsage:
+        """Walk the cache directory to refresh the index, and return the usage."""
+        rows = [
+            (path.relative_to(self.cache_dir).as_posix(), cache_type, files, size, atime)
+            for path, files, size, atime in self._iter_entries(cache_type)
+        ]
+        usage = CacheUsage(sum(row[2] for row in rows), sum(row[3] for row in rows), time.time())
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries WHERE type = ?", (cache_type,))
+            conn.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)", rows)
+            conn.execute("INSERT OR REPLACE INTO usage VALUES (?, ?, ?, ?)", (cache_type, *usage))
+        return usage
+
+    def get_usage(self, cache_type: str, max_age: float | None = None) -> CacheUsage:
+        """Get the usage of the cache from the index. The cache is scanned if it
+        isn't indexed yet, or was last scanned more than ``max_age`` seconds ago,
+        since only some of the cache writers :meth:`record` their files.
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT files, size, scanned_at FROM usage WHERE type = ?", (cache_type,)).fetchone()
+        if row is None or max_age is not None and row[2] < time.time() - max_age:
+            return self.scan(cache_type)
+        return CacheUsage(*row)
+
+    def record(self, path: Path) -> None:
+        """Add a file written to a cache to the index and to the usage of the cache,
+        to keep them current between the scans. Directory entries are left to :meth:`scan`.
+        """
+        try:
+            relpath = path.relative_to(self.cache_dir)
+        except ValueError:
+            return
+        cache_type = relpath.parts[0]
+        if cache_type not in CACHE_TYPES or cache_type in DIRECTORY_CACHES:
+            return
+        stat = path.stat()
+        key = relpath.as_posix()
+        with self._connect() as conn:
+            files, size = conn.execute("SELECT files, size FROM entries WHERE path = ?", (key,)).fetchone() or (0, 0)
+            conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (key, cache_type, 1, stat.st_size, max(stat.st_atime, stat.st_mtime)),
+            )
+            conn.execute(
+                "UPDATE usage SET files = files + ?, size = size + ? WHERE type = ?",
+                (1 - files, stat.st_size - size, cache_type),
+            )
+
+    def invalidate(self, cache_types: Iterable[str] = CACHE_TYPES) -> None:
+        """Scan the changed caches again to refresh their usage."""
+        for cache_type in cache_types:
+            self.scan(cache_type)
+
+    def collect(self, cache_type: str) -> tuple[int, int]:
+        """Scan the cache and evict the least recently used entries until it fits
+        in the size limit. Return the number of evicted entries and freed bytes.
+        """
+        limit = self.limits.get(cache_type, 0)
+        if not limit:
+            return 0, 0
+        usage = self.scan(cache_type)
+        if usage.size <= limit:
+            return 0, 0
+        files, size = usage.files, usage.size
+        evicted: list[tuple[str]] = []
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT path, files, size FROM entries WHERE type = ? ORDER BY atime", (cache_type,)
+            ).fetchall()
+        for path, entry_files, entry_size in rows:
+            if size <= limit:
+                break
+            if self._evict(cache_type, self.cache_dir / path):
+                files -= entry_files
+                size -= entry_size
+                evicted.append((path,))
+        with self._connect() as conn:
+            conn.executemany("DELETE FROM entries WHERE path = ?", evicted)
+            conn.execute("INSERT OR REPLACE INTO usage VALUES (?, ?, ?, ?)", (cache_type, files, size, time.time()))
+        return len(evicted), usage.size - size
+
+    def _evict(self, cache_type: str, path: Path) -> bool:
+        try:
+            if cache_type == "packages":
+                from pdm.installers.packages import CachedPackage
+
+                package = CachedPackage(path)
+                if package.referrers:
+                    return False
+                package.cleanup()
+            elif cache_type == "build_envs":
+                from filelock import FileLock, Timeout
+
+                lock_file = path.with_name(f"{path.name}.lock")
+                try:
+                    # Skip the environments being used by other processes
+                    with FileLock(lock_file, timeout=0):
+                        shutil.rmtree(path)
+                        # The lock file can't be removed while it is held on Windows
+                        with contextlib.suppress(OSError):
+                            lock_file.unlink()
+                except Timeout:
+                    return False
+            else:
+                path.unlink()
+                root = self.cache_dir / cache_type
+                with contextlib.suppress(OSError):
+                    for parent in path.parents:
+                        if parent == root:
+                            break
+                        parent.rmdir()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug("Failed to evict cache entry %s: %s", path, e)
+            return False
+        logger.debug("Evicted cache entry %s", path)
+        return True
+
+    def gc_step(self, interval: float) -> None:
+        """Collect the size-limited cache that was scanned the longest ago, if it is
+        older than ``interval`` seconds. Only one cache is processed per call, to
+        spread the cost of the collection over multiple runs.
+
+        The index is not opened until the next step is due, which is tracked by
+        the modification time of :attr:`GC_STAMP_FILE`.
+        """
+        limited = [t for t in CACHE_TYPES if self.limits.get(t, 0)]
+        if not limited:
+            return
+        stamp = self.cache_dir / self.GC_STAMP_FILE
+        with contextlib.suppress(OSError):
+            if stamp.stat().st_mtime > time.time() - interval / len(limited):
+                return
+        with self._connect() as conn:
+            scanned = dict(conn.execute("SELECT type, scanned_at FROM usage").fetchall())
+        cache_type = min(limited, key=lambda t: scanned.get(t, 0.0))
+        if scanned.get(cache_type, 0.0) < time.time() - interval:
+            removed, freed = self.collect(cache_type)
+            logger.debug("Collected %s cache: %d entries removed, %d bytes freed", cache_type, removed, freed)
+        stamp.touch()
+
+
+def _walk_files(root: Path) -> Iterator[Path]:
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            yield Path(dirpath, filename)
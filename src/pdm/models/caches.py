@@ -5,9 +5,14 @@ import dataclasses
 import hashlib
 import json
 import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
 from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, BinaryIO, Generic, Iterable, TypeVar, cast
+from typing import TYPE_CHECKING, Any, BinaryIO, Generic, Iterable, TypeVar, cast
 
 from cachecontrol.cache import SeparateBodyBaseCache
 from cachecontrol.caches import FileCache
@@ -16,6 +21,7 @@ from packaging.utils import canonicalize_name, parse_wheel_filename
 from pdm._types import CandidateInfo
 from pdm.exceptions import PdmException
 from pdm.models.candidates import Candidate
+from pdm.profiler import profiler
 from pdm.termui import logger
 from pdm.utils import atomic_open_for_write, create_tracked_tempdir
 
@@ -23,6 +29,9 @@ if TYPE_CHECKING:
     from packaging.tags import Tag
     from requests import Session
     from unearth import Link, TargetPython
+    from unearth.preparer import HashValidator
+
+    from pdm.models.cache_manager import CacheManager
 
 KT = TypeVar("KT")
 VT = TypeVar("VT")
@@ -34,6 +43,7 @@ class JSONFileCache(Generic[KT, VT]):
     def __init__(self, cache_file: Path | str) -> None:
         self.cache_file = Path(cache_file)
         self._cache: dict[str, VT] = {}
+        self._lock = threading.Lock()
         self._read_cache()
 
     def _read_cache(self) -> None:
@@ -63,22 +73,103 @@ class JSONFileCache(Generic[KT, VT]):
 
     def set(self, obj: KT, value: VT) -> None:
         key = self._get_key(obj)
-        self._cache[key] = value
-        self._write_cache()
+        with self._lock:
+            self._cache[key] = value
+            self._write_cache()
 
     def delete(self, obj: KT) -> None:
+        with self._lock:
+            try:
+                del self._cache[self._get_key(obj)]
+            except KeyError:
+                pass
+            self._write_cache()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._write_cache()
+
+
+class SQLiteFileCache(Generic[KT, VT]):
+    """A file cache that stores key-value pairs in a sqlite database.
+
+    Unlike :class:`JSONFileCache`, every entry is read and written individually
+    and concurrent writers from other processes are serialized by sqlite.
+    A JSON file cache with the same stem, if any, is migrated on first use.
+    """
+
+    def __init__(self, cache_file: Path | str) -> None:
+        self.cache_file = Path(cache_file)
+        self._lock = threading.Lock()
         try:
-            del self._cache[self._get_key(obj)]
-        except KeyError:
-            pass
-        self._write_cache()
+            self._conn = self._connect(str(self.cache_file))
+        except sqlite3.DatabaseError as e:
+            # The file may be corrupted or not writable, use a memory cache instead
+            logger.debug("Unable to open the cache file %s: %s", self.cache_file, e)
+            self._conn = self._connect(":memory:")
+        legacy_file = self.cache_file.with_suffix(".json")
+        if legacy_file.exists():
+            self._migrate_from_json(legacy_file)
+
+    @staticmethod
+    def _connect(database: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(database, timeout=30, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        return conn
+
+    def _migrate_from_json(self, legacy_file: Path) -> None:
+        try:
+            data = json.loads(legacy_file.read_text("utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        rows = [(key, json.dumps(value)) for key, value in data.items()]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany("INSERT OR IGNORE INTO cache (key, value) VALUES (?, ?)", rows)
+            except sqlite3.DatabaseError:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        with contextlib.suppress(OSError):
+            legacy_file.unlink()
+
+    def __contains__(self, obj: KT) -> bool:
+        key = self._get_key(obj)
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM cache WHERE key = ?", (key,)).fetchone()
+        return row is not None
+
+    @classmethod
+    def _get_key(cls, obj: KT) -> str:
+        return str(obj)
+
+    def get(self, obj: KT) -> VT:
+        key = self._get_key(obj)
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return json.loads(row[0])
+
+    def set(self, obj: KT, value: VT) -> None:
+        key = self._get_key(obj)
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)", (key, json.dumps(value)))
+
+    def delete(self, obj: KT) -> None:
+        key = self._get_key(obj)
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
 
     def clear(self) -> None:
-        self._cache.clear()
-        self._write_cache()
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
 
 
-class CandidateInfoCache(JSONFileCache[Candidate, CandidateInfo]):
+class CandidateInfoCache(SQLiteFileCache[Candidate, CandidateInfo]):
     """A cache manager that stores the
     candidate -> (dependencies, requires_python, summary) mapping.
     """
@@ -118,8 +209,9 @@ class HashCache:
     FAVORITE_HASH = "sha256"
     STRONG_HASHES = ("sha256", "sha384", "sha512")
 
-    def __init__(self, directory: Path | str) -> None:
+    def __init__(self, directory: Path | str, artifact_cache: ArtifactCache | None = None) -> None:
         self.directory = Path(directory)
+        self.artifact_cache = artifact_cache
 
     def _read_from_link(self, link: Link, session: Session) -> Iterable[bytes]:
         if link.is_file:
@@ -136,8 +228,17 @@ class HashCache:
                 yield from resp.iter_content(chunk_size=8192)
 
     def _get_file_hash(self, link: Link, session: Session) -> str:
-        h = hashlib.new(self.FAVORITE_HASH)
         logger.debug("Downloading link %s for calculating hash", link.redacted)
+        if (
+            self.artifact_cache is not None
+            and self.artifact_cache.HASH_NAME == self.FAVORITE_HASH
+            and not link.is_file
+            and link.filename
+        ):
+            # Save the downloaded artifact, so it doesn't need downloading again for installation
+            with contextlib.suppress(OSError):
+                return self.artifact_cache.add_stream(self._read_from_link(link, session), link.filename)[0]
+        h = hashlib.new(self.FAVORITE_HASH)
         for chunk in self._read_from_link(link, session):
             h.update(chunk)
         return ":".join([h.name, h.hexdigest()])
@@ -147,10 +248,16 @@ class HashCache:
         # We may add more when we know better about it.
         return not link.is_file
 
-    def get_hash(self, link: Link, session: Session) -> str:
+    def get_hash(self, link: Link, session: Session, known: str | None = None) -> str:
+        """Get the hash of the file the link points to.
+
+        :param known: the hash of the file known from elsewhere, e.g. the lock file,
+            used instead of downloading a remote file that has no hash in the link
+        """
         # If there is no link hash (i.e., md5, sha256, etc.), we don't want
         # to store it.
         hash_value = self.get(link.url_without_fragment)
+        profiler.count("hash_cache.hits" if hash_value else "hash_cache.misses")
         if not hash_value:
             if link.hashes and link.hashes.keys() & self.STRONG_HASHES:
                 logger.debug("Using hash in link for %s", link.redacted)
@@ -159,6 +266,10 @@ class HashCache:
             elif link.hash and link.hash_name in self.STRONG_HASHES:
                 logger.debug("Using hash in link for %s", link.redacted)
                 hash_value = f"{link.hash_name}:{link.hash}"
+            elif known and not link.is_file:
+                logger.debug("Using known hash for %s", link.redacted)
+                profiler.count("hash_cache.known")
+                hash_value = known
             else:
                 hash_value = self._get_file_hash(link, session)
             if self._should_cache(link):
@@ -184,17 +295,165 @@ class HashCache:
                 fp.write(hash)
 
 
+class ArtifactCache:
+    """Stores downloaded artifacts addressed by their content hashes.
+
+    The artifacts can be looked up with the hashes recorded in the lock file,
+    regardless of the index they are downloaded from, and without network access.
+    """
+
+    HASH_NAME = "sha256"
+
+    def __init__(self, directory: Path | str, manager: CacheManager | None = None) -> None:
+        self.directory = Path(directory)
+        self.manager = manager
+
+    def _record(self, path: Path) -> None:
+        """Add the new artifact to the cache index, never failing the write."""
+        if self.manager is None:
+            return
+        try:
+            self.manager.record(path)
+        except (OSError, sqlite3.Error) as e:
+            logger.debug("Failed to record %s in the cache index: %s", path, e)
+
+    def _get_path_for_hash(self, hash_value: str) -> Path | None:
+        hash_name, _, digest = hash_value.partition(":")
+        if hash_name != self.HASH_NAME or len(digest) < 8:
+            return None
+        return self.directory.joinpath(digest[:2], digest[2:4], digest[4:])
+
+    def get(self, hash_value: str) -> Path | None:
+        """Get the artifact with the given hash, in the form of ``sha256:<hexdigest>``."""
+        path = self._get_path_for_hash(hash_value)
+        if path is None:
+            return None
+        with contextlib.suppress(OSError):
+            for file in path.iterdir():
+                if file.name.startswith(".") or not file.is_file():
+                    continue
+                # Record the last use for pruning
+                os.utime(file)
+                return file
+        return None
+
+    def add(self, file: Path | str, move: bool = False) -> Path:
+        """Add the file to the cache and return the cached path.
+
+        :param file: the artifact file
+        :param move: whether to move the file into the cache instead of copying it
+        """
+        file = Path(file)
+        h = hashlib.new(self.HASH_NAME)
+        with file.open("rb") as f:
+            for chunk in iter(lambda: f.read(8192), b""):
+                h.update(chunk)
+        path = self._get_path_for_hash(f"{h.name}:{h.hexdigest()}")
+        assert path is not None
+        target = path / file.name
+        if target.exists():
+            return target
+        path.mkdir(parents=True, exist_ok=True)
+        fd, temp_file = tempfile.mkstemp(prefix=f".{file.name}", dir=path)
+        os.close(fd)
+        try:
+            if move:
+                shutil.move(file, temp_file)
+            else:
+                shutil.copyfile(file, temp_file)
+            os.replace(temp_file, target)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_file)
+            raise
+        self._record(target)
+        return target
+
+    def add_stream(
+        self, chunks: Iterable[bytes], filename: str, validator: HashValidator | None = None
+    ) -> tuple[str, Path]:
+        """Write the artifact into the cache from a stream of chunks, hashing the content
+        on the way so the file is read only once. Return the hash and the cached path.
+
+        :param chunks: the content of the artifact
+        :param filename: the file name of the artifact
+        :param validator: the chunks are also fed to the validator, and the artifact is
+            only saved if the validation passes
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        h = hashlib.new(self.HASH_NAME)
+        fd, temp_file = tempfile.mkstemp(prefix=f".{filename}", dir=self.directory)
+        try:
+            with open(fd, "wb") as f:
+                for chunk in chunks:
+                    h.update(chunk)
+                    if validator is not None:
+                        validator.update(chunk)
+                    f.write(chunk)
+            if validator is not None:
+                validator.validate()
+            hash_value = f"{h.name}:{h.hexdigest()}"
+            path = self._get_path_for_hash(hash_value)
+            assert path is not None
+            target = path / filename
+            if target.exists():
+                os.unlink(temp_file)
+            else:
+                path.mkdir(parents=True, exist_ok=True)
+                os.replace(temp_file, target)
+                self._record(target)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_file)
+            raise
+        return hash_value, target
+
+    def iter_files(self) -> Iterable[Path]:
+        if not self.directory.exists():
+            return
+        for file in self.directory.rglob("*"):
+            if file.is_file() and not file.name.startswith("."):
+                yield file
+
+    def prune(self, max_age: float) -> int:
+        """Remove the artifacts that are not used within ``max_age`` seconds,
+        return the number of removed files.
+        """
+        removed = 0
+        deadline = time.time() - max_age
+        for file in list(self.iter_files()):
+            with contextlib.suppress(OSError):
+                if file.stat().st_mtime < deadline:
+                    file.unlink()
+                    removed += 1
+                    with contextlib.suppress(OSError):
+                        file.parent.rmdir()
+        return removed
+
+
 class WheelCache:
     """Caches wheels so we do not need to rebuild them.
 
     Wheels are only cached when the URL contains egg-info or is a VCS repository
     with an *immutable* revision. There might be more than one wheels built for
     one sdist, the one with most preferred tag will be returned.
+
+    The best wheel of each cache directory is recorded in a manifest next to it,
+    together with the directory mtime, so the wheels don't need to be listed and
+    parsed again as long as the directory is unchanged.
     """
 
+    MANIFEST_SUFFIX = ".manifest.json"
+    # An mtime this close to the time of the scan is not trusted, since a following
+    # change within the timestamp granularity won't be reflected by the mtime.
+    RACY_WINDOW_NS = 2_000_000_000
+
     def __init__(self, directory: Path | str) -> None:
         self.directory = Path(directory)
+        with contextlib.suppress(OSError):
+            self.directory.mkdir(parents=True, exist_ok=True)
         self.ephemeral_directory = Path(create_tracked_tempdir(prefix="pdm-wheel-cache-"))
+        self._tag_tables: dict[str, tuple[dict[Tag, int], str]] = {}
 
     def _get_candidates(self, path: Path) -> Iterable[Path]:
         if not path.exists():
@@ -228,19 +487,67 @@ class WheelCache:
         parts = self._get_path_parts(link, target_python)
         return self.ephemeral_directory.joinpath(*parts)
 
+    def get_tag_priorities(self, target_python: TargetPython) -> tuple[dict[Tag, int], str]:
+        """Get the priorities of the tags supported by the target python, with a digest
+        of the tags. They are computed once per target python.
+        """
+        key = json.dumps(dataclasses.astuple(target_python))
+        table = self._tag_tables.get(key)
+        if table is None:
+            tags = target_python.supported_tags()
+            digest = hashlib.sha224("\n".join(map(str, tags)).encode("utf-8")).hexdigest()
+            table = self._tag_tables[key] = ({tag: i for i, tag in enumerate(tags)}, digest)
+        return table
+
     def get(self, link: Link, project_name: str | None, target_python: TargetPython) -> Path | None:
         if not project_name:
             return None
         canonical_name = canonicalize_name(project_name)
-        tags_priorities = {tag: i for i, tag in enumerate(target_python.supported_tags())}
+        tags_priorities, tags_digest = self.get_tag_priorities(target_python)
 
-        candidate = self._get_from_path(self.get_path_for_link(link, target_python), canonical_name, tags_priorities)
+        candidate = self._get_from_manifest(
+            self.get_path_for_link(link, target_python), canonical_name, tags_priorities, tags_digest
+        )
         if candidate is not None:
             return candidate
-        return self._get_from_path(
-            self.get_ephemeral_path_for_link(link, target_python), canonical_name, tags_priorities
+        return self._get_from_manifest(
+            self.get_ephemeral_path_for_link(link, target_python), canonical_name, tags_priorities, tags_digest
         )
 
+    def _get_from_manifest(
+        self, path: Path, canonical_name: str, tags_priorities: dict[Tag, int], tags_digest: str
+    ) -> Path | None:
+        """Get the best wheel in the directory, from the manifest if it is up to date."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        # The manifest is stored out of the directory to not change its mtime
+        manifest_file = path.with_name(f".{path.name}{self.MANIFEST_SUFFIX}")
+        record: dict[str, Any] = {}
+        with contextlib.suppress(OSError, ValueError):
+            record = json.loads(manifest_file.read_text("utf-8"))
+        if (
+            record.get("mtime") == stat.st_mtime_ns
+            and record.get("scanned_at", 0) - stat.st_mtime_ns > self.RACY_WINDOW_NS
+            and record.get("tags") == tags_digest
+        ):
+            if canonical_name in record["wheels"]:
+                profiler.count("wheel_cache.manifest_hits")
+                filename = record["wheels"][canonical_name]
+                return path / filename if filename else None
+        else:
+            record = {"wheels": {}}
+        profiler.count("wheel_cache.manifest_misses")
+        scanned_at = time.time_ns()
+        candidate = self._get_from_path(path, canonical_name, tags_priorities)
+        record.update(mtime=stat.st_mtime_ns, scanned_at=scanned_at, tags=tags_digest)
+        record["wheels"][canonical_name] = candidate.name if candidate is not None else None
+        with contextlib.suppress(OSError):
+            with atomic_open_for_write(manifest_file, encoding="utf-8") as fp:
+                json.dump(record, fp)
+        return candidate
+
     def _get_from_path(self, path: Path, canonical_name: str, tags_priorities: dict[Tag, int]) -> Path | None:
         candidates: list[tuple[int, Path]] = []
         for candidate in self._get_candidates(path):
@@ -41,6 +41,8 @@ from pdm.utils import (
 )
 
 if TYPE_CHECKING:
+    from typing import Iterator
+
     from unearth import Link, Package, PackageFinder
 
     from pdm._types import FileHash
@@ -245,7 +247,7 @@ class Candidate:
                 if requires_python.isdigit():
                     requires_python = f">={requires_python},<{int(requires_python) + 1}"
                 try:  # ensure the specifier is valid
-                    PySpecSet(requires_python)
+                    PySpecSet.intern(requires_python)
                 except InvalidPyVersion:
                     pass
                 else:
@@ -417,6 +419,7 @@ class PreparedCandidate:
         self.reporter.report_build_start(self.link.filename)  # type: ignore[union-attr]
         self.wheel = Path(builder.build(build_dir, metadata_directory=self._metadata_dir))
         self.reporter.report_build_end(self.link.filename)  # type: ignore[union-attr]
+        self._record_in_cache_index(self.wheel)
         return self.wheel
 
     def obtain(self, allow_all: bool = False, unpack: bool = True) -> None:
@@ -433,6 +436,19 @@ class PreparedCandidate:
 
         sources = filtered_sources(self.environment.project.sources, self.req.key)
         with self.environment.get_finder(sources) as finder:
+            cached_artifact = self._get_cached_artifact(finder, allow_all)
+            if cached_artifact is not None:
+                from unearth import Link
+
+                termui.logger.info("Using cached artifact: %s", cached_artifact)
+                self.link = Link.from_path(cached_artifact)
+                if not self.candidate.link:
+                    self.candidate.link = self.link
+                if self.link.is_wheel:
+                    self.wheel = cached_artifact
+                elif unpack:
+                    self._unpack(validate_hashes=not allow_all)
+                return
             if not self.link or self.link.is_wheel and not self._wheel_compatible(self.link.filename, allow_all):
                 if self.req.is_file_or_url:
                     raise CandidateNotFound(f"The URL requirement {self.req.as_line()} is a wheel but incompatible")
@@ -463,25 +479,81 @@ class PreparedCandidate:
             hash_options = convert_hashes(self.candidate.hashes)
         assert self.link is not None
         with self.environment.get_finder() as finder:
+            link = self.link
+            is_downloaded = not link.is_file and not link.is_vcs
+            if is_downloaded:
+                artifact = self._download_to_artifact_cache(finder, hash_options)
+                if artifact is not None:
+                    from unearth import Link
+
+                    # The artifact is validated while being downloaded
+                    link, hash_options, is_downloaded = Link.from_path(artifact), None, False
             with TemporaryDirectory(prefix="pdm-download-") as tmpdir:
                 build_dir = self._get_build_dir()
-                if self.link.is_wheel:
+                if link.is_wheel:
                     download_dir = build_dir
                 else:
                     download_dir = tmpdir
                 result = finder.download_and_unpack(
-                    self.link,
+                    link,
                     build_dir,
                     download_dir,
                     hash_options,
                     download_reporter=self.reporter.report_download,
                     unpack_reporter=self.reporter.report_unpack,
                 )
-                if self.link.is_wheel:
-                    self.wheel = result
+                if link.is_wheel:
+                    self.wheel = self._save_to_artifact_cache(result) if is_downloaded else result
                 else:
                     self._source_dir = Path(build_dir)
                     self._unpacked_dir = result
+                    if is_downloaded:
+                        self._save_to_artifact_cache(Path(download_dir, link.filename))
+
+    def _download_to_artifact_cache(
+        self, finder: PackageFinder, hash_options: dict[str, list[str]] | None
+    ) -> Path | None:
+        """Download the link into the artifact cache, validating the hashes and hashing
+        the content for the cache in the same pass. Return None if the artifact can't
+        be saved to the cache, then it is downloaded in the usual way.
+        """
+        from unearth.errors import UnpackError
+        from unearth.preparer import HashValidator
+
+        assert self.link is not None
+        link = self.link
+        if not link.filename:
+            return None
+        artifact_cache = self.environment.project.make_artifact_cache()
+
+        def iter_chunks() -> Iterator[bytes]:
+            import requests
+
+            with finder.session.get(link.normalized, stream=True) as resp:
+                try:
+                    resp.raise_for_status()
+                except requests.HTTPError as e:
+                    raise UnpackError(f"Download failed: {e}") from None
+                try:
+                    total: int | None = int(resp.headers["Content-Length"])
+                except (KeyError, ValueError, TypeError):
+                    total = None
+                termui.logger.info("Downloading %s", link.redacted)
+                completed = 0
+                for chunk in resp.iter_content(chunk_size=8192):
+                    if chunk:
+                        completed += len(chunk)
+                        self.reporter.report_download(link, completed, total)
+                        yield chunk
+
+        try:
+            # Fall back to the hash in the link fragment, like PackageFinder.download_and_unpack() does
+            validator = HashValidator(link, hash_options or link.hash_option)
+            _, artifact = artifact_cache.add_stream(iter_chunks(), link.filename, validator)
+        except OSError as e:
+            termui.logger.debug("Failed to download %s to the artifact cache: %s", link.redacted, e)
+            return None
+        return artifact
 
     def prepare_metadata(self, force_build: bool = False) -> im.Distribution:
         self.obtain(allow_all=True, unpack=False)
@@ -638,6 +710,65 @@ class PreparedCandidate:
             return _egg_info_re.search(link.filename) is not None
         return False
 
+    def _get_cached_artifact(self, finder: PackageFinder, allow_all: bool = False) -> Path | None:
+        """Find the artifact of a named candidate in the artifact cache by the hashes
+        from the lock file. Like the finder, the compatible wheel with the most preferred
+        tag is chosen, and the source distributions are only used if there is none.
+        """
+        from unearth import Link
+
+        if not self.req.is_named or not self.candidate.hashes:
+            return None
+        key = self.req.key
+        allow_binary = key not in finder.no_binary and (":all:" not in finder.no_binary or key in finder.only_binary)
+        allow_source = key not in finder.only_binary and (":all:" not in finder.only_binary or key in finder.no_binary)
+        # Share the tag table computed once per target python by the wheel cache
+        wheel_cache = self.environment.project.make_wheel_cache()
+        tags_priorities, _ = wheel_cache.get_tag_priorities(self.environment.target_python)
+        best_wheel: tuple[int, str] | None = None
+        sdists: list[str] = []
+        for item in self.candidate.hashes:
+            filename = item.get("file") or (Link(item["url"]).filename if "url" in item else "")
+            if not filename or "hash" not in item:
+                continue
+            if filename.endswith(".whl"):
+                if not allow_binary:
+                    continue
+                try:
+                    tags = parse_wheel_filename(filename)[-1]
+                except ValueError:
+                    continue
+                priorities = [tags_priorities[tag] for tag in tags if tag in tags_priorities]
+                if allow_all:
+                    priorities.append(0)
+                if priorities and (best_wheel is None or min(priorities) < best_wheel[0]):
+                    best_wheel = (min(priorities), item["hash"])
+            elif allow_source:
+                sdists.append(item["hash"])
+        artifact_cache = self.environment.project.make_artifact_cache()
+        for hash_value in [best_wheel[1]] if best_wheel else sdists:
+            cached = artifact_cache.get(hash_value)
+            if cached is not None:
+                return cached
+        return None
+
+    def _save_to_artifact_cache(self, artifact: Path) -> Path:
+        """Move the downloaded artifact to the artifact cache, return the new path."""
+        try:
+            return self.environment.project.make_artifact_cache().add(artifact, move=True)
+        except OSError as e:
+            termui.logger.debug("Failed to save %s to the artifact cache: %s", artifact, e)
+            return artifact
+
+    def _record_in_cache_index(self, wheel: Path) -> None:
+        """Add the wheel to the cache index if it is saved to the wheel cache."""
+        import sqlite3
+
+        try:
+            self.environment.project.make_cache_manager().record(wheel)
+        except (OSError, sqlite3.Error) as e:
+            termui.logger.debug("Failed to record %s in the cache index: %s", wheel, e)
+
     def _get_cached_wheel(self) -> Path | None:
         wheel_cache = self.environment.project.make_wheel_cache()
         assert self.candidate.link
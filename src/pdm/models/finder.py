@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from typing import Any
+import itertools
+from typing import TYPE_CHECKING, Any, Iterable
 
 import unearth
 from packaging.version import Version
+from unearth.collector import collect_links_from_location
 from unearth.evaluator import Package
+from unearth.link import Link
 from unearth.session import PyPISession
 
+if TYPE_CHECKING:
+    from unearth.finder import Source
+
 
 class ReverseVersion(Version):
     """A subclass of version that reverse the order of comparison."""
@@ -30,11 +36,47 @@ class PDMPackageFinder(unearth.PackageFinder):
         session: PyPISession | None = None,
         *,
         minimal_version: bool = False,
+        page_links: dict[tuple[str, bool], list[Link]] | None = None,
         **kwargs: Any,
     ) -> None:
+        """
+        :param minimal_version: prefer the lowest versions instead of the highest.
+        :param page_links: a mapping to store the links parsed from remote pages,
+            which can be shared by finders to avoid parsing the same page again.
+        """
         self.minimal_version = minimal_version
+        self.page_links = page_links
         super().__init__(session, **kwargs)
 
+    def _collect_links(self, location: Link, expand: bool = False) -> Iterable[Link]:
+        # Local paths are cheap to scan and may change, only remember remote pages
+        if self.page_links is None or location.is_file:
+            return collect_links_from_location(self.session, location, expand)
+        key = (location.normalized, expand)
+        if key not in self.page_links:
+            self.page_links[key] = list(collect_links_from_location(self.session, location, expand))
+        return self.page_links[key]
+
+    def _find_packages(self, package_name: str, allow_yanked: bool = False) -> Iterable[Package]:
+        # Same as the super method, but collect links through self._collect_links()
+        evaluator = self.build_evaluator(package_name, allow_yanked)
+
+        def find_one_source(source: Source) -> Iterable[Package]:
+            if source["type"] == "index":
+                link = self._build_index_page_link(source["url"], package_name)
+                result = self._evaluate_links(self._collect_links(link), evaluator)
+            else:
+                link = self._build_find_link(source["url"])
+                result = self._evaluate_links(self._collect_links(link, expand=True), evaluator)
+            if self.respect_source_order:
+                return sorted(result, key=self._sort_key, reverse=True)
+            return result
+
+        all_packages = itertools.chain.from_iterable(map(find_one_source, self.sources))
+        if self.respect_source_order:
+            return all_packages
+        return sorted(all_packages, key=self._sort_key, reverse=True)
+
     def _sort_key(self, package: Package) -> tuple:
         key = super()._sort_key(package)
         if self.minimal_version:
@@ -5,14 +5,20 @@ from __future__ import annotations
 
 import contextlib
 import functools
+import hashlib
 import json
 import os
 import subprocess
+import sys
 import tempfile
+from pathlib import Path
 from typing import Any, Generator
 
 from pdm.compat import resources_path
 
+# Bump this when the output of interpreter_facts.py changes
+_FACTS_VERSION = 1
+
 
 @contextlib.contextmanager
 def _in_process_script(name: str) -> Generator[str, None, None]:
@@ -20,14 +26,81 @@ def _in_process_script(name: str) -> Generator[str, None, None]:
         yield str(script)
 
 
+def _is_running_interpreter(executable: str) -> bool:
+    """Whether the executable is the interpreter running PDM, whose facts can be
+    collected without spawning a subprocess.
+    """
+    if os.getenv("PYTHONHOME"):
+        return False
+    return os.path.normcase(os.path.abspath(executable)) == os.path.normcase(os.path.abspath(sys.executable))
+
+
+def _get_facts_cache_key(executable: str) -> str | None:
+    try:
+        stat = os.stat(executable)
+    except OSError:
+        return None
+    pyvenv_cfg = ""
+    exe_dir = Path(executable).parent
+    for cfg_file in (exe_dir / "pyvenv.cfg", exe_dir.parent / "pyvenv.cfg"):
+        with contextlib.suppress(OSError, UnicodeError):
+            pyvenv_cfg = cfg_file.read_text("utf-8")
+            break
+    key = json.dumps([_FACTS_VERSION, executable, stat.st_mtime_ns, stat.st_size, pyvenv_cfg])
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
 @functools.lru_cache
-def get_python_abis(executable: str) -> list[str]:
-    with _in_process_script("get_abis.py") as script:
-        return json.loads(subprocess.check_output(args=[executable, "-EsS", script]))
+def get_interpreter_facts(executable: str, cache_dir: str | None = None) -> dict[str, Any]:
+    """Get the ABIs, PEP 508 environment, sysconfig paths, uname and platform of
+    the interpreter with a single probe.
+
+    No subprocess is spawned if the executable is the running interpreter.
+    Otherwise, the result is persisted under ``cache_dir`` if given, keyed by the
+    executable path, its mtime and the content of ``pyvenv.cfg``.
+    """
+    if _is_running_interpreter(executable):
+        from pdm.models.in_process.interpreter_facts import get_facts
+
+        return get_facts()
+
+    cache_file: Path | None = None
+    if cache_dir is not None and (key := _get_facts_cache_key(executable)) is not None:
+        cache_file = Path(cache_dir, f"{key}.json")
+        with contextlib.suppress(OSError, ValueError):
+            return json.loads(cache_file.read_text("utf-8"))
+
+    env = os.environ.copy()
+    env.pop("__PYVENV_LAUNCHER__", None)
+    with _in_process_script("interpreter_facts.py") as script:
+        facts = json.loads(subprocess.check_output([executable, "-Es", script], env=env))
+    if cache_file is not None:
+        from pdm.utils import atomic_open_for_write
+
+        with contextlib.suppress(OSError):
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_open_for_write(cache_file, encoding="utf-8") as fp:
+                json.dump(facts, fp)
+    return facts
+
+
+def get_python_abis(executable: str, cache_dir: str | None = None) -> list[str]:
+    return list(get_interpreter_facts(executable, cache_dir)["abis"])
 
 
-def get_sys_config_paths(executable: str, vars: dict[str, str] | None = None, kind: str = "default") -> dict[str, str]:
+def get_sys_config_paths(
+    executable: str, vars: dict[str, str] | None = None, kind: str = "default", cache_dir: str | None = None
+) -> dict[str, str]:
     """Return the sys_config.get_paths() result for the python interpreter"""
+    if vars is None and kind in ("default", "user"):
+        paths = get_interpreter_facts(executable, cache_dir)["paths"][kind]
+        if paths is not None:
+            return dict(paths)
+    elif _is_running_interpreter(executable):
+        from pdm.models.in_process.sysconfig_get_paths import get_paths
+
+        return get_paths(kind, vars)
+
     env = os.environ.copy()
     env.pop("__PYVENV_LAUNCHER__", None)
     if vars is not None:
@@ -38,11 +111,9 @@ def get_sys_config_paths(executable: str, vars: dict[str, str] | None = None, ki
         return json.loads(subprocess.check_output(cmd, env=env))
 
 
-def get_pep508_environment(executable: str) -> dict[str, str]:
+def get_pep508_environment(executable: str, cache_dir: str | None = None) -> dict[str, str]:
     """Get PEP 508 environment markers dict."""
-    with _in_process_script("pep508.py") as script:
-        args = [executable, "-EsS", script]
-        return json.loads(subprocess.check_output(args))
+    return dict(get_interpreter_facts(executable, cache_dir)["pep508"])
 
 
 def parse_setup_py(executable: str, path: str) -> dict[str, Any]:
@@ -55,15 +126,11 @@ def parse_setup_py(executable: str, path: str) -> dict[str, Any]:
             return json.load(fp)
 
 
-@functools.lru_cache
-def get_uname(executable: str) -> os.uname_result:
+def get_uname(executable: str, cache_dir: str | None = None) -> os.uname_result:
     """Get uname of the system"""
-    script = "import os, json; print(json.dumps(os.uname()))"
-    return os.uname_result(json.loads(subprocess.check_output([executable, "-EsSc", script])))
+    return os.uname_result(get_interpreter_facts(executable, cache_dir)["uname"])
 
 
-@functools.lru_cache
-def sysconfig_get_platform(executable: str) -> str:
+def sysconfig_get_platform(executable: str, cache_dir: str | None = None) -> str:
     """Get platform from sysconfig"""
-    script = "import sysconfig; print(sysconfig.get_platform())"
-    return subprocess.check_output([executable, "-EsSc", script]).decode().strip()
+    return get_interpreter_facts(executable, cache_dir)["platform"]
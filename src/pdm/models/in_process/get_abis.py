@@ -108,9 +108,11 @@ def interpreter_name() -> str:
     return INTERPRETER_SHORT_NAMES.get(name) or name
 
 
-if __name__ == "__main__":
+def get_abis():
     if interpreter_name() == "cp":
-        abis = _cpython_abis(sys.version_info[:2])
-    else:
-        abis = _generic_abi()
-    print(json.dumps(abis))
+        return _cpython_abis(sys.version_info[:2])
+    return _generic_abi()
+
+
+if __name__ == "__main__":
+    print(json.dumps(get_abis()))
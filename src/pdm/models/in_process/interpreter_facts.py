@@ -0,0 +1,33 @@
+import json
+import os
+import sysconfig
+
+try:
+    from get_abis import get_abis
+    from pep508 import default_environment
+    from sysconfig_get_paths import get_paths
+except ImportError:  # Imported by PDM in the running interpreter
+    from pdm.models.in_process.get_abis import get_abis
+    from pdm.models.in_process.pep508 import default_environment
+    from pdm.models.in_process.sysconfig_get_paths import get_paths
+
+
+def get_facts():
+    """Collect all facts of the interpreter that PDM needs in one run."""
+    paths = {}
+    for kind in ("default", "user"):
+        try:
+            paths[kind] = get_paths(kind)
+        except ValueError:
+            paths[kind] = None
+    return {
+        "abis": get_abis(),
+        "pep508": default_environment(),
+        "paths": paths,
+        "uname": list(os.uname()) if hasattr(os, "uname") else None,
+        "platform": sysconfig.get_platform(),
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(get_facts()))
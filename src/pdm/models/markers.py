@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import operator
+import threading
 from dataclasses import dataclass
 from functools import reduce
-from typing import Any, overload
+from typing import Any, ClassVar, Hashable, Iterable, overload
 
 from dep_logic.markers import (
     BaseMarker,
@@ -47,7 +48,7 @@ class Marker:
         return f"<Marker {self.inner}>"
 
     def evaluate(self, environment: dict[str, Any] | None = None) -> bool:
-        return self.inner.evaluate(environment)
+        return MarkerEvaluator.for_environment(environment).evaluate(self)
 
     def split_pyspec(self) -> tuple[Marker, PySpecSet]:
         """Split `python_version` and `python_full_version` from marker string"""
@@ -65,6 +66,80 @@ class Marker:
         return type(self)(self.inner.without_extras()), type(self)(self.inner.only("extra"))
 
 
+class MarkerEvaluator:
+    """Evaluate markers against one environment, remembering the results.
+
+    A marker is split into its ``and`` and ``or`` parts down to the single
+    expressions, and the result of each part is stored, so a marker or an
+    expression shared by many requirements is evaluated only once.
+
+    :param environment: the marker environment, the one of the running
+        interpreter if not given
+    """
+
+    # The evaluators of the recently used environments
+    _evaluators: ClassVar[dict[Hashable, MarkerEvaluator]] = {}
+    _lock = threading.Lock()
+    MAX_ENVIRONMENTS = 32
+
+    def __init__(self, environment: dict[str, Any] | None = None) -> None:
+        self.environment = environment
+        self._results: dict[BaseMarker, bool] = {}
+
+    @classmethod
+    def for_environment(cls, environment: dict[str, Any] | None = None) -> MarkerEvaluator:
+        """Get the shared evaluator of the environment."""
+        key = _environment_key(environment)
+        if key is None:
+            return cls(environment)
+        evaluator = cls._evaluators.get(key)
+        if evaluator is None:
+            with cls._lock:
+                if len(cls._evaluators) >= cls.MAX_ENVIRONMENTS:
+                    cls._evaluators.clear()
+                evaluator = cls._evaluators.setdefault(key, cls(environment))
+        return evaluator
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._evaluators.clear()
+
+    def evaluate(self, marker: Marker | BaseMarker) -> bool:
+        inner = marker.inner if isinstance(marker, Marker) else marker
+        result = self._results.get(inner)
+        if result is None:
+            if isinstance(inner, MultiMarker):
+                result = all(self.evaluate(m) for m in inner.markers)
+            elif isinstance(inner, MarkerUnion):
+                result = any(self.evaluate(m) for m in inner.markers)
+            else:
+                result = inner.evaluate(self.environment)
+            self._results[inner] = result
+        return result
+
+
+def _environment_key(environment: dict[str, Any] | None) -> Hashable | None:
+    """Return a hashable key of the environment, or None if it can't be made."""
+    if environment is None:
+        return ()
+    try:
+        return frozenset(
+            (name, tuple(sorted(value)) if isinstance(value, (list, tuple, set, frozenset)) else value)
+            for name, value in environment.items()
+        )
+    except TypeError:
+        return None
+
+
+def evaluate_markers(markers: Iterable[Marker | None], environment: dict[str, Any] | None = None) -> list[bool]:
+    """Evaluate the markers against the environment in one pass. A missing marker is
+    always satisfied.
+    """
+    evaluator = MarkerEvaluator.for_environment(environment)
+    return [marker is None or evaluator.evaluate(marker) for marker in markers]
+
+
 @overload
 def get_marker(marker: None) -> None:
     ...
@@ -112,11 +187,11 @@ def _build_pyspec_from_marker(marker: BaseMarker) -> PySpecSet:
             elif op in ("in", "not in"):
                 version = " ".join(v + ".*" for v in split_version(version))
         if op == "in":
-            pyspec = reduce(operator.or_, (PySpecSet(f"=={v}") for v in split_version(version)))
+            pyspec = reduce(operator.or_, (PySpecSet.intern(f"=={v}") for v in split_version(version)))
         elif op == "not in":
-            pyspec = reduce(operator.and_, (PySpecSet(f"!={v}") for v in split_version(version)))
+            pyspec = reduce(operator.and_, (PySpecSet.intern(f"!={v}") for v in split_version(version)))
         else:
-            pyspec = PySpecSet(f"{op}{version}")
+            pyspec = PySpecSet.intern(f"{op}{version}")
         return pyspec
     elif isinstance(marker, MultiMarker):
         return reduce(operator.and_, (_build_pyspec_from_marker(m) for m in marker.markers))
@@ -7,22 +7,27 @@ import posixpath
 import re
 import sys
 import warnings
+from contextlib import contextmanager
 from functools import wraps
-from typing import TYPE_CHECKING, Collection, Generator, TypeVar, cast
+from typing import TYPE_CHECKING, Collection, Generator, Mapping, TypeVar, cast
 
 from pdm import termui
 from pdm.exceptions import CandidateInfoNotFound, CandidateNotFound, PackageWarning, PdmException
 from pdm.models.candidates import Candidate
+from pdm.models.markers import evaluate_markers
 from pdm.models.requirements import (
     Requirement,
     filter_requirements_with_extras,
     parse_requirement,
+    strip_extras,
 )
 from pdm.models.search import SearchResultParser
 from pdm.models.specifiers import PySpecSet
+from pdm.profiler import profiler
 from pdm.utils import (
     cd,
     filtered_sources,
+    get_trusted_hosts,
     normalize_name,
     path_to_url,
     url_to_path,
@@ -30,12 +35,14 @@ from pdm.utils import (
 )
 
 if TYPE_CHECKING:
-    from typing import Any, Callable, Iterable, Mapping
+    from pathlib import Path
+    from typing import Any, Callable, Iterable, Iterator
 
-    from unearth import Link
+    from unearth import Link, PackageFinder
 
     from pdm._types import CandidateInfo, FileHash, RepositoryConfig, SearchResult
     from pdm.environments import BaseEnvironment
+    from pdm.models.session import PDMSession
 
     CandidateKey = tuple[str, str | None, str | None, bool]
 
@@ -75,19 +82,47 @@ class BaseRepository:
         self._candidate_info_cache = environment.project.make_candidate_info_cache()
         self._hash_cache = environment.project.make_hash_cache()
         self.has_warnings = False
+        # Links parsed from the index pages, shared by all finders of this repository
+        self._page_links: dict[tuple[str, bool], list[Link]] = {}
+        self._shared_session: PDMSession | None = None
+        # The locked hashes by URL or by the filename of the files locked without URLs,
+        # to avoid downloading the files again
+        self._known_hashes: Mapping[str, str] = {}
+        # The candidate info fetched ahead of the resolver, by the dependency key
+        self._prefetched: dict[tuple[str, str | None], CandidateInfo] = {}
+
+    @contextmanager
+    def get_finder(
+        self,
+        sources: list[RepositoryConfig] | None = None,
+        ignore_compatibility: bool = False,
+        minimal_version: bool = False,
+    ) -> Generator[PackageFinder, None, None]:
+        """Return a package finder that reuses the index pages already parsed by
+        this repository, and the session of the running batch, if any.
+        """
+        with self.environment.get_finder(
+            sources,
+            ignore_compatibility,
+            minimal_version,
+            session=self._shared_session,
+            page_links=self._page_links,
+        ) as finder:
+            yield finder
 
     def get_filtered_sources(self, req: Requirement) -> list[RepositoryConfig]:
         """Get matching sources based on the index attribute."""
         return filtered_sources(self.sources, req.key)
 
-    def get_dependencies(self, candidate: Candidate) -> tuple[list[Requirement], PySpecSet, str]:
-        """Get (dependencies, python_specifier, summary) of the candidate."""
+    def _get_candidate_info(self, candidate: Candidate) -> CandidateInfo:
         requires_python, summary = "", ""
         requirements: list[str] = []
         last_ext_info = None
+        package = candidate.identify()
         for getter in self.dependency_generators():
             try:
-                requirements, requires_python, summary = getter(candidate)
+                with profiler.phase(getter.__name__.lstrip("_"), package):
+                    requirements, requires_python, summary = getter(candidate)
             except CandidateInfoNotFound:
                 last_ext_info = sys.exc_info()
                 continue
@@ -95,6 +130,12 @@ class BaseRepository:
         else:
             if last_ext_info is not None:
                 raise last_ext_info[1].with_traceback(last_ext_info[2])  # type: ignore[union-attr]
+        return requirements, requires_python, summary
+
+    def get_dependencies(self, candidate: Candidate) -> tuple[list[Requirement], PySpecSet, str]:
+        """Get (dependencies, python_specifier, summary) of the candidate."""
+        info = self._prefetched.get(candidate.dep_key)
+        requirements, requires_python, summary = info if info is not None else self._get_candidate_info(candidate)
         reqs: list[Requirement] = []
         for line in requirements:
             if line.startswith("-e "):
@@ -116,8 +157,22 @@ class BaseRepository:
         candidate.summary = summary
         if not self.ignore_compatibility:
             pep508_env = self.environment.marker_environment
-            reqs = [req for req in reqs if not req.marker or req.marker.evaluate(pep508_env)]
-        return reqs, PySpecSet(requires_python), summary
+            reqs = [req for req, ok in zip(reqs, evaluate_markers((req.marker for req in reqs), pep508_env)) if ok]
+        return reqs, PySpecSet.intern(requires_python), summary
+
+    def prefetch_dependencies(self, candidate: Candidate) -> None:
+        """Fetch the candidate info and keep it in memory, so that the following
+        ``get_dependencies()`` call for the same candidate is answered without fetching
+        it again. The info is only saved to the candidate info cache by the dependency
+        getters, if the candidate should be cached. This is safe to be called from a
+        worker thread.
+        """
+        key = candidate.dep_key
+        if key in self._prefetched or candidate in self._candidate_info_cache:
+            return
+        # Work on a fresh copy to not share the prepared state with the resolver
+        can = Candidate(candidate.req, name=candidate.name, version=candidate.version, link=candidate.link)
+        self._prefetched[key] = self._get_candidate_info(can)
 
     def _find_candidates(self, requirement: Requirement, minimal_version: bool) -> Iterable[Candidate]:
         raise NotImplementedError
@@ -193,7 +248,7 @@ class BaseRepository:
                 if not requires_python.is_subset(candidate.requires_python):
                     if self._should_ignore_package_warning(requirement):
                         continue
-                    working_requires_python = project_requires_python & PySpecSet(candidate.requires_python)
+                    working_requires_python = project_requires_python & PySpecSet.intern(candidate.requires_python)
                     if working_requires_python.is_impossible:  # pragma: no cover
                         continue
                     warnings.warn(
@@ -261,7 +316,9 @@ class BaseRepository:
         try:
             result = self._candidate_info_cache.get(candidate)
         except KeyError:
+            profiler.count("candidate_info_cache.misses")
             raise CandidateInfoNotFound(candidate) from None
+        profiler.count("candidate_info_cache.hits")
         return result
 
     @cache_result
@@ -302,9 +359,9 @@ class BaseRepository:
                 else:
                     version = f"{major}.{minor}.0"
                 if tag.abi == "abi3":
-                    spec = PySpecSet(f">={version}")  # cp37-abi3 is compatible with >=3.7
+                    spec = PySpecSet.intern(f">={version}")  # cp37-abi3 is compatible with >=3.7
                 else:
-                    spec = PySpecSet(f"~={version}")  # cp37-cp37 is only compatible with 3.7.*
+                    spec = PySpecSet.intern(f"~={version}")  # cp37-cp37 is only compatible with 3.7.*
                 return not (spec & python_requires).is_impossible
             else:
                 # we don't know about compatility for non-cpython implementations
@@ -345,7 +402,7 @@ class BaseRepository:
         if req.is_named and respect_source_order and comes_from:
             sources = [s for s in sources if comes_from.startswith(s.url)]
 
-        with self.environment.get_finder(sources, self.ignore_compatibility) as finder:
+        with self.get_finder(sources, self.ignore_compatibility) as finder:
             if req.is_file_or_url:
                 this_link = cast("Link", candidate.prepare(self.environment).link)
                 links: list[Link] = [this_link]
@@ -364,11 +421,56 @@ class BaseRepository:
                     {
                         "url": link.url_without_fragment,
                         "file": link.filename,
-                        "hash": self._hash_cache.get_hash(link, finder.session),
+                        "hash": self._hash_cache.get_hash(
+                            link,
+                            finder.session,
+                            self._known_hashes.get(link.url_without_fragment) or self._known_hashes.get(link.filename),
+                        ),
                     }
                 )
         return result
 
+    def fetch_hashes(
+        self,
+        candidates: Iterable[Candidate],
+        known_hashes: Mapping[str, str] | None = None,
+        callback: Callable[[Candidate, float], None] | None = None,
+    ) -> None:
+        """Fetch the hashes of the candidates in a batch and store them on the candidates.
+
+        All candidates share one session and connection pool, and the index pages
+        parsed during resolution are reused. The connections to the same host are
+        capped by the ``pypi.max_connections_per_host`` config.
+
+        :param known_hashes: the locked hashes, by URL for the files locked with URLs and
+            by filename otherwise, used for the files whose links don't carry a hash
+            instead of downloading them
+        :param callback: called with each candidate and the seconds taken when its
+            hashes are fetched
+        """
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        def do_fetch(candidate: Candidate) -> None:
+            start = time.perf_counter()
+            with profiler.phase("get_hashes", candidate.identify()):
+                candidate.hashes = self.get_hashes(candidate)
+            if callback is not None:
+                callback(candidate, time.perf_counter() - start)
+
+        max_connections = self.environment.project.config["pypi.max_connections_per_host"]
+        session = self.environment._build_session(get_trusted_hosts(self.sources), max_connections=max_connections)
+        self._shared_session = session
+        self._known_hashes = known_hashes or {}
+        try:
+            with ThreadPoolExecutor(max_connections, thread_name_prefix="pdm-hashes") as executor:
+                for _ in executor.map(do_fetch, candidates):
+                    pass
+        finally:
+            self._shared_session = None
+            self._known_hashes = {}
+            session.close()
+
     def dependency_generators(self) -> Iterable[Callable[[Candidate], CandidateInfo]]:
         """Return an iterable of getter functions to get dependencies, which will be
         called one by one.
@@ -400,7 +502,7 @@ class PyPIRepository(BaseRepository):
             for proc_url in (raw_url.rstrip("/") for raw_url in (source.url for source in sources) if raw_url)
             if proc_url.endswith("/simple")
         ]
-        with self.environment.get_finder(sources) as finder:
+        with self.get_finder(sources) as finder:
             session = finder.session
             for prefix in url_prefixes:
                 json_url = f"{prefix}/pypi/{candidate.name}/{candidate.version}/json"
@@ -431,7 +533,7 @@ class PyPIRepository(BaseRepository):
         from unearth.utils import LazySequence
 
         sources = self.get_filtered_sources(requirement)
-        with self.environment.get_finder(sources, self.ignore_compatibility, minimal_version=minimal_version) as finder:
+        with self.get_finder(sources, self.ignore_compatibility, minimal_version=minimal_version) as finder:
             cans = LazySequence(
                 Candidate.from_installation_candidate(c, requirement)
                 for c in finder.find_all_packages(requirement.project_name, allow_yanked=requirement.is_pinned)
@@ -467,7 +569,35 @@ class PyPIRepository(BaseRepository):
             return parser.results
 
 
+class _LockedCandidates(Mapping[str, Candidate]):
+    """The candidates of the locked repository by identifier, loading the packages
+    of the requested names only, unless iterated.
+    """
+
+    def __init__(self, repository: LockedRepository) -> None:
+        self._repository = repository
+        self._candidates: dict[str, Candidate] = {}
+
+    def __getitem__(self, identifier: str) -> Candidate:
+        self._repository._load_packages(strip_extras(identifier)[0])
+        return self._candidates[identifier]
+
+    def __iter__(self) -> Iterator[str]:
+        self._repository._load_all_packages()
+        return iter(self._candidates)
+
+    def __len__(self) -> int:
+        self._repository._load_all_packages()
+        return len(self._candidates)
+
+
 class LockedRepository(BaseRepository):
+    """The repository of the packages pinned in the lock file.
+
+    The ``Requirement`` and ``Candidate`` objects of the packages are built when the
+    packages of that name are requested, or all at once when the packages are iterated.
+    """
+
     def __init__(
         self,
         lockfile: Mapping[str, Any],
@@ -475,45 +605,96 @@ class LockedRepository(BaseRepository):
         environment: BaseEnvironment,
     ) -> None:
         super().__init__(sources, environment, ignore_compatibility=False)
-        self.packages: dict[CandidateKey, Candidate] = {}
-        self.candidate_info: dict[CandidateKey, CandidateInfo] = {}
+        self._packages: dict[CandidateKey, Candidate] = {}
+        self._candidate_info: dict[CandidateKey, CandidateInfo] = {}
+        # The package entries not loaded yet, with their positions in the lock file, by normalized name
+        self._pending: dict[str, list[tuple[int, Mapping[str, Any]]]] = {}
+        # Indexes to look up the candidate keys without scanning all packages
+        self._all_candidates = _LockedCandidates(self)
+        self._keys_by_name: dict[str, list[CandidateKey]] = {}
+        self._file_keys_by_path: dict[Path, list[CandidateKey]] = {}
+        self._file_keys_by_url: dict[str | None, list[CandidateKey]] = {}
+        self._key_positions: dict[CandidateKey, int] = {}
+        # Whether the packages are loaded out of the order of the lock file
+        self._order_stale = False
         self._read_lockfile(lockfile)
 
     @property
-    def all_candidates(self) -> dict[str, Candidate]:
-        return {can.req.identify(): can for can in self.packages.values()}
+    def all_candidates(self) -> Mapping[str, Candidate]:
+        return self._all_candidates
+
+    @property
+    def packages(self) -> dict[CandidateKey, Candidate]:
+        self._load_all_packages()
+        return self._packages
+
+    @property
+    def candidate_info(self) -> dict[CandidateKey, CandidateInfo]:
+        self._load_all_packages()
+        return self._candidate_info
+
+    def _index_candidate(self, key: CandidateKey, candidate: Candidate, position: int) -> None:
+        from pdm.models.requirements import FileRequirement
+
+        self._all_candidates._candidates[candidate.req.identify()] = candidate
+        self._keys_by_name.setdefault(key[0], []).append(key)
+        self._key_positions[key] = position
+        if isinstance(candidate.req, FileRequirement):
+            if candidate.req.path:
+                self._file_keys_by_path.setdefault(candidate.req.path, []).append(key)
+            self._file_keys_by_url.setdefault(key[2], []).append(key)
 
     def _read_lockfile(self, lockfile: Mapping[str, Any]) -> None:
         from pdm.project.lockfile import FLAG_STATIC_URLS
 
-        root = self.environment.project.root
         static_urls = FLAG_STATIC_URLS in self.environment.project.lockfile.strategy
+        for position, package in enumerate(lockfile.get("package", [])):
+            if not static_urls and any("url" in f for f in package.get("files", [])):
+                raise PdmException(
+                    "Static URLs are not allowed in lockfile unless enabled by `pdm lock --static-urls`."
+                )
+            self._pending.setdefault(normalize_name(package["name"]), []).append((position, package))
+
+    def _load_packages(self, name: str) -> None:
+        """Build the candidates of the packages with the given name, if not yet."""
+        entries = self._pending.pop(normalize_name(name), None)
+        if not entries:
+            return
+        self._order_stale = True
+        root = self.environment.project.root
         with cd(root):
-            for package in lockfile.get("package", []):
+            for position, package in entries:
+                package_name = package["name"]
                 version = package.get("version")
-                if version:
-                    package["version"] = f"=={version}"
-                package_name = package.pop("name")
                 req_dict = {
-                    k: v for k, v in package.items() if k not in ("dependencies", "requires_python", "summary", "files")
+                    k: v
+                    for k, v in package.items()
+                    if k not in ("name", "dependencies", "requires_python", "summary", "files")
                 }
+                if version:
+                    req_dict["version"] = f"=={version}"
                 req = Requirement.from_req_dict(package_name, req_dict)
                 if req.is_file_or_url and req.path and not req.url:  # type: ignore[attr-defined]
                     req.url = path_to_url(posixpath.join(root, req.path))  # type: ignore[attr-defined]
                 can = Candidate(req, name=package_name, version=version)
                 can.hashes = package.get("files", [])
-                if not static_urls and any("url" in f for f in can.hashes):
-                    raise PdmException(
-                        "Static URLs are not allowed in lockfile unless enabled by `pdm lock --static-urls`."
-                    )
                 can_id = self._identify_candidate(can)
-                self.packages[can_id] = can
+                self._packages[can_id] = can
+                self._index_candidate(can_id, can, position)
                 candidate_info: CandidateInfo = (
                     package.get("dependencies", []),
                     package.get("requires_python", ""),
                     package.get("summary", ""),
                 )
-                self.candidate_info[can_id] = candidate_info
+                self._candidate_info[can_id] = candidate_info
+
+    def _load_all_packages(self) -> None:
+        for name in list(self._pending):
+            self._load_packages(name)
+        if self._order_stale:
+            # Keep the order of the lock file
+            self._packages = dict(sorted(self._packages.items(), key=lambda item: self._key_positions[item[0]]))
+            self._order_stale = False
 
     def _identify_candidate(self, candidate: Candidate) -> CandidateKey:
         url: str | None = None
@@ -535,8 +716,12 @@ class LockedRepository(BaseRepository):
             f"Missing package {candidate.identify()} from the lockfile, "
             "the lockfile may be broken. Run `pdm lock --update-reuse` to fix it."
         )
+        if candidate.name:
+            self._load_packages(candidate.name)
+        else:
+            self._load_all_packages()
         try:
-            return self.candidate_info[self._identify_candidate(candidate)]
+            return self._candidate_info[self._identify_candidate(candidate)]
         except KeyError as e:  # pragma: no cover
             raise CandidateNotFound(err) from e
 
@@ -549,22 +734,21 @@ class LockedRepository(BaseRepository):
     def _matching_keys(self, requirement: Requirement) -> Iterable[CandidateKey]:
         from pdm.models.requirements import FileRequirement
 
-        for key in self.candidate_info:
-            can_req = self.packages[key].req
-            if requirement.name:
-                if key[0] != requirement.identify():
-                    continue
-            else:
-                assert isinstance(requirement, FileRequirement)
-                if not isinstance(can_req, FileRequirement):
-                    continue
-                if requirement.path and can_req.path:
-                    if requirement.path != can_req.path:
-                        continue
-                elif key[2] is not None and key[2] != url_without_fragments(requirement.url):
-                    continue
-
-            yield key
+        if requirement.name:
+            self._load_packages(requirement.name)
+            return list(self._keys_by_name.get(requirement.identify(), []))
+        assert isinstance(requirement, FileRequirement)
+        self._load_all_packages()
+        # A file candidate without URL matches any file requirement, unless both have paths.
+        url_keys = list(self._file_keys_by_url.get(None, []))
+        if requirement.url:
+            url_keys.extend(self._file_keys_by_url.get(url_without_fragments(requirement.url), []))
+        if requirement.path:
+            keys = {key for key in url_keys if not cast(FileRequirement, self._packages[key].req).path}
+            keys.update(self._file_keys_by_path.get(requirement.path, []))
+        else:
+            keys = set(url_keys)
+        return sorted(keys, key=self._key_positions.__getitem__)
 
     def find_candidates(
         self,
@@ -579,10 +763,10 @@ class LockedRepository(BaseRepository):
                 yield candidate
                 return
         for key in self._matching_keys(requirement):
-            info = self.candidate_info[key]
-            if not PySpecSet(info[1]).contains(str(self.environment.interpreter.version), True):
+            info = self._candidate_info[key]
+            if not PySpecSet.intern(info[1]).contains(str(self.environment.interpreter.version), True):
                 continue
-            can = self.packages[key]
+            can = self._packages[key]
             can.requires_python = info[1]
             if not requirement.name:
                 # make sure can.identify() won't return a randomly-generated name
@@ -592,14 +776,22 @@ class LockedRepository(BaseRepository):
     def get_hashes(self, candidate: Candidate) -> list[FileHash]:
         return candidate.hashes
 
+    def evaluate_markers(self, environment: dict[str, Any] | None = None) -> dict[CandidateKey, bool]:
+        """Evaluate the markers of all locked packages in one pass.
+
+        :param environment: the marker environment, that of the repository's environment if not given
+        :returns: whether each package, by key, applies to the environment
+        """
+        if environment is None:
+            environment = self.environment.marker_environment
+        packages = self.packages
+        return dict(zip(packages, evaluate_markers((can.req.marker for can in packages.values()), environment)))
+
     def evaluate_candidates(self, groups: Collection[str]) -> Iterable[Candidate]:
-        for can in self.packages.values():
+        applicable = None if self.ignore_compatibility else self.evaluate_markers()
+        for key, can in self.packages.items():
             if not any(g in can.req.groups for g in groups):
                 continue
-            if (
-                not self.ignore_compatibility
-                and can.req.marker is not None
-                and not can.req.marker.evaluate(self.environment.marker_environment)
-            ):
+            if applicable is not None and not applicable[key]:
                 continue
             yield can
@@ -85,7 +85,7 @@ class Requirement:
     groups: list[str] = dataclasses.field(default_factory=list)
 
     def __post_init__(self) -> None:
-        self.requires_python = self.marker.split_pyspec()[1] if self.marker else PySpecSet()
+        self.requires_python = self.marker.split_pyspec()[1] if self.marker else PySpecSet.intern()
 
     @property
     def project_name(self) -> str | None:
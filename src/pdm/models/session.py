@@ -7,11 +7,12 @@ from typing import IO, TYPE_CHECKING, Any, Mapping
 
 from cachecontrol import CacheControlAdapter as BaseCCAdapter
 from cachecontrol.serialize import Serializer
-from requests import Request
+from requests import Request, Response
 from requests_toolbelt.utils import user_agent
 from unearth.session import InsecureMixin, PyPISession
 
 from pdm.__version__ import __version__
+from pdm.profiler import profiler
 from pdm.termui import logger
 
 if TYPE_CHECKING:
@@ -68,15 +69,28 @@ class CompatibleSerializer(Serializer):
 
 
 class PDMSession(PyPISession):
-    def __init__(self, *, cache_dir: Path, **kwargs: Any) -> None:
+    def __init__(self, *, cache_dir: Path, max_connections: int | None = None, **kwargs: Any) -> None:
+        """
+        :param cache_dir: the directory to store the HTTP cache.
+        :param max_connections: if given, cap the number of connections to the
+            same host, requests exceeding it wait for a free connection.
+        """
         from pdm.models.caches import SafeFileCache
 
-        cache = SafeFileCache(str(cache_dir))
-        serializer = CompatibleSerializer()
-        self.secure_adapter_cls = functools.partial(CacheControlAdapter, cache=cache, serializer=serializer)
-        self.insecure_adapter_cls = functools.partial(InsecureCacheControlAdapter, cache=cache, serializer=serializer)
+        adapter_kwargs: dict[str, Any] = {"cache": SafeFileCache(str(cache_dir)), "serializer": CompatibleSerializer()}
+        if max_connections:
+            adapter_kwargs.update(pool_maxsize=max_connections, pool_block=True)
+        self.secure_adapter_cls = functools.partial(CacheControlAdapter, **adapter_kwargs)
+        self.insecure_adapter_cls = functools.partial(InsecureCacheControlAdapter, **adapter_kwargs)
         super().__init__(**kwargs)
         self.headers["User-Agent"] = self._make_user_agent()
+        self.hooks["response"].append(self._count_response)
+
+    @staticmethod
+    def _count_response(resp: Response, *args: Any, **kwargs: Any) -> None:
+        profiler.count("http.requests")
+        if getattr(resp, "from_cache", False):
+            profiler.count("http.from_cache")
 
     def _make_user_agent(self) -> str:
         return user_agent.UserAgentBuilder("pdm", __version__).include_implementation().build()
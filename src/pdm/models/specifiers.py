@@ -2,15 +2,20 @@ from __future__ import annotations
 
 import json
 import re
+import threading
 import warnings
+from collections import OrderedDict
 from functools import lru_cache
 from operator import attrgetter
-from typing import Any, Iterable, Match, cast
+from typing import Any, Callable, Hashable, Iterable, Match, NamedTuple, TypeVar, cast
 
 from packaging.specifiers import InvalidSpecifier, SpecifierSet
 
 from pdm.exceptions import InvalidPyVersion
 from pdm.models.versions import Version
+from pdm.profiler import profiler
+
+_T = TypeVar("_T")
 
 
 def _read_max_versions() -> dict[Version, int]:
@@ -84,8 +89,62 @@ def _normalize_op_specifier(op: str, version_str: str) -> tuple[str, Version]:
     return op, version
 
 
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _OperationCache:
+    """A bounded LRU cache of the results of a :class:`PySpecSet` operation.
+
+    The keys are built from the bounds of the operands instead of the instances,
+    so the cache doesn't keep the operands alive. The hits and misses are counted
+    here and in the profiler, as ``pyspecset.<name>.hits`` and ``.misses``.
+    """
+
+    def __init__(self, name: str, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._hit_counter = f"pyspecset.{name}.hits"
+        self._miss_counter = f"pyspecset.{name}.misses"
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, compute: Callable[[], _T]) -> _T:
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                self._data.move_to_end(key)
+                value = self._data[key]
+                profiler.count(self._hit_counter)
+                return value
+            self.misses += 1
+        profiler.count(self._miss_counter)
+        value = compute()
+        with self._lock:
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+
 class PySpecSet(SpecifierSet):
-    """A custom SpecifierSet that supports merging with logic operators (&, |)."""
+    """A custom SpecifierSet that supports merging with logic operators (&, |).
+
+    The instances returned by :meth:`intern` and the operations are shared, and must
+    not be modified.
+    """
 
     PY_MAX_MINOR_VERSION = _read_max_versions()
     MAX_MAJOR_VERSION = max(PY_MAX_MINOR_VERSION)[:1].bump()
@@ -103,6 +162,25 @@ class PySpecSet(SpecifierSet):
         if specifiers and analyze:
             self._analyze_specifiers()
 
+    @classmethod
+    def intern(cls, specifiers: str = "") -> PySpecSet:
+        """Get a shared instance for the specifiers, to avoid parsing and analyzing
+        the same specifiers again.
+        """
+        key = (cls, specifiers.replace(" ", ""))
+        return _CACHES["intern"].get(key, lambda: cls(specifiers))
+
+    @staticmethod
+    def cache_info() -> dict[str, CacheInfo]:
+        """Get the statistics of the interned instances and the operation caches."""
+        return {name: cache.info() for name, cache in _CACHES.items()}
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Clear the interned instances and the operation caches."""
+        for cache in _CACHES.values():
+            cache.clear()
+
     def _analyze_specifiers(self) -> None:
         lower_bound, upper_bound = Version.MIN, Version.MAX
         excludes: set[Version] = set()
@@ -268,8 +346,10 @@ class PySpecSet(SpecifierSet):
         instance._excludes = self._excludes[:]
         return instance
 
-    @lru_cache
-    def __and__(self, other: PySpecSet) -> PySpecSet:
+    def __and__(self, other: PySpecSet) -> PySpecSet:  # type: ignore[override]
+        return _CACHES["and"].get((self._comp_key(), other._comp_key()), lambda: self._intersection(other))
+
+    def _intersection(self, other: PySpecSet) -> PySpecSet:
         if any(s.is_impossible for s in (self, other)):
             return ImpossiblePySpecSet()
         if self.is_allow_all:
@@ -283,8 +363,10 @@ class PySpecSet(SpecifierSet):
         rv._rearrange(lower, upper, excludes)
         return rv
 
-    @lru_cache
     def __or__(self, other: PySpecSet) -> PySpecSet:
+        return _CACHES["or"].get((self._comp_key(), other._comp_key()), lambda: self._union(other))
+
+    def _union(self, other: PySpecSet) -> PySpecSet:
         if self.is_impossible:
             return other.copy()
         elif other.is_impossible:
@@ -342,34 +424,42 @@ class PySpecSet(SpecifierSet):
                     prev = prev.bump()
                 break
 
-    @lru_cache
+    def _operand_key(self, other: str | SpecifierSet) -> Hashable:
+        return (self._comp_key(), other._comp_key() if isinstance(other, PySpecSet) else str(other))
+
     def is_superset(self, other: str | SpecifierSet) -> bool:
+        return _CACHES["is_superset"].get(self._operand_key(other), lambda: self._is_superset(other))
+
+    def _is_superset(self, other: str | SpecifierSet) -> bool:
         if self.is_impossible:
             return False
         if self.is_allow_all:
             return True
-        other = type(self)(str(other))
-        if other._upper_bound >= self.MAX_MAJOR_VERSION:
-            # XXX: narrow down the upper bound to ``MAX_MAJOR_VERSION``
-            # So that `>=3.6,<4.0` is considered a superset of `>=3.7`, see issues/66
-            other._upper_bound = self.MAX_MAJOR_VERSION
-        lower, upper, excludes = self._merge_bounds_and_excludes(other._lower_bound, other._upper_bound, self._excludes)
-        if self._lower_bound > other._lower_bound or self._upper_bound < other._upper_bound:
+        other = self.intern(str(other))
+        # XXX: narrow down the upper bound to ``MAX_MAJOR_VERSION``
+        # So that `>=3.6,<4.0` is considered a superset of `>=3.7`, see issues/66
+        other_upper = min(other._upper_bound, self.MAX_MAJOR_VERSION)
+        lower, upper, excludes = self._merge_bounds_and_excludes(other._lower_bound, other_upper, self._excludes)
+        if self._lower_bound > other._lower_bound or self._upper_bound < other_upper:
             return False
-        return lower <= other._lower_bound and upper >= other._upper_bound and set(excludes) <= set(other._excludes)
+        return lower <= other._lower_bound and upper >= other_upper and set(excludes) <= set(other._excludes)
 
-    @lru_cache
     def is_subset(self, other: str | SpecifierSet) -> bool:
+        return _CACHES["is_subset"].get(self._operand_key(other), lambda: self._is_subset(other))
+
+    def _is_subset(self, other: str | SpecifierSet) -> bool:
         if self.is_impossible:
             return False
-        other = type(self)(str(other))
-        if other._upper_bound >= self.MAX_MAJOR_VERSION:
+        other = self.intern(str(other))
+        other_upper = other._upper_bound
+        if other_upper >= self.MAX_MAJOR_VERSION:
             # Relax the upper bound to max version
-            other._upper_bound = Version.MAX
-        if other.is_allow_all:
+            other_upper = Version.MAX
+        if other._lower_bound == Version.MIN and other_upper == Version.MAX and not other._excludes:
+            # The other accepts all versions
             return True
         lower, upper, excludes = self._merge_bounds_and_excludes(self._lower_bound, self._upper_bound, other._excludes)
-        if self._lower_bound < other._lower_bound or self._upper_bound > other._upper_bound:
+        if self._lower_bound < other._lower_bound or self._upper_bound > other_upper:
             return False
         return lower <= self._lower_bound and upper >= self._upper_bound and set(self._excludes) >= set(excludes)
 
@@ -419,3 +509,8 @@ class ImpossiblePySpecSet(PySpecSet):
     @property
     def is_impossible(self) -> bool:
         return True
+
+
+# The size of each cache, large enough to hold the specifiers seen in a big resolution
+CACHE_SIZE = 8192
+_CACHES = {name: _OperationCache(name, CACHE_SIZE) for name in ("intern", "and", "or", "is_superset", "is_subset")}
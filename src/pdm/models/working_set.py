@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import importlib.machinery
 import itertools
+import os
 import sys
+import time
 from collections import ChainMap
 from pathlib import Path
-from typing import Iterable, Iterator, Mapping
+from stat import S_ISDIR
+from typing import TYPE_CHECKING, Iterable, Iterator, Mapping
 
 from pdm.compat import importlib_metadata as im
 from pdm.utils import normalize_name
 
+if TYPE_CHECKING:
+    from typing import Any
+
 default_context = im.DistributionFinder.Context()
 
 
@@ -58,26 +65,146 @@ def distributions(path: list[str]) -> Iterable[im.Distribution]:
     return itertools.chain.from_iterable(resolver(context) for resolver in resolvers)
 
 
+def _normalize_path(path: str | Path) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+class WorkingSetSnapshot:
+    """A persistent snapshot of the distributions installed in site-packages directories.
+
+    For each directory, the names and versions of the metadata directories in it are
+    stored together with the directory mtime. If the mtime is unchanged, the snapshot
+    is used as-is. Otherwise only the directory listing is read again, and only the
+    metadata of the entries that are unknown to the snapshot is parsed. The installer
+    records the distributions it installs so that they don't need parsing either.
+    """
+
+    # An mtime this close to the time of the scan is not trusted, since a following
+    # change within the timestamp granularity won't be reflected by the mtime.
+    RACY_WINDOW_NS = 2_000_000_000
+    METADATA_SUFFIXES = (".dist-info", ".egg-info")
+
+    def __init__(self, cache_file: Path | str) -> None:
+        from pdm.models.caches import SQLiteFileCache
+
+        self._cache: SQLiteFileCache[str, Any] = SQLiteFileCache(cache_file)
+
+    @staticmethod
+    def is_supported() -> bool:
+        """The snapshot can only replace the standard path-based metadata finders."""
+        path_finders: tuple[type, ...] = (importlib.machinery.PathFinder, im.MetadataPathFinder)
+        # The importlib_metadata backport may install its own finder into sys.meta_path
+        backport = sys.modules.get("importlib_metadata")
+        if backport is not None:
+            path_finders += (backport.MetadataPathFinder,)
+        for finder in sys.meta_path:
+            if getattr(finder, "find_distributions", None) is None:
+                continue
+            if not isinstance(finder, path_finders) and not (
+                isinstance(finder, type) and issubclass(finder, path_finders)
+            ):
+                return False
+        return True
+
+    def record(self, dist_path: str | Path, name: str, version: str) -> None:
+        """Record an installed distribution given the path to its metadata directory."""
+        self._cache.set(f"dist:{_normalize_path(dist_path)}", [normalize_name(name), version])
+
+    def discard(self, dist_path: str | Path) -> None:
+        """Forget a distribution that has been removed."""
+        self._cache.delete(f"dist:{_normalize_path(dist_path)}")
+
+    def _scan(self, path: str, entries: dict[str, list[str]]) -> dict[str, list[str]] | None:
+        result: dict[str, list[str]] = {}
+        for child in os.listdir(path):
+            low = child.lower()
+            if low.endswith(".egg"):
+                # Eggs are searched recursively by importlib.metadata, let it handle them.
+                return None
+            if not low.endswith(self.METADATA_SUFFIXES):
+                continue
+            if child in entries:
+                result[child] = entries[child]
+                continue
+            dist_path = os.path.join(path, child)
+            try:
+                result[child] = self._cache.get(f"dist:{_normalize_path(dist_path)}")
+            except KeyError:
+                dist = im.PathDistribution(Path(dist_path))
+                name = dist.metadata["Name"]
+                result[child] = [normalize_name(name) if name else "", dist.metadata["Version"] or ""]
+        return result
+
+    def _get_entries(self, path: str) -> dict[str, list[str]] | None:
+        """Get the metadata entries in the directory, or None if the directory
+        can't be handled by the snapshot.
+        """
+        key = f"dir:{_normalize_path(path)}"
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return {}
+        if not S_ISDIR(stat.st_mode) or path.lower().endswith(".egg"):
+            return None
+        try:
+            record = self._cache.get(key)
+        except KeyError:
+            record = {"mtime": None, "scanned_at": 0, "entries": {}}
+        if record["mtime"] == stat.st_mtime_ns and record["scanned_at"] - stat.st_mtime_ns > self.RACY_WINDOW_NS:
+            return record["entries"]
+        scanned_at = time.time_ns()
+        entries = self._scan(path, record["entries"])
+        if entries is not None:
+            self._cache.set(key, {"mtime": stat.st_mtime_ns, "scanned_at": scanned_at, "entries": entries})
+        return entries
+
+    def iter_distributions(self, paths: list[str]) -> Iterator[tuple[str, im.Distribution]]:
+        """Iterate over (normalized name, distribution) pairs found in the paths,
+        in the same order as :func:`distributions`.
+        """
+        for path in paths:
+            entries = self._get_entries(path)
+            if entries is None:
+                context = im.DistributionFinder.Context(path=[path])
+                for dist in im.MetadataPathFinder().find_distributions(context):
+                    if dist.metadata["Name"]:
+                        yield normalize_name(dist.metadata["Name"]), dist
+                continue
+            for child, (name, _) in entries.items():
+                if name:
+                    yield name, im.PathDistribution(Path(path, child))
+        for egg_link_dist in EgglinkFinder.find_distributions(im.DistributionFinder.Context(path=paths)):
+            if egg_link_dist.metadata["Name"]:
+                yield normalize_name(egg_link_dist.metadata["Name"]), egg_link_dist
+
+
 class WorkingSet(Mapping[str, im.Distribution]):
     """A dictionary of currently installed distributions"""
 
-    def __init__(self, paths: list[str] | None = None, shared_paths: list[str] | None = None) -> None:
+    def __init__(
+        self,
+        paths: list[str] | None = None,
+        shared_paths: list[str] | None = None,
+        snapshot: WorkingSetSnapshot | None = None,
+    ) -> None:
         if paths is None:
             paths = sys.path
         if shared_paths is None:
             shared_paths = []
-        self._dist_map = {
-            normalize_name(dist.metadata["Name"]): dist
-            for dist in distributions(path=list(dict.fromkeys(paths)))
-            if dist.metadata["Name"]
-        }
-        self._shared_map = {
-            normalize_name(dist.metadata["Name"]): dist
-            for dist in distributions(path=list(dict.fromkeys(shared_paths)))
-            if dist.metadata["Name"]
-        }
+        if snapshot is not None and not snapshot.is_supported():
+            snapshot = None
+        self._snapshot = snapshot
+        self._dist_map = self._load_distributions(list(dict.fromkeys(paths)))
+        self._shared_map = self._load_distributions(list(dict.fromkeys(shared_paths)))
         self._iter_map = ChainMap(self._dist_map, self._shared_map)
 
+    def _load_distributions(self, paths: list[str]) -> dict[str, im.Distribution]:
+        if self._snapshot is not None:
+            return dict(self._snapshot.iter_distributions(paths))
+        return {
+            normalize_name(dist.metadata["Name"]): dist for dist in distributions(path=paths) if dist.metadata["Name"]
+        }
+
     def __getitem__(self, key: str) -> im.Distribution:
         return self._iter_map[key]
 
@@ -0,0 +1,113 @@
+"""A lightweight profiler for the locking process.
+
+The instrumented code calls the global ``profiler`` unconditionally, which costs
+nothing more than an attribute check when profiling is not enabled.
+"""
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+_T = TypeVar("_T")
+
+
+class Profiler:
+    """Collect the wall time of phases, globally and per package, and named counters.
+
+    Phases can be nested and run in multiple threads, so the times of the phases
+    are not expected to add up to the total time.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._started = 0.0
+        self._phases: dict[str, list[float]] = {}
+        self._packages: dict[str, dict[str, list[float]]] = {}
+        self._counters: dict[str, int] = {}
+
+    def start(self) -> None:
+        """Clear the collected data and start profiling."""
+        with self._lock:
+            self._phases = defaultdict(lambda: [0, 0.0])
+            self._packages = defaultdict(lambda: defaultdict(lambda: [0, 0.0]))
+            self._counters = defaultdict(int)
+            self._started = time.perf_counter()
+            self.enabled = True
+
+    def stop(self) -> dict[str, Any]:
+        """Stop profiling and return the report."""
+        with self._lock:
+            self.enabled = False
+            total = time.perf_counter() - self._started
+
+            def render(phases: dict[str, list[float]]) -> dict[str, Any]:
+                return {
+                    name: {"count": int(count), "time": round(elapsed, 6)} for name, (count, elapsed) in phases.items()
+                }
+
+            return {
+                "total": round(total, 6),
+                "phases": render(self._phases),
+                "packages": {package: render(phases) for package, phases in sorted(self._packages.items())},
+                "counters": dict(sorted(self._counters.items())),
+            }
+
+    def record(self, name: str, elapsed: float, package: str | None = None, calls: int = 1) -> None:
+        """Add the elapsed time and calls to the phase, and to the package if given."""
+        with self._lock:
+            entry = self._phases[name]
+            entry[0] += calls
+            entry[1] += elapsed
+            if package is not None:
+                entry = self._packages[package][name]
+                entry[0] += calls
+                entry[1] += elapsed
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Increase the counter by the given value."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] += value
+
+    @contextlib.contextmanager
+    def phase(self, name: str, package: str | None = None) -> Iterator[None]:
+        """Measure the time spent in the context as a phase."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start, package)
+
+    def iterate(self, name: str, factory: Callable[[], Iterable[_T]], package: str | None = None) -> Iterator[_T]:
+        """Create an iterator with the factory and measure the time spent in producing
+        the items as a phase, for the lazy iterators whose work is done on consumption.
+        """
+        if not self.enabled:
+            return iter(factory())
+        return self._iterate(name, factory, package)
+
+    def _iterate(self, name: str, factory: Callable[[], Iterable[_T]], package: str | None) -> Iterator[_T]:
+        # The iterator may never be exhausted, record the time as soon as it is spent
+        start = time.perf_counter()
+        iterator = iter(factory())
+        self.record(name, time.perf_counter() - start, package)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.record(name, time.perf_counter() - start, package, calls=0)
+            yield item
+
+
+profiler = Profiler()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import collections
 import dataclasses
 import os
+import re
 from functools import cached_property
 from pathlib import Path
 from typing import Any, Callable, ClassVar, Iterator, Mapping, MutableMapping, cast
@@ -14,6 +15,7 @@ import tomlkit
 from pdm import termui
 from pdm._types import RepositoryConfig
 from pdm.exceptions import NoConfigError, PdmUsageError
+from pdm.models.cache_manager import CACHE_TYPES
 
 REPOSITORY = "repository"
 SOURCE = "pypi"
@@ -55,6 +57,19 @@ def ensure_boolean(val: Any) -> bool:
     return bool(val) and val.lower() not in ("false", "no", "0")
 
 
+_SIZE_UNITS = {"": 1, "b": 1, "kb": 1000, "mb": 1000**2, "gb": 1000**3, "kib": 1024, "mib": 1024**2, "gib": 1024**3}
+
+
+def parse_size(val: int | str) -> int:
+    """Coerce a size like 500MB or 2GiB to the number of bytes"""
+    if isinstance(val, int):
+        return val
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([a-z]*)\s*", val.lower())
+    if match is None or match.group(2) not in _SIZE_UNITS:
+        raise PdmUsageError(f"Invalid size: {val!r}, use a number with an optional unit like 500MB or 2GiB")
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2)])
+
+
 def split_by_comma(val: list[str] | str) -> list[str]:
     """Split a string value by comma"""
     if isinstance(val, str):
@@ -101,6 +116,19 @@ class Config(MutableMapping[str, str]):
             True,
             env_var="PDM_CACHE_DIR",
         ),
+        "cache.gc_interval": ConfigItem(
+            "Hours between the cache collections run after commands, 0 to disable",
+            24,
+            True,
+            env_var="PDM_CACHE_GC_INTERVAL",
+            coerce=float,
+        ),
+        "lockfile_cache": ConfigItem(
+            "Cache the parsed lock files in a binary form to load them faster",
+            True,
+            env_var="PDM_LOCKFILE_CACHE",
+            coerce=ensure_boolean,
+        ),
         "check_update": ConfigItem(
             "Check if there is any newer version available",
             True,
@@ -144,17 +172,53 @@ class Config(MutableMapping[str, str]):
         "strategy.inherit_metadata": ConfigItem(
             "Inherit the groups and markers from parents for each package", True, coerce=ensure_boolean
         ),
+        "strategy.incremental": ConfigItem(
+            "Resolve only the changed requirements when updating the lock file",
+            False,
+            env_var="PDM_INCREMENTAL_LOCK",
+            coerce=ensure_boolean,
+        ),
+        "strategy.prefetch_workers": ConfigItem(
+            "The number of threads to prefetch package metadata during resolution, 0 to disable",
+            4,
+            env_var="PDM_PREFETCH_WORKERS",
+            coerce=int,
+        ),
         "install.parallel": ConfigItem(
             "Whether to perform installation and uninstallation in parallel",
             True,
             env_var="PDM_INSTALL_PARALLEL",
             coerce=ensure_boolean,
         ),
+        "install.download_workers": ConfigItem(
+            "The number of threads to download packages during installation",
+            8,
+            env_var="PDM_INSTALL_DOWNLOAD_WORKERS",
+            coerce=int,
+        ),
+        "install.build_workers": ConfigItem(
+            "The number of source distributions to build at the same time, 0 to use the CPU count",
+            0,
+            env_var="PDM_INSTALL_BUILD_WORKERS",
+            coerce=int,
+        ),
+        "install.install_workers": ConfigItem(
+            "The number of threads to write packages to the disk, 0 to use the CPU count(at most 8)",
+            0,
+            env_var="PDM_INSTALL_INSTALL_WORKERS",
+            coerce=int,
+        ),
         "install.cache": ConfigItem(
             "Cache wheel installation and only put symlinks in the library root",
             False,
             coerce=ensure_boolean,
         ),
+        "install.trust_cached_wheels": ConfigItem(
+            "Skip the validation of the RECORD file for the wheels installed from the artifact or wheel caches",
+            False,
+            env_var="PDM_INSTALL_TRUST_CACHED_WHEELS",
+            coerce=ensure_boolean,
+        ),
         "install.cache_method": ConfigItem(
             "Specify how to create links to the caches(`symlink/symlink_individual/hardlink/pth`)",
             "symlink",
@@ -191,6 +255,12 @@ class Config(MutableMapping[str, str]):
             env_var="PDM_PYPI_JSON_API",
             coerce=ensure_boolean,
         ),
+        "pypi.max_connections_per_host": ConfigItem(
+            "The maximum number of concurrent connections to the same host when fetching hashes",
+            8,
+            env_var="PDM_PYPI_MAX_CONNECTIONS_PER_HOST",
+            coerce=int,
+        ),
         "venv.location": ConfigItem(
             "Parent directory for virtualenvs",
             os.path.join(platformdirs.user_data_dir("pdm"), "venvs"),
@@ -221,6 +291,13 @@ class Config(MutableMapping[str, str]):
             coerce=ensure_boolean,
         ),
     }
+    _config_map.update(
+        (
+            f"cache.{k}.max_size",
+            ConfigItem(f"The size limit of the {k} cache, e.g. 500MB, 0 for unlimited", 0, True, coerce=parse_size),
+        )
+        for k in CACHE_TYPES
+    )
     _config_map.update(
         (f"theme.{k}", ConfigItem(f"Theme color for {k}", default=v, global_only=True))
         for k, v in termui.DEFAULT_THEME.items()
@@ -42,7 +42,9 @@ if TYPE_CHECKING:
     from pdm._types import Spinner
     from pdm.core import Core
     from pdm.environments import BaseEnvironment
-    from pdm.models.caches import CandidateInfoCache, HashCache, WheelCache
+    from pdm.environments.launch import LaunchRecord
+    from pdm.models.cache_manager import CacheManager
+    from pdm.models.caches import ArtifactCache, CandidateInfoCache, HashCache, WheelCache
     from pdm.models.candidates import Candidate
     from pdm.resolver.providers import BaseProvider
 
@@ -97,7 +99,7 @@ class Project:
                 self.core.ui.info("Project is not found, fallback to the global project")
 
         self.root: Path = Path(root_path or "").absolute()
-        self.is_global = is_global
+        self.is_global: bool = is_global
         self.enable_write_lockfile = os.getenv("PDM_FROZEN_LOCKFILE", os.getenv("PDM_NO_LOCK", "0")).lower() not in (
             "1",
             "true",
@@ -114,11 +116,13 @@ class Project:
     @property
     def lockfile(self) -> Lockfile:
         if self._lockfile is None:
-            self._lockfile = Lockfile(self.root / self.LOCKFILE_FILENAME, ui=self.core.ui)
+            self.set_lockfile(self.root / self.LOCKFILE_FILENAME)
+        assert self._lockfile is not None
         return self._lockfile
 
     def set_lockfile(self, path: str | Path) -> None:
-        self._lockfile = Lockfile(path, ui=self.core.ui)
+        cache_dir = self.cache("lockfiles") if self.config["lockfile_cache"] else None
+        self._lockfile = Lockfile(path, ui=self.core.ui, cache_dir=cache_dir)
 
     @cached_property
     def config(self) -> Mapping[str, Any]:
@@ -294,6 +298,20 @@ class Project:
     def environment(self, value: BaseEnvironment) -> None:
         self._environment = value
 
+    def get_launch_record(self) -> LaunchRecord:
+        """Get the facts needed to launch a process in the project environment,
+        from the cache if valid, to avoid resolving the interpreter and the environment.
+        """
+        from pdm.environments.launch import LaunchRecord
+
+        if self._environment is not None:
+            return LaunchRecord.from_environment(self._environment)
+        record = LaunchRecord.load(self)
+        if record is None:
+            record = LaunchRecord.from_environment(self.environment)
+            record.save(self)
+        return record
+
     @property
     def python_requires(self) -> PySpecSet:
         return PySpecSet(self.pyproject.metadata.get("requires-python", ""))
@@ -402,7 +420,7 @@ class Project:
     @property
     def locked_repository(self) -> LockedRepository:
         try:
-            lockfile = self.lockfile._data.unwrap()
+            lockfile = self.lockfile.data
         except ProjectError:
             lockfile = {}
 
@@ -600,19 +618,31 @@ class Project:
     def make_wheel_cache(self) -> WheelCache:
         from pdm.models.caches import get_wheel_cache
 
-        return get_wheel_cache(self.cache("wheels"))
+        # The wheel cache is memoized by directory and creates it only once
+        return get_wheel_cache(self.cache_dir / "wheels")
 
     def make_candidate_info_cache(self) -> CandidateInfoCache:
         from pdm.models.caches import CandidateInfoCache
 
         python_hash = hashlib.sha1(str(self.environment.python_requires).encode()).hexdigest()
-        file_name = f"package_meta_{python_hash}.json"
+        file_name = f"package_meta_{python_hash}.db"
         return CandidateInfoCache(self.cache("metadata") / file_name)
 
     def make_hash_cache(self) -> HashCache:
         from pdm.models.caches import HashCache
 
-        return HashCache(directory=self.cache("hashes"))
+        return HashCache(directory=self.cache("hashes"), artifact_cache=self.make_artifact_cache())
+
+    def make_artifact_cache(self) -> ArtifactCache:
+        from pdm.models.caches import ArtifactCache
+
+        return ArtifactCache(self.cache("artifacts"), manager=self.make_cache_manager())
+
+    def make_cache_manager(self) -> CacheManager:
+        from pdm.models.cache_manager import CACHE_TYPES, CacheManager
+
+        limits = {name: self.config[f"cache.{name}.max_size"] for name in CACHE_TYPES}
+        return CacheManager(self.cache_dir, limits)
 
     def find_interpreters(
         self, python_spec: str | None = None, search_venv: bool | None = None
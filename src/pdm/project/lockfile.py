@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import contextlib
 import enum
+import hashlib
+import marshal
+import sys
 from functools import cached_property
+from pathlib import Path
 from typing import Any, Iterable, Mapping
 
 import tomlkit
 from packaging.version import Version
+from tomlkit.toml_document import TOMLDocument
 
 from pdm import termui
+from pdm.compat import tomllib
 from pdm.exceptions import PdmUsageError
 from pdm.project.toml_file import TOMLBase
 
@@ -32,27 +39,83 @@ class Compatibility(enum.IntEnum):
 
 
 class Lockfile(TOMLBase):
+    """The lock file of the project.
+
+    The file is parsed with tomlkit, to preserve the style, only when the document
+    is accessed for editing. Read-only access goes through :attr:`data`, which is
+    parsed with tomllib and, if ``cache_dir`` is given, cached in a binary form
+    keyed by the hash of the file content.
+    """
+
     spec_version = Version("4.4.1")
 
+    def __init__(self, path: str | Path, *, ui: termui.UI, cache_dir: Path | None = None) -> None:
+        self._cache_dir = cache_dir
+        super().__init__(path, ui=ui)
+
+    def reload(self) -> None:
+        self._document: TOMLDocument | None = None
+        self._plain: dict[str, Any] | None = None
+
+    @property  # type: ignore[override]
+    def _data(self) -> TOMLDocument:
+        if self._document is None:
+            self._document = self.read()
+        return self._document
+
+    @_data.setter
+    def _data(self, value: TOMLDocument) -> None:
+        self._document = value
+        self._plain = None
+
+    @property
+    def data(self) -> dict[str, Any]:
+        """The plain data of the lock file, which must not be modified."""
+        if self._plain is None:
+            self._plain = self._document.unwrap() if self._document is not None else self._read_plain()
+        return self._plain
+
+    def _read_plain(self) -> dict[str, Any]:
+        try:
+            content = self.path.read_bytes()
+        except FileNotFoundError:
+            return {}
+        cache_file: Path | None = None
+        if self._cache_dir is not None:
+            key = hashlib.sha256(content)
+            key.update(f"{sys.version_info[:2]}:{marshal.version}".encode())
+            cache_file = self._cache_dir / f"{key.hexdigest()}.marshal"
+            with contextlib.suppress(OSError, EOFError, ValueError, TypeError):
+                return marshal.loads(cache_file.read_bytes())
+        data = tomllib.loads(content.decode("utf-8"))
+        if cache_file is not None:
+            from pdm.utils import atomic_open_for_write
+
+            with contextlib.suppress(OSError, ValueError):
+                dumped = marshal.dumps(data)
+                with atomic_open_for_write(cache_file, mode="wb") as fp:
+                    fp.write(dumped)
+        return data
+
     @cached_property
     def default_strategies(self) -> set[str]:
         return {FLAG_CROSS_PLATFORM, FLAG_INHERIT_METADATA}
 
     @property
     def hash(self) -> str:
-        return self._data.get("metadata", {}).get("content_hash", "")
+        return self.data.get("metadata", {}).get("content_hash", "")
 
     @property
     def file_version(self) -> str:
-        return self._data.get("metadata", {}).get("lock_version", "")
+        return self.data.get("metadata", {}).get("lock_version", "")
 
     @property
     def groups(self) -> list[str] | None:
-        return self._data.get("metadata", {}).get("groups")
+        return self.data.get("metadata", {}).get("groups")
 
     @property
     def strategy(self) -> set[str]:
-        metadata = self._data.get("metadata", {})
+        metadata = self.data.get("metadata", {})
         if not metadata:
             return self.default_strategies.copy()
         result: set[str] = set(metadata.get("strategy", {FLAG_CROSS_PLATFORM}))
@@ -87,13 +150,19 @@ class Lockfile(TOMLBase):
         for line in GENERATED_COMMENTS:
             self._data.append(None, tomlkit.comment(line))
         self._data.update(data)
+        self._plain = None
 
     def write(self, show_message: bool = True) -> None:
         super().write()
         if show_message:
             self.ui.echo(f"Changes are written to [success]{self._path.name}[/].", verbosity=termui.Verbosity.NORMAL)
 
+    def empty(self) -> bool:
+        return not self.data
+
     def __getitem__(self, key: str) -> dict:
+        # The item can be edited in place, so the plain data is unwrapped again
+        self._plain = None
         return self._data[key]
 
     def compatibility(self) -> Compatibility:
@@ -15,7 +15,11 @@ class TOMLBase(TOMLFile):
         super().__init__(path)
         self._path = Path(path)
         self.ui = ui
-        self._data = self.read()
+        self.reload()
+
+    @property
+    def path(self) -> Path:
+        return Path(self._path)
 
     def read(self) -> TOMLDocument:
         if not self._path.exists():
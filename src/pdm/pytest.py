@@ -400,7 +400,7 @@ def project_no_init(
     p = core.create_project(tmp_path, global_config=test_home.joinpath("config.toml").as_posix())
     p.global_config["venv.location"] = str(tmp_path / "venvs")
     mocker.patch.object(BaseEnvironment, "_build_session", pdm_session)
-    mocker.patch("pdm.builders.base.EnvBuilder.get_shared_env", return_value=str(build_env))
+    mocker.patch("pdm.builders.base.EnvBuilder.get_shared_env_path", return_value=str(build_env))
     tmp_path.joinpath("caches").mkdir(parents=True)
     p.global_config["cache_dir"] = tmp_path.joinpath("caches").as_posix()
     python_path = find_python_in_path(sys.base_prefix)
@@ -462,6 +462,12 @@ def working_set(mocker: MockerFixture, repository: TestRepository) -> MockWorkin
     mocker.patch.object(BaseEnvironment, "get_working_set", return_value=rv)
 
     class MockInstallManager(InstallManager):
+        def download(self, candidate: Candidate) -> None:
+            pass
+
+        def build(self, candidate: Candidate) -> None:
+            pass
+
         def install(self, candidate: Candidate) -> Distribution:  # type: ignore[override]
             key = normalize_name(candidate.name or "")
             version, dependencies = repository.get_raw_dependencies(candidate)
@@ -36,7 +36,11 @@ def resolve(
     requirements.append(PythonRequirement.from_pyspec_set(requires_python))
     provider = cast(BaseProvider, resolver.provider)
     repository = cast(BaseRepository, provider.repository)
-    result = resolver.resolve(requirements, max_rounds)
+    try:
+        result = resolver.resolve(requirements, max_rounds)
+    finally:
+        if provider.prefetcher is not None:
+            provider.prefetcher.shutdown()
 
     if repository.has_warnings:
         repository.environment.project.core.ui.info(
@@ -0,0 +1,150 @@
+"""Update a lock file by resolving only the part of the dependency graph affected
+by the changed requirements, instead of resolving all requirements again.
+"""
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING, cast
+
+from resolvelib.resolvers import Criterion, RequirementInformation, Result
+
+from pdm.models.requirements import parse_requirement, strip_extras
+from pdm.models.specifiers import PySpecSet
+from pdm.resolver.core import resolve
+from pdm.resolver.graph import merge_markers, populate_groups
+from pdm.resolver.providers import BaseProvider
+from pdm.termui import logger
+from pdm.utils import normalize_name
+
+if TYPE_CHECKING:
+    from typing import Iterable
+
+    from resolvelib.resolvers import Resolver
+
+    from pdm.models.candidates import Candidate
+    from pdm.models.repositories import LockedRepository
+    from pdm.models.requirements import Requirement
+
+
+def resolve_incremental(
+    resolver: Resolver,
+    locked_repository: LockedRepository,
+    requirements: list[Requirement],
+    requires_python: PySpecSet,
+    max_rounds: int = 10000,
+    tracked_names: Iterable[str] = (),
+    inherit_metadata: bool = False,
+) -> tuple[dict[str, Candidate], dict[tuple[str, str | None], list[Requirement]]] | None:
+    """Resolve the requirements reusing the locked dependency graph.
+
+    The requirements satisfied by the locked pins, except the tracked ones, are
+    unchanged. The part of the locked graph reachable from them is kept as is, and
+    only the changed requirements are resolved, preferring the locked pins. The
+    groups and markers are computed again over the merged graph.
+
+    Return the same as :func:`pdm.resolver.core.resolve`, or None if the lock can't
+    be updated incrementally, in which case a full resolution is needed.
+    """
+    provider = cast(BaseProvider, resolver.provider)
+    project = locked_repository.environment.project
+    tracked = {normalize_name(strip_extras(name)[0]) for name in tracked_names}
+    local_name = normalize_name(project.name) if project.is_distribution else None
+
+    locked: dict[str, Candidate] = {}
+    locked_dependencies: dict[str, list[Requirement]] = {}
+    for key, candidate in locked_repository.packages.items():
+        identifier = candidate.identify()
+        if identifier in locked:
+            logger.debug("Multiple pins of %s are locked, can't lock incrementally", identifier)
+            return None
+        reqs, python_requires, summary = locked_repository.candidate_info[key]
+        candidate.summary = summary
+        candidate.requires_python = python_requires
+        locked[identifier] = candidate
+        locked_dependencies[identifier] = list(map(parse_requirement, reqs))
+
+    changed: list[Requirement] = []
+    unchanged: list[Requirement] = []
+    for req in requirements:
+        if req.key is None or local_name is not None and normalize_name(req.key) == local_name:
+            return None
+        pin = locked.get(req.identify())
+        if pin is None or normalize_name(req.key) in tracked or not _is_locked_by(req, pin, provider):
+            changed.append(req)
+        else:
+            unchanged.append(req)
+
+    # Keep the locked subgraph reachable from the unchanged requirements
+    kept: dict[str, Candidate] = {}
+    stack = [req.identify() for req in unchanged]
+    while stack:
+        identifier = stack.pop()
+        if identifier in kept:
+            continue
+        if identifier not in locked:
+            logger.debug("%s is missing from the lock file, can't lock incrementally", identifier)
+            return None
+        candidate = kept[identifier] = locked[identifier]
+        if not PySpecSet.intern(candidate.requires_python).is_superset(requires_python):
+            logger.debug("%s doesn't support the project's Python, can't lock incrementally", identifier)
+            return None
+        stack.extend(dep.identify() for dep in locked_dependencies[identifier] if dep.key is not None)
+
+    mapping = dict(kept)
+    dependencies = {candidate.dep_key: locked_dependencies[key] for key, candidate in kept.items()}
+    if changed:
+        logger.debug("Resolving the changed requirements: %s", ", ".join(r.identify() for r in changed))
+        resolved, fetched = resolve(resolver, changed, requires_python, max_rounds)
+        for identifier, candidate in resolved.items():
+            if identifier in kept:
+                if kept[identifier].version != candidate.version:
+                    logger.debug("%s conflicts with the locked pin, can't lock incrementally", identifier)
+                    return None
+                continue
+            mapping[identifier] = candidate
+            dependencies[candidate.dep_key] = fetched[candidate.dep_key]
+
+    if inherit_metadata:
+        _populate_metadata(mapping, dependencies, requirements)
+    return mapping, dependencies
+
+
+def _is_locked_by(req: Requirement, pin: Candidate, provider: BaseProvider) -> bool:
+    """Check if the requirement is the one the pin was locked for."""
+    if req.is_named:
+        # A named requirement isn't satisfied by a pin of a URL or an editable requirement
+        return pin.req.is_named and provider.is_satisfied_by(req, pin)
+    return req.editable == pin.req.editable and req.as_line() == pin.req.as_line()
+
+
+def _populate_metadata(
+    mapping: dict[str, Candidate],
+    dependencies: dict[tuple[str, str | None], list[Requirement]],
+    requirements: list[Requirement],
+) -> None:
+    """Compute the groups and markers of the candidates over the whole graph, in the same
+    way as they are computed from the result of a resolution.
+    """
+    # The stubs of resolvelib don't declare the constructors of these classes
+    information: dict[str, list[RequirementInformation[Requirement, Candidate]]] = {key: [] for key in mapping}
+    for req in requirements:
+        if req.identify() in information:
+            information[req.identify()].append(RequirementInformation(req, None))  # type: ignore[call-arg,arg-type]
+    for candidate in mapping.values():
+        for dep in dependencies[candidate.dep_key]:
+            if dep.key is not None and dep.identify() in information:
+                information[dep.identify()].append(RequirementInformation(dep, candidate))  # type: ignore[call-arg,arg-type]
+    criteria: dict[str, Criterion[Requirement, Candidate, str]] = {
+        key: Criterion([mapping[key]], info, [])  # type: ignore[call-arg]
+        for key, info in information.items()
+    }
+    result: Result[Requirement, Candidate, str] = Result(mapping, None, criteria)  # type: ignore[call-arg]
+
+    all_markers = merge_markers(result)
+    populate_groups(result)
+    for key, candidate in list(mapping.items()):
+        marker = all_markers[key]
+        if marker.is_empty():
+            del mapping[key]
+            continue
+        candidate.req = dataclasses.replace(candidate.req, marker=None if marker.is_any() else marker)
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from pdm.termui import logger
+from pdm.utils import normalize_name
+
+if TYPE_CHECKING:
+    from pdm.models.candidates import Candidate
+    from pdm.models.repositories import BaseRepository
+
+
+class MetadataPrefetcher:
+    """Fetch the metadata of candidates in background threads, ahead of the resolver.
+
+    The results are kept in memory by the repository for this resolution, where
+    they are picked up by ``BaseRepository.get_dependencies()``. So the resolution
+    result doesn't depend on whether a candidate has been prefetched or not.
+    """
+
+    def __init__(self, repository: BaseRepository, max_workers: int) -> None:
+        self.repository = repository
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="pdm-prefetch")
+        self._futures: dict[tuple[str, str | None], Future[None]] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def should_prefetch(self, candidate: Candidate) -> bool:
+        """Only prefetch named candidates from wheels, whose metadata can be
+        retrieved without running a build backend.
+        """
+        project = self.repository.environment.project
+        if not candidate.req.is_named or not candidate.name or not candidate.version:
+            return False
+        if project.name and normalize_name(candidate.name) == normalize_name(project.name):
+            return False
+        return candidate.link is not None and candidate.link.is_wheel
+
+    def submit(self, candidate: Candidate) -> None:
+        """Schedule a prefetch of the candidate's dependencies, if not yet."""
+        if not self.should_prefetch(candidate):
+            return
+        key = candidate.dep_key
+        with self._lock:
+            if self._closed or key in self._futures:
+                return
+            logger.debug("Prefetching metadata for %s", candidate)
+            self._futures[key] = self._executor.submit(self.repository.prefetch_dependencies, candidate)
+
+    def wait(self, candidate: Candidate) -> None:
+        """Wait for the in-flight prefetch of the candidate, if any.
+
+        Errors are not raised here but left to the following ``get_dependencies()``
+        call, which will retry and report them in the usual way.
+        """
+        with self._lock:
+            future = self._futures.get(candidate.dep_key)
+        if future is None or future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            logger.debug("Failed to prefetch metadata for %s: %s", candidate, exc)
+
+    def shutdown(self) -> None:
+        """Cancel the pending prefetches and wait for the running ones."""
+        with self._lock:
+            self._closed = True
+            for future in self._futures.values():
+                future.cancel()
+        self._executor.shutdown(wait=True)
@@ -13,6 +13,8 @@ from pdm.exceptions import InvalidPyVersion, RequirementError
 from pdm.models.candidates import Candidate
 from pdm.models.repositories import LockedRepository
 from pdm.models.requirements import FileRequirement, parse_requirement, strip_extras
+from pdm.profiler import profiler
+from pdm.resolver.prefetch import MetadataPrefetcher
 from pdm.resolver.python import PythonCandidate, PythonRequirement, find_python_matches, is_python_satisfied_by
 from pdm.termui import logger
 from pdm.utils import deprecation_warning, is_url, normalize_name, url_without_fragments
@@ -62,7 +64,7 @@ class BaseProvider(AbstractProvider):
         allow_prereleases: bool | None = None,
         overrides: dict[str, str] | None = None,
         direct_minimal_versions: bool = False,
-        locked_candidates: dict[str, Candidate] | None = None,
+        locked_candidates: Mapping[str, Candidate] | None = None,
     ) -> None:
         if overrides is not None:  # pragma: no cover
             deprecation_warning(
@@ -90,6 +92,10 @@ class BaseProvider(AbstractProvider):
         self.direct_minimal_versions = direct_minimal_versions
         self.locked_candidates = locked_candidates
         self._known_depth: dict[str, int] = {}
+        prefetch_workers = int(project.config["strategy.prefetch_workers"])
+        self.prefetcher: MetadataPrefetcher | None = None
+        if prefetch_workers > 0 and not isinstance(repository, LockedRepository):
+            self.prefetcher = MetadataPrefetcher(repository, prefetch_workers)
 
     def requirement_preference(self, requirement: Requirement) -> Comparable:
         """Return the preference of a requirement to find candidates.
@@ -205,6 +211,15 @@ class BaseProvider(AbstractProvider):
                 minimal_version=self.direct_minimal_versions and self._is_direct_requirement(requirement),
             )
 
+    def _prefetch_first(self, candidates: Iterator[Candidate]) -> Iterator[Candidate]:
+        """Yield the candidates and prefetch the metadata of the first one, which is
+        the one the resolver is going to ask dependencies for.
+        """
+        for i, candidate in enumerate(candidates):
+            if i == 0 and self.prefetcher is not None:
+                self.prefetcher.submit(candidate)
+            yield candidate
+
     def find_matches(
         self,
         identifier: str,
@@ -212,6 +227,9 @@ class BaseProvider(AbstractProvider):
         incompatibilities: Mapping[str, Iterator[Candidate]],
     ) -> Callable[[], Iterator[Candidate]]:
         def matches_gen() -> Iterator[Candidate]:
+            return self._prefetch_first(profiler.iterate("find_matches", _matches_gen, identifier))
+
+        def _matches_gen() -> Iterator[Candidate]:
             incompat = list(incompatibilities[identifier])
             if identifier == "python":
                 candidates = find_python_matches(identifier, requirements)
@@ -274,6 +292,12 @@ class BaseProvider(AbstractProvider):
     def get_dependencies(self, candidate: Candidate) -> list[Requirement]:
         if isinstance(candidate, PythonCandidate):
             return []
+        with profiler.phase("get_dependencies", candidate.identify()):
+            return self._get_dependencies(candidate)
+
+    def _get_dependencies(self, candidate: Candidate) -> list[Requirement]:
+        if self.prefetcher is not None:
+            self.prefetcher.wait(candidate)
         try:
             deps, requires_python, _ = self.repository.get_dependencies(candidate)
         except (RequirementError, InvalidPyVersion, InvalidSpecifier) as e:
@@ -346,6 +370,9 @@ class ReusePinProvider(BaseProvider):
         super_find = super().find_matches(identifier, requirements, incompatibilities)
 
         def matches_gen() -> Iterator[Candidate]:
+            return self._prefetch_first(_matches_gen())
+
+        def _matches_gen() -> Iterator[Candidate]:
             requested_req = next(filter(lambda r: r.is_named, requirements[identifier]), None)
             pin = self.get_reuse_candidate(identifier, requested_req)
             if pin is not None:
@@ -42,4 +42,4 @@ def find_python_matches(
 
 
 def is_python_satisfied_by(requirement: Requirement, candidate: Candidate) -> bool:
-    return cast(PySpecSet, requirement.specifier).is_superset(candidate.req.specifier)
+    return cast(PySpecSet, requirement.specifier).is_superset(candidate.req.specifier or "")
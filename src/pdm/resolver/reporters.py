@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 from resolvelib import BaseReporter
 
 from pdm import termui
+from pdm.profiler import profiler
 
 if TYPE_CHECKING:
     from resolvelib.resolvers import Criterion, RequirementInformation, State
@@ -28,6 +29,7 @@ class SpinnerReporter(BaseReporter):
         self._previous: dict[str, Candidate] | None = None
 
     def starting_round(self, index: int) -> None:
+        profiler.count("resolver.rounds")
         log_title(f"Starting round {index}")
 
     def starting(self) -> None:
@@ -72,6 +74,7 @@ class SpinnerReporter(BaseReporter):
         logger.info("  Adding requirement %s%s", requirement.as_line(), parent_line)
 
     def rejecting_candidate(self, criterion: Criterion, candidate: Candidate) -> None:
+        profiler.count("resolver.rejected_candidates")
         if not criterion.information:
             logger.info("Candidate rejected because it contains invalid metadata: %s", candidate)
             return
@@ -1,9 +1,17 @@
+import os
 import tarfile
+import time
 import zipfile
 
 import pytest
 
+from pdm.builders import WheelBuilder
+from pdm.builders.base import EnvBuilder
 from pdm.cli.commands.build import Command
+from pdm.exceptions import PDMDeprecationWarning
+
+# Saved before it is mocked by the project fixture
+_get_shared_env_path = EnvBuilder.get_shared_env_path
 
 pytestmark = pytest.mark.usefixtures("local_finder")
 
@@ -161,3 +169,53 @@ def test_build_ignoring_pip_environment(fixture_project, monkeypatch):
     project = fixture_project("demo-module")
     monkeypatch.setenv("PIP_REQUIRE_VIRTUALENV", "1")
     Command.do_build(project)
+
+
+def test_shared_build_env_keyed_by_requires(project, tmp_path):
+    def make_builder(name, requires):
+        src_dir = tmp_path / name
+        src_dir.mkdir()
+        src_dir.joinpath("pyproject.toml").write_text(
+            f'[build-system]\nrequires = {requires!r}\nbuild-backend = "setuptools.build_meta"\n'
+        )
+        return WheelBuilder(src_dir, project.environment)
+
+    first = make_builder("first", ["setuptools", "wheel"])
+    second = make_builder("second", ["wheel", "setuptools"])
+    third = make_builder("third", ["hatchling"])
+    key = first.get_shared_env_key()
+    assert second.get_shared_env_key() == key
+    assert third.get_shared_env_key() != key
+    assert _get_shared_env_path(first, key) == str(project.cache("build_envs") / key)
+
+
+def test_shared_build_env_expires(project, tmp_path, mocker):
+    src_dir = tmp_path / "demo"
+    src_dir.mkdir()
+    src_dir.joinpath("pyproject.toml").write_text(
+        '[build-system]\nrequires = ["setuptools"]\nbuild-backend = "setuptools.build_meta"\n'
+    )
+    builder = WheelBuilder(src_dir, project.environment)
+    shared = tmp_path / "shared"
+    builder._prefix.shared = str(shared)
+    installed = mocker.patch.object(EnvBuilder, "_install")
+
+    builder.install(["setuptools"], shared=True)
+    installed.assert_called_once_with(["setuptools"], str(shared))
+    stamp = shared / EnvBuilder.SHARED_ENV_STAMP
+    assert stamp.exists()
+
+    shared.joinpath("fresh.txt").touch()
+    builder.install(["setuptools"], shared=True)
+    assert shared.joinpath("fresh.txt").exists()
+
+    expired = time.time() - EnvBuilder.SHARED_ENV_TTL - 60
+    os.utime(stamp, (expired, expired))
+    builder.install(["setuptools"], shared=True)
+    assert not shared.joinpath("fresh.txt").exists()
+
+
+def test_get_shared_env_classmethod_is_deprecated():
+    with pytest.warns(PDMDeprecationWarning):
+        path = EnvBuilder.get_shared_env(0)
+    assert os.path.isdir(path)
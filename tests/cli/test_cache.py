@@ -1,7 +1,11 @@
+import hashlib
+import os
+
 import pytest
 from unearth import Link
 
 from pdm.installers.packages import CachedPackage
+from pdm.models.cache_manager import CacheManager
 from tests import FIXTURES
 
 
@@ -161,6 +165,28 @@ def test_hash_cache(project, url, hash):
         assert hash_cache.get_hash(Link(url), finder.session) == hash
 
 
+def test_hash_cache_uses_known_hash(project, mocker):
+    hash_cache = project.make_hash_cache()
+    get_file_hash = mocker.patch.object(hash_cache, "_get_file_hash")
+    link = Link("http://fixtures.test/artifacts/demo-0.0.1.tar.gz")
+    with project.environment.get_finder() as finder:
+        assert hash_cache.get_hash(link, finder.session, known="sha256:abcdef") == "sha256:abcdef"
+    get_file_hash.assert_not_called()
+    assert hash_cache.get(link.url_without_fragment) == "sha256:abcdef"
+
+
+@pytest.mark.usefixtures("local_finder")
+def test_hash_cache_saves_downloaded_artifact(project):
+    hash_cache = project.make_hash_cache()
+    link = Link("http://fixtures.test/artifacts/demo-0.0.1.tar.gz")
+    with project.environment.get_finder() as finder:
+        hash_value = hash_cache.get_hash(link, finder.session)
+    expected = hashlib.sha256((FIXTURES / "artifacts/demo-0.0.1.tar.gz").read_bytes()).hexdigest()
+    assert hash_value == f"sha256:{expected}"
+    cached = project.make_artifact_cache().get(hash_value)
+    assert cached is not None and cached.name == "demo-0.0.1.tar.gz"
+
+
 def test_clear_package_cache(project, pdm):
     pkg = CachedPackage(project.cache("packages") / "test_package")
     pkg.path.mkdir()
@@ -173,3 +199,186 @@ def test_clear_package_cache(project, pdm):
     refer_pkg.rmdir()
     pdm(["cache", "clear", "packages"], obj=project, strict=True)
     assert not pkg.path.exists()
+
+
+def test_package_referrer_log(project):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from pdm.installers.packages import ReferrerIndex
+
+    root = project.cache("packages")
+    pkg = CachedPackage(root / "test_package")
+    pkg.path.mkdir()
+    # The referrers file of older versions is still readable
+    legacy = project.root / "legacy"
+    legacy.mkdir()
+    pkg.path.joinpath("referrers").write_text(f"{os.path.normcase(legacy)}\n")
+    refer_paths = [project.root / f"refer_{i}" for i in range(20)]
+    for path in refer_paths:
+        path.mkdir()
+
+    def add_referrer(path):
+        CachedPackage(pkg.path).add_referrer(str(path))
+
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(add_referrer, refer_paths))
+    expected = {os.path.normcase(path) for path in [legacy, *refer_paths]}
+    assert CachedPackage(pkg.path).referrers == expected
+    assert ReferrerIndex(root).counts() == {pkg.path.name: len(expected)}
+
+    for path in refer_paths[:-1]:
+        pkg.remove_referrer(str(path))
+    # The log is compacted once it has too many stale lines
+    lines = pkg.path.joinpath("referrers").read_text().splitlines()
+    assert len(lines) < len(refer_paths)
+    assert pkg.referrers == {os.path.normcase(legacy), os.path.normcase(refer_paths[-1])}
+    assert ReferrerIndex(root).counts() == {pkg.path.name: 2}
+
+    pkg.remove_referrer(str(legacy))
+    pkg.remove_referrer(str(refer_paths[-1]))
+    assert not pkg.path.exists()
+    assert ReferrerIndex(root).counts() == {}
+
+
+def test_candidate_info_cache_migrate_from_json(project):
+    from pdm.models.caches import CandidateInfoCache
+    from pdm.models.candidates import Candidate
+    from pdm.models.requirements import parse_requirement
+
+    cache_file = project.cache("metadata") / "package_meta_test.db"
+    legacy_file = cache_file.with_suffix(".json")
+    legacy_file.write_text('{"foo-1.0": [["bar>=1.0"], ">=3.7", "Foo package"]}')
+    cache = CandidateInfoCache(cache_file)
+    assert not legacy_file.exists()
+
+    foo = Candidate(parse_requirement("foo"), version="1.0")
+    assert foo in cache
+    assert cache.get(foo) == [["bar>=1.0"], ">=3.7", "Foo package"]
+
+    baz = Candidate(parse_requirement("baz"), version="2.0")
+    cache.set(baz, ([], "", "Baz package"))
+    # The entries are visible to other cache instances immediately
+    other = CandidateInfoCache(cache_file)
+    assert other.get(baz) == [[], "", "Baz package"]
+    other.delete(foo)
+    assert foo not in cache
+    cache.clear()
+    assert baz not in other
+
+
+def test_cache_prune_artifacts(project, pdm):
+    artifact_cache = project.make_artifact_cache()
+    source = project.root / "foo-0.1.0.tar.gz"
+    source.write_bytes(b"foo")
+    old = artifact_cache.add(source)
+    source.write_bytes(b"bar")
+    new = artifact_cache.add(source)
+    os.utime(old, (0, 0))
+
+    result = pdm(["cache", "prune", "--days", "1"], obj=project, strict=True)
+    assert "1 file removed" in result.output
+    assert not old.exists()
+    assert new.exists()
+    assert artifact_cache.get(f"sha256:{hashlib.sha256(b'bar').hexdigest()}") == new
+
+
+def test_cache_gc_evicts_least_recently_used(project, pdm):
+    project.global_config["cache.wheels.max_size"] = "250b"
+    cache_dir = project.cache("wheels") / "arbitrary/path"
+    cache_dir.mkdir(parents=True)
+    for i, name in enumerate(("foo-0.1.0.whl", "bar-0.2.0.whl", "baz-0.3.0.whl")):
+        wheel = cache_dir / name
+        wheel.write_bytes(b"x" * 100)
+        os.utime(wheel, (1000 * (i + 1), 1000 * (i + 1)))
+
+    result = pdm(["cache", "gc"], obj=project, strict=True)
+    assert "1 entry removed, 100 bytes freed" in result.output
+    assert not (cache_dir / "foo-0.1.0.whl").exists()
+    assert (cache_dir / "bar-0.2.0.whl").exists()
+    assert (cache_dir / "baz-0.3.0.whl").exists()
+    assert project.make_cache_manager().get_usage("wheels")[:2] == (2, 200)
+
+
+def test_cache_gc_keeps_sqlite_stores(project, pdm):
+    project.global_config["cache.metadata.max_size"] = "1"
+    metadata_dir = project.cache("metadata")
+    stores = [metadata_dir / name for name in ("working_set.db", "working_set.db-wal", "working_set.db-shm")]
+    for store in stores:
+        store.write_bytes(b"x" * 100)
+    stale = metadata_dir / "foo.json"
+    stale.write_text("{}")
+
+    pdm(["cache", "gc", "metadata"], obj=project, strict=True)
+    assert all(store.exists() for store in stores)
+    assert not stale.exists()
+
+
+def test_cache_gc_removes_build_env_lock(project, pdm):
+    project.global_config["cache.build_envs.max_size"] = "1"
+    env = project.cache("build_envs") / "abcdef"
+    env.joinpath("bin").mkdir(parents=True)
+    env.joinpath("bin/python").write_text("python")
+    lock_file = env.with_name("abcdef.lock")
+    lock_file.touch()
+    assert project.make_cache_manager().scan("build_envs")[:2] == (2, 6)
+
+    pdm(["cache", "gc", "build_envs"], obj=project, strict=True)
+    assert not env.exists()
+    assert not lock_file.exists()
+
+
+def test_cache_gc_keeps_referenced_packages(project, pdm):
+    project.global_config["cache.packages.max_size"] = "1"
+    used = CachedPackage(project.cache("packages") / "used")
+    used.path.mkdir()
+    used.add_referrer(str(project.root))
+    unused = CachedPackage(project.cache("packages") / "unused")
+    unused.path.mkdir()
+    unused.path.joinpath("foo.py").write_text("foo")
+
+    pdm(["cache", "gc", "packages"], obj=project, strict=True)
+    assert used.path.exists()
+    assert not unused.path.exists()
+
+
+@pytest.mark.usefixtures("prepare_wheel_cache")
+def test_cache_info_reads_from_index(project, pdm):
+    result = pdm(["cache", "info"], obj=project, strict=True)
+    assert "Files: 4" in result.output.splitlines()[6]
+    (project.cache("wheels") / "arbitrary/path/new-0.1.0.whl").touch()
+    result = pdm(["cache", "info"], obj=project, strict=True)
+    assert "Files: 4" in result.output.splitlines()[6]
+    # The caches are scanned again once the index is older than the GC interval
+    with project.make_cache_manager()._connect() as conn:
+        conn.execute("UPDATE usage SET scanned_at = 0")
+    result = pdm(["cache", "info"], obj=project, strict=True)
+    assert "Files: 5" in result.output.splitlines()[6]
+    # Commands changing the caches refresh the index
+    pdm(["cache", "remove", "ba*"], obj=project, strict=True)
+    result = pdm(["cache", "info"], obj=project, strict=True)
+    assert "Files: 3" in result.output.splitlines()[6]
+
+
+def test_cache_usage_kept_current_by_writers(project, mocker):
+    manager = project.make_cache_manager()
+    assert manager.get_usage("artifacts")[:2] == (0, 0)
+    source = project.root / "foo-0.1.0.tar.gz"
+    source.write_bytes(b"x" * 100)
+    project.make_artifact_cache().add(source)
+
+    scan = mocker.patch.object(CacheManager, "scan")
+    assert project.make_cache_manager().get_usage("artifacts")[:2] == (1, 100)
+    # The caches without a size limit are never collected
+    project.make_cache_manager().gc_step(0)
+    scan.assert_not_called()
+
+
+def test_cache_gc_step_waits_for_stamp(project, mocker):
+    project.global_config["cache.wheels.max_size"] = "1"
+    collect = mocker.patch.object(CacheManager, "collect", return_value=(0, 0))
+    project.make_cache_manager().gc_step(3600)
+    collect.assert_called_once_with("wheels")
+    # The index isn't opened again until the next step is due
+    connect = mocker.spy(CacheManager, "_connect")
+    project.make_cache_manager().gc_step(3600)
+    connect.assert_not_called()
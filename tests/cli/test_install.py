@@ -255,15 +255,11 @@ def test_install_fail_fast(project, pdm, mocker):
         side_effect=RuntimeError,
     )
     mocker.patch("multiprocessing.cpu_count", return_value=1)
+    project.project_config["install.download_workers"] = 1
     result = pdm(["install", "--fail-fast"], obj=project)
     assert result.exit_code == 1
-    handler.assert_has_calls(
-        [
-            mocker.call("certifi", mocker.ANY),
-            mocker.call("chardet", mocker.ANY),
-        ],
-        any_order=True,
-    )
+    # The jobs queued after the failed one are dropped
+    handler.assert_called_once_with("certifi", mocker.ANY)
 
 
 @pytest.mark.usefixtures("working_set")
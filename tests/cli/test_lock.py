@@ -1,3 +1,4 @@
+import json
 import sys
 from unittest.mock import ANY
 
@@ -9,13 +10,23 @@ from pdm.cli import actions
 from pdm.exceptions import PdmUsageError
 from pdm.models.requirements import parse_requirement
 from pdm.models.specifiers import PySpecSet
+from pdm.profiler import profiler
 from pdm.project.lockfile import FLAG_CROSS_PLATFORM, Compatibility
+from pdm.resolver import incremental
 
 
 def test_lock_command(project, pdm, mocker):
     m = mocker.patch.object(actions, "do_lock")
     pdm(["lock"], obj=project)
-    m.assert_called_with(project, refresh=False, groups=["default"], hooks=ANY, strategy_change=None, strategy="all")
+    m.assert_called_with(
+        project,
+        refresh=False,
+        groups=["default"],
+        hooks=ANY,
+        strategy_change=None,
+        strategy="all",
+        incremental=None,
+    )
 
 
 @pytest.mark.usefixtures("repository")
@@ -28,6 +39,37 @@ def test_lock_dependencies(project):
         assert package in locked
 
 
+@pytest.mark.usefixtures("repository")
+def test_lock_profile(project, pdm, tmp_path):
+    project.add_dependencies({"requests": parse_requirement("requests")})
+    report_file = tmp_path / "profile.json"
+    pdm(["lock", "--profile", str(report_file)], obj=project, strict=True)
+    report = json.loads(report_file.read_text())
+    assert not profiler.enabled
+    assert report["total"] > 0
+    for phase in ("resolve", "find_matches", "get_dependencies", "fetch_hashes", "format_lockfile"):
+        assert report["phases"][phase]["count"] > 0
+    assert report["packages"]["requests"]["get_dependencies"]["count"] > 0
+    assert report["counters"]["resolver.rounds"] > 0
+
+
+@pytest.mark.usefixtures("repository")
+def test_lock_incremental(project, pdm, mocker):
+    project.add_dependencies({"requests": parse_requirement("requests"), "django": parse_requirement("django")})
+    pdm(["lock"], obj=project, strict=True)
+    full_lock = project.lockfile._path.read_text()
+    pdm(["remove", "--no-sync", "django"], obj=project, strict=True)
+    assert "django" not in project.locked_repository.all_candidates
+
+    resolve = mocker.spy(incremental, "resolve")
+    project.add_dependencies({"django": parse_requirement("django")})
+    pdm(["lock", "--incremental"], obj=project, strict=True)
+    resolve.assert_called_once()
+    # The python requirement is added by the resolution
+    assert [req.identify() for req in resolve.call_args[0][1]] == ["django", "python"]
+    assert project.lockfile._path.read_text() == full_lock
+
+
 @pytest.mark.parametrize("args", [("-S", "static_urls"), ("--static-urls",)])
 def test_lock_refresh(pdm, project, repository, args):
     project.add_dependencies({"requests": parse_requirement("requests")})
@@ -62,6 +104,25 @@ def test_lock_refresh(pdm, project, repository, args):
     assert package["files"] == [{"url": url, "hash": hash} for url, hash in sorted(url_hashes.items())]
 
 
+@pytest.mark.parametrize("static_urls", [False, True])
+def test_lock_refresh_reuses_locked_hashes(pdm, project, repository, static_urls):
+    project.add_dependencies({"requests": parse_requirement("requests")})
+    url = "http://example.com/requests-2.19.1-py3-none-any.whl"
+    repository.get_hashes = (
+        lambda c: [{"url": url, "file": Link(url).filename, "hash": "sha256:abcdef"}]
+        if c.identify() == "requests"
+        else []
+    )
+    pdm(["lock", *(["--static-urls"] if static_urls else [])], obj=project, strict=True)
+
+    known_hashes = {}
+    repository.get_hashes = lambda c: known_hashes.update(repository._known_hashes) or []
+    result = pdm(["lock", "--refresh", "-v"], obj=project, strict=True)
+    # The files locked with URLs are only known by their URLs, not by the filenames
+    assert known_hashes == {url if static_urls else Link(url).filename: "sha256:abcdef"}
+    assert "Fetched hashes for requests" in result.stderr
+
+
 def test_lock_refresh_keep_consistent(pdm, project, repository):
     project.add_dependencies({"requests": parse_requirement("requests")})
     result = pdm(["lock"], obj=project)
@@ -1,4 +1,7 @@
+import argparse
+import importlib
 import json
+import pkgutil
 from pathlib import Path
 
 import pytest
@@ -33,6 +36,24 @@ def test_help_option(pdm):
     assert "Usage: pdm [-h]" in result.output
 
 
+def test_builtin_commands_manifest():
+    from pdm.cli import commands
+
+    modules = {
+        name
+        for _, name, _ in pkgutil.iter_modules(commands.__path__)
+        if hasattr(importlib.import_module(f"pdm.cli.commands.{name}"), "Command")
+    }
+    assert modules == {module for _, module, _, _ in commands.BUILTIN_COMMANDS}
+    for name, module, help_text, aliases in commands.BUILTIN_COMMANDS:
+        command = importlib.import_module(f"pdm.cli.commands.{module}").Command
+        assert (command.name or module) == name
+        assert (command.description or command.__doc__) == help_text
+        subparsers = argparse.ArgumentParser().add_subparsers()
+        command.register_to(subparsers, name)
+        assert set(subparsers.choices) == {name, *aliases}
+
+
 def test_pep582_option(pdm):
     result = pdm(["--pep582", "bash"])
     assert result.exit_code == 0
@@ -1,7 +1,9 @@
 import json
 import os
 import subprocess
+import sys
 import textwrap
+import time
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -634,6 +636,159 @@ def test_composite_inherit_env(project, pdm, capfd, _echo):
     assert "Second CALLED with VAR=overriden" in out
 
 
+def test_composite_parallel_runs_in_dependency_order(project, pdm, _echo):
+    project.root.joinpath("log.py").write_text(
+        "import sys\nwith open('log.txt', 'a') as f:\n    f.write(sys.argv[1] + '\\n')\nprint(sys.argv[1], 'DONE')\n"
+    )
+    project.pyproject.settings["scripts"] = {
+        "gen": "python log.py gen",
+        "lint": "python log.py lint",
+        "test": {"cmd": "python log.py test", "depends": ["gen"]},
+        "docs": {"cmd": "python log.py docs", "depends": ["gen", "test"]},
+        "ci": {"composite": ["docs", "lint", "test"], "parallel": True, "jobs": 2},
+    }
+    project.pyproject.write()
+    result = pdm(["run", "ci"], strict=True, obj=project)
+    order = project.root.joinpath("log.txt").read_text().split()
+    assert sorted(order) == ["docs", "gen", "lint", "test"]
+    assert order.index("gen") < order.index("test") < order.index("docs")
+    for name in ("gen", "lint", "test", "docs"):
+        assert f"{name.ljust(4)} | {name} DONE" in result.output
+
+
+def test_composite_parallel_cancels_on_first_failure(project, pdm):
+    project.pyproject.settings["scripts"] = {
+        "fail": "python -c 'raise SystemExit(3)'",
+        "slow": "python -c 'import time; time.sleep(60)'",
+        "after": {"cmd": "python -c 'print(42)'", "depends": ["fail"]},
+        "ci": {"composite": ["slow", "fail", "after"], "parallel": True, "jobs": 2},
+    }
+    project.pyproject.write()
+    start = time.monotonic()
+    result = pdm(["run", "ci"], obj=project)
+    assert result.exit_code == 3
+    assert time.monotonic() - start < 30
+    assert "after |" not in result.output
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="The shell script is POSIX only")
+def test_composite_parallel_cancels_shell_subprocesses(project, pdm):
+    project.pyproject.settings["scripts"] = {
+        "fail": "python -c 'raise SystemExit(3)'",
+        # The shell forks the python process, which holds the output pipe
+        "slow": {"shell": "python -c 'import time; time.sleep(60)' && echo done"},
+        "ci": {"composite": ["slow", "fail"], "parallel": True, "jobs": 2},
+    }
+    project.pyproject.write()
+    start = time.monotonic()
+    result = pdm(["run", "ci"], obj=project)
+    assert result.exit_code == 3
+    assert time.monotonic() - start < 30
+    assert "slow | done" not in result.output
+
+
+def test_composite_parallel_circular_dependencies(project, pdm):
+    project.pyproject.settings["scripts"] = {
+        "first": {"cmd": "python -V", "depends": ["second"]},
+        "second": {"cmd": "python -V", "depends": ["first"]},
+        "ci": {"composite": ["first"], "parallel": True},
+    }
+    project.pyproject.write()
+    result = pdm(["run", "ci"], obj=project)
+    assert result.exit_code == 1
+    assert "Circular dependencies among tasks: first, second" in result.stderr
+
+
+def test_run_reuses_launch_record(project, pdm, mocker, monkeypatch, capfd):
+    project.environment = None
+    pdm(["run", "python", "-V"], strict=True, obj=project)
+
+    project.environment = None
+    get_environment = mocker.spy(project, "get_environment")
+    capfd.readouterr()
+    pdm(["run", "python", "-c", "import os;print(os.getenv('PDM_PROJECT_ROOT'))"], strict=True, obj=project)
+    assert capfd.readouterr()[0].strip() == str(project.root)
+    get_environment.assert_not_called()
+
+    # The record is invalidated when the environment variables change
+    monkeypatch.setenv("PATH", os.pathsep.join([str(project.root), os.getenv("PATH", "")]))
+    pdm(["run", "python", "-V"], strict=True, obj=project)
+    get_environment.assert_called_once()
+
+
+def test_run_task_skipped_if_inputs_unchanged(project, pdm):
+    project.root.joinpath("schema.txt").write_text("v1")
+    project.root.joinpath("gen.py").write_text(
+        "import shutil\nwith open('runs.txt', 'a') as f:\n    f.write('x')\nshutil.copy('schema.txt', 'out.txt')\n"
+    )
+    project.pyproject.settings["scripts"] = {
+        "gen": {"cmd": "python gen.py", "inputs": ["schema.txt", "*.py"], "outputs": ["out.txt"]}
+    }
+    project.pyproject.write()
+    runs = project.root / "runs.txt"
+    pdm(["run", "gen"], strict=True, obj=project)
+    result = pdm(["run", "gen"], strict=True, obj=project)
+    assert "is up to date, skipped" in result.stderr
+    assert runs.read_text() == "x"
+
+    project.root.joinpath("schema.txt").write_text("v2")
+    pdm(["run", "gen"], strict=True, obj=project)
+    assert runs.read_text() == "xx"
+    assert project.root.joinpath("out.txt").read_text() == "v2"
+
+    pdm(["run", "gen", "--extra"], strict=True, obj=project)
+    assert runs.read_text() == "xxx"
+
+    project.root.joinpath("out.txt").unlink()
+    pdm(["run", "gen", "--extra"], strict=True, obj=project)
+    assert runs.read_text() == "xxxx"
+
+
+def test_run_task_skipped_with_directory_outputs(project, pdm):
+    project.root.joinpath("src").mkdir()
+    project.root.joinpath("src/schema.txt").write_text("v1")
+    project.root.joinpath("gen.py").write_text(
+        "import os, shutil\n"
+        "with open('runs.txt', 'a') as f:\n    f.write('x')\n"
+        "os.makedirs('dist', exist_ok=True)\n"
+        "shutil.copy('src/schema.txt', 'dist/out.txt')\n"
+    )
+    project.pyproject.settings["scripts"] = {"gen": {"cmd": "python gen.py", "inputs": ["src"], "outputs": ["dist"]}}
+    project.pyproject.write()
+    runs = project.root / "runs.txt"
+    pdm(["run", "gen"], strict=True, obj=project)
+    result = pdm(["run", "gen"], strict=True, obj=project)
+    assert "is up to date, skipped" in result.stderr
+    assert runs.read_text() == "x"
+
+    project.root.joinpath("src/schema.txt").write_text("v2")
+    pdm(["run", "gen"], strict=True, obj=project)
+    assert runs.read_text() == "xx"
+
+    project.root.joinpath("dist/out.txt").unlink()
+    pdm(["run", "gen"], strict=True, obj=project)
+    assert runs.read_text() == "xxx"
+
+
+def test_run_task_with_absolute_inputs(project, pdm, tmp_path):
+    schema = tmp_path / "schema.txt"
+    schema.write_text("v1")
+    project.root.joinpath("gen.py").write_text("with open('runs.txt', 'a') as f:\n    f.write('x')\n")
+    project.pyproject.settings["scripts"] = {
+        "gen": {"cmd": "python gen.py", "inputs": [schema.as_posix(), "*.py"], "outputs": ["runs.txt"]}
+    }
+    project.pyproject.write()
+    runs = project.root / "runs.txt"
+    pdm(["run", "gen"], strict=True, obj=project)
+    result = pdm(["run", "gen"], strict=True, obj=project)
+    assert "is up to date, skipped" in result.stderr
+    assert runs.read_text() == "x"
+
+    schema.write_text("v2")
+    pdm(["run", "gen"], strict=True, obj=project)
+    assert runs.read_text() == "xx"
+
+
 def test_composite_fail_on_first_missing_task(project, pdm, capfd, _echo):
     project.pyproject.settings["scripts"] = {
         "first": "python echo.py First",
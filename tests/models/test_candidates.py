@@ -1,3 +1,5 @@
+import hashlib
+import os
 import shutil
 
 import pytest
@@ -223,6 +225,28 @@ def test_sdist_candidate_with_wheel_cache(project, mocker):
     assert wheel == cache_path / built_path.name
 
 
+def test_wheel_cache_reads_best_wheel_from_manifest(project, mocker):
+    file_link = Link(path_to_url((FIXTURES / "artifacts/demo-0.0.1.tar.gz").as_posix()))
+    built_path = FIXTURES / "artifacts/demo-0.0.1-py2.py3-none-any.whl"
+    target_python = project.environment.target_python
+    wheel_cache = project.make_wheel_cache()
+    assert project.make_wheel_cache() is wheel_cache
+    cache_path = wheel_cache.get_path_for_link(file_link, target_python)
+    cache_path.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(built_path, cache_path)
+    # Make the directory mtime old enough to be trusted
+    os.utime(cache_path, ns=(0, 0))
+    scan = mocker.spy(wheel_cache, "_get_from_path")
+    assert wheel_cache.get(file_link, "demo", target_python) == cache_path / built_path.name
+    assert wheel_cache.get(file_link, "demo", target_python) == cache_path / built_path.name
+    assert scan.call_count == 1
+
+    # The manifest is outdated once the directory changes
+    os.unlink(cache_path / built_path.name)
+    assert wheel_cache.get(file_link, "demo", target_python) is None
+    assert scan.call_count == 2
+
+
 @pytest.mark.usefixtures("vcs", "local_finder")
 def test_cache_vcs_immutable_revision(project):
     req = parse_requirement("git+https://github.com/test-root/demo.git@master#egg=demo")
@@ -276,6 +300,21 @@ def test_legacy_pep345_tag_link(project):
     assert candidate.requires_python == ">=3,<4"
 
 
+def test_fetch_hashes_reuses_session_and_index_pages(project, mocker):
+    project.project_config["pypi.url"] = "https://my.pypi.org/simple"
+    repo = project.get_repository()
+    candidates = list(repo.find_candidates(parse_requirement("demo")))
+    collect_links = mocker.patch("pdm.models.finder.collect_links_from_location")
+    build_session = mocker.spy(project.environment, "_build_session")
+
+    repo.fetch_hashes(candidates)
+
+    collect_links.assert_not_called()
+    build_session.assert_called_once()
+    for candidate in candidates:
+        assert [item["file"] for item in candidate.hashes] == ["demo-0.0.1-py2.py3-none-any.whl"]
+
+
 @pytest.mark.filterwarnings("ignore::FutureWarning")
 def test_ignore_invalid_py_version(project):
     project.project_config["pypi.url"] = "https://my.pypi.org/simple"
@@ -323,3 +362,64 @@ def test_get_metadata_for_non_existing_path(project):
     candidate = Candidate(req)
     with pytest.raises(FileNotFoundError, match="No such file or directory"):
         candidate.prepare(project.environment).metadata
+
+
+def test_use_artifact_cache_without_network(project, mocker):
+    wheel = FIXTURES / "artifacts/demo-0.0.1-py2.py3-none-any.whl"
+    file_hash = f"sha256:{hashlib.sha256(wheel.read_bytes()).hexdigest()}"
+    req = parse_requirement("demo==0.0.1")
+    candidate = Candidate(req, name="demo", version="0.0.1", link=Link(f"http://fixtures.test/artifacts/{wheel.name}"))
+    candidate.hashes = [{"file": wheel.name, "hash": file_hash}]
+    downloaded = candidate.prepare(project.environment).build()
+    assert project.make_artifact_cache().get(file_hash) == downloaded
+
+    find_best_match = mocker.patch("unearth.PackageFinder.find_best_match")
+    download = mocker.patch("unearth.PackageFinder.download_and_unpack")
+    tag_priorities = mocker.spy(project.make_wheel_cache(), "get_tag_priorities")
+    for _ in range(2):
+        candidate = Candidate(req, name="demo", version="0.0.1")
+        candidate.hashes = [{"file": wheel.name, "hash": file_hash}]
+        assert candidate.prepare(project.environment).build() == downloaded
+    find_best_match.assert_not_called()
+    download.assert_not_called()
+    # The tag table is shared by the candidates instead of rebuilt for each of them
+    assert tag_priorities.call_count == 2
+    assert tag_priorities.spy_return is project.make_wheel_cache().get_tag_priorities(project.environment.target_python)
+
+
+def test_download_to_artifact_cache_in_one_pass(project, mocker):
+    from unearth.errors import HashMismatchError
+
+    wheel = FIXTURES / "artifacts/demo-0.0.1-py2.py3-none-any.whl"
+    file_hash = f"sha256:{hashlib.sha256(wheel.read_bytes()).hexdigest()}"
+    req = parse_requirement("demo==0.0.1")
+    link = Link(f"http://fixtures.test/artifacts/{wheel.name}")
+    candidate = Candidate(req, name="demo", version="0.0.1", link=link)
+    candidate.hashes = [{"file": wheel.name, "hash": "sha256:" + "0" * 64}]
+    with pytest.raises(HashMismatchError):
+        candidate.prepare(project.environment).build()
+    assert project.make_artifact_cache().get(file_hash) is None
+
+    # The artifact isn't read again to be hashed for the cache
+    add = mocker.spy(project.make_artifact_cache().__class__, "add")
+    candidate = Candidate(req, name="demo", version="0.0.1", link=link)
+    candidate.hashes = [{"file": wheel.name, "hash": file_hash}]
+    downloaded = candidate.prepare(project.environment).build()
+    assert project.make_artifact_cache().get(file_hash) == downloaded
+    add.assert_not_called()
+
+
+@pytest.mark.parametrize("allow_all", [False, True])
+def test_download_to_artifact_cache_validates_link_hash(project, allow_all):
+    from unearth.errors import HashMismatchError
+
+    wheel = FIXTURES / "artifacts/demo-0.0.1-py2.py3-none-any.whl"
+    file_hash = f"sha256:{hashlib.sha256(wheel.read_bytes()).hexdigest()}"
+    req = parse_requirement("demo==0.0.1")
+    link = Link(f"http://fixtures.test/artifacts/{wheel.name}#sha256={'0' * 64}")
+    candidate = Candidate(req, name="demo", version="0.0.1", link=link)
+    # The hash in the link fragment is checked when there are no locked hashes to validate
+    candidate.hashes = [{"file": wheel.name, "hash": file_hash}] if allow_all else []
+    with pytest.raises(HashMismatchError):
+        candidate.prepare(project.environment).obtain(allow_all=allow_all)
+    assert project.make_artifact_cache().get(file_hash) is None
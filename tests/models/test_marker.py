@@ -1,6 +1,7 @@
 import pytest
+from dep_logic.markers import MarkerExpression
 
-from pdm.models.markers import get_marker
+from pdm.models.markers import MarkerEvaluator, evaluate_markers, get_marker
 
 
 @pytest.mark.parametrize(
@@ -27,3 +28,17 @@ def test_split_pyspec(original, marker, py_spec):
     a, b = m.split_pyspec()
     assert marker == str(a)
     assert py_spec == str(b)
+
+
+def test_marker_evaluation_is_memoized(mocker):
+    MarkerEvaluator.clear()
+    env = {"python_version": "3.9", "sys_platform": "linux", "extra": ""}
+    first = get_marker("python_version >= '3.8' and sys_platform == 'linux'")
+    second = get_marker("sys_platform == 'linux' and python_version >= '3.8'")
+    evaluate = mocker.spy(MarkerExpression, "evaluate")
+    assert first.evaluate(env) and second.evaluate(dict(env))
+    # Each expression is evaluated once for the environment
+    assert evaluate.call_count == 2
+    assert evaluate_markers([first, None, get_marker("sys_platform == 'win32'")], env) == [True, True, False]
+    assert evaluate.call_count == 3
+    assert not first.evaluate({**env, "python_version": "3.7"})
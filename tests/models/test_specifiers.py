@@ -120,3 +120,24 @@ def test_pyspec_isnot_subset_superset(left, right):
     right = PySpecSet(right)
     assert not left.is_subset(right), f"{left}, {right}"
     assert not left.is_superset(right), f"{left}, {right}"
+
+
+def test_pyspec_intern_and_operation_caches():
+    PySpecSet.cache_clear()
+    spec = PySpecSet.intern(">=3.7, <4")
+    assert PySpecSet.intern(">=3.7,<4") is spec
+    assert PySpecSet.intern("==3.8.*") is not spec
+    assert PySpecSet.cache_info()["intern"][:2] == (1, 2)
+
+    other = PySpecSet(">=3.8")
+    assert (spec & other) is (spec & PySpecSet(">=3.8"))
+    assert spec.is_superset(">=3.8") and spec.is_superset(other)
+    # The operands of the operations are left unchanged
+    assert str(PySpecSet.intern(">=3.8")) == ">=3.8"
+
+    info = PySpecSet.cache_info()
+    assert info["and"].hits == 1 and info["and"].misses == 1
+    assert info["is_superset"].misses == 2
+    PySpecSet.cache_clear()
+    assert PySpecSet.cache_info()["and"].currsize == 0
+    assert PySpecSet.intern(">=3.7,<4") is not spec
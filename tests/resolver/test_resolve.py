@@ -404,3 +404,27 @@ def test_resolve_record_markers(resolve, repository, project):
         str(result["b"].req.marker) == 'os_name == "posix" or (os_name == "posix" or os_name == "nt") and '
         'platform_machine == "x86_64" and python_version < "3.8"'
     )
+
+
+@pytest.mark.parametrize("prefetch_workers", [0, 4])
+def test_resolve_with_metadata_prefetch(resolve, repository, project, mocker, prefetch_workers):
+    project.project_config["strategy.prefetch_workers"] = prefetch_workers
+    mocker.patch("pdm.pytest._FakeLink.is_wheel", True)
+    prefetch = mocker.spy(repository, "prefetch_dependencies")
+
+    result = resolve(["requests"])
+
+    assert {key: can.version for key, can in result.items()} == {
+        "requests": "2.19.1",
+        "urllib3": "1.22",
+        "chardet": "3.0.4",
+        "certifi": "2018.11.17",
+        "idna": "2.7",
+    }
+    if prefetch_workers:
+        assert prefetch.call_count > 0
+        assert result["urllib3"].dep_key in repository._prefetched
+        # The prefetched info isn't saved unless the candidate should be cached
+        assert result["urllib3"] not in repository._candidate_info_cache
+    else:
+        prefetch.assert_not_called()
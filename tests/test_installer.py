@@ -97,6 +97,96 @@ def test_rollback_after_commit(project, caplog):
     assert any(record.message == "Can't rollback, not uninstalled yet" for record in caplog.records)
 
 
+def test_uninstall_many_in_one_transaction(project):
+    from pdm.installers.uninstallers import BulkRemovePaths
+
+    installer = InstallManager(project.environment)
+    for name, link in [
+        ("demo", "http://fixtures.test/artifacts/demo-0.0.1-py2.py3-none-any.whl"),
+        ("celery", "http://fixtures.test/artifacts/celery-4.4.2-py2.py3-none-any.whl"),
+    ]:
+        installer.install(Candidate(parse_requirement(name), link=Link(link)))
+    paths = project.environment.get_paths()
+    pth_file = os.path.join(paths["purelib"], "easy-install.pth")
+    with open(pth_file, "w") as fp:
+        fp.write("/path/to/demo\n/path/to/other\n")
+    lib_file = os.path.join(paths["purelib"], "demo.py")
+    celery_script = os.path.join(paths["scripts"], "celery.exe" if os.name == "nt" else "celery")
+    working_set = project.environment.get_working_set()
+    dists = [working_set["demo"], working_set["celery"]]
+
+    remove_paths = BulkRemovePaths(project.environment)
+    for dist in dists:
+        remove_paths.add(installer.get_paths_to_remove(dist))
+    remove_paths.removals[0].add_pth("/path/to/demo")
+    remove_paths.remove()
+    assert not os.path.exists(lib_file)
+    assert not os.path.exists(celery_script)
+    with open(pth_file) as fp:
+        assert fp.read() == "/path/to/other\n"
+    remove_paths.rollback()
+    assert os.path.exists(lib_file)
+    assert os.path.exists(celery_script)
+    with open(pth_file) as fp:
+        assert fp.read() == "/path/to/demo\n/path/to/other\n"
+
+    installer.uninstall_many(dists)
+    working_set = project.environment.get_working_set()
+    assert "demo" not in working_set
+    assert "celery" not in working_set
+    assert not os.path.exists(lib_file)
+    assert not os.path.exists(celery_script)
+    assert not any(name.startswith(".pdm-") for name in os.listdir(paths["prefix"]))
+
+
+def test_uninstall_many_calls_overridden_uninstall(project):
+    removed = []
+
+    class MyInstallManager(InstallManager):
+        def uninstall(self, dist):
+            removed.append(dist.metadata["Name"])
+            super().uninstall(dist)
+
+    installer = MyInstallManager(project.environment)
+    for name, link in [
+        ("demo", "http://fixtures.test/artifacts/demo-0.0.1-py2.py3-none-any.whl"),
+        ("celery", "http://fixtures.test/artifacts/celery-4.4.2-py2.py3-none-any.whl"),
+    ]:
+        installer.install(Candidate(parse_requirement(name), link=Link(link)))
+    working_set = project.environment.get_working_set()
+    installer.uninstall_many([working_set["demo"], working_set["celery"]])
+    assert removed == ["demo", "celery"]
+    working_set = project.environment.get_working_set()
+    assert "demo" not in working_set
+    assert "celery" not in working_set
+
+
+def test_working_set_snapshot_updated_on_install_and_uninstall(project, mocker):
+    req = parse_requirement("demo")
+    candidate = Candidate(
+        req,
+        link=Link("http://fixtures.test/artifacts/demo-0.0.1-py2.py3-none-any.whl"),
+    )
+    installer = InstallManager(project.environment)
+    lib_path = project.environment.get_paths()["purelib"]
+    snapshot = project.environment.working_set_snapshot
+    dist = installer.install(candidate)
+    dist_key = f"dist:{os.path.normcase(os.path.abspath(dist._path))}"
+    assert snapshot._cache.get(dist_key) == ["demo", "0.0.1"]
+
+    # Make the directory mtime old enough to be trusted
+    os.utime(lib_path, ns=(0, 0))
+    scan = mocker.spy(snapshot, "_scan")
+    assert project.environment.get_working_set()["demo"].version == "0.0.1"
+    assert scan.call_count == 1
+    assert "demo" in project.environment.get_working_set()
+    assert scan.call_count == 1
+
+    installer.uninstall(dist)
+    assert dist_key not in snapshot._cache
+    assert "demo" not in project.environment.get_working_set()
+
+
 @pytest.mark.parametrize("use_install_cache", [False, True])
 def test_uninstall_with_console_scripts(project, use_install_cache):
     req = parse_requirement("celery")
@@ -241,3 +331,75 @@ def test_install_cache_symlink_individual(project):
     for path in ("pdm", "pdm/backend"):
         assert os.path.exists(child := os.path.join(lib_path, path)) and not os.path.islink(child)
     assert os.path.islink(os.path.join(lib_path, "pdm/backend/__init__.py"))
+
+
+@pytest.mark.parametrize("preferred", ["symlink", "hardlink", None])
+def test_install_cached_package_from_manifest(project, mocker, supports_link):
+    from pdm.installers import installers
+    from pdm.installers.packages import CachedPackage
+
+    req = parse_requirement("celery")
+    candidate = Candidate(req, link=Link("http://fixtures.test/artifacts/celery-4.4.2-py2.py3-none-any.whl"))
+    installer = InstallManager(project.environment, use_install_cache=True)
+    dist = installer.install(candidate)
+    package_cache = CachedPackage(project.cache("packages") / "celery-4.4.2-py2.py3-none-any")
+    assert package_cache.manifest is not None
+    record = sorted(dist.read_text("RECORD").splitlines())
+    # Keep the cached package alive after the uninstallation
+    package_cache.add_referrer(str(project.root))
+    installer.uninstall(dist)
+
+    open_wheel = mocker.spy(installers.WheelFile, "open")
+    dist = installer.install(candidate)
+    open_wheel.assert_not_called()
+    assert sorted(dist.read_text("RECORD").splitlines()) == record
+    paths = project.environment.get_paths()
+    celery_script = os.path.join(paths["scripts"], "celery.exe" if os.name == "nt" else "celery")
+    assert os.path.isfile(celery_script)
+    assert dist.read_text("REFER_TO") == package_cache.path.as_posix()
+    if supports_link("symlink") or supports_link("link"):
+        assert os.path.exists(os.path.join(paths["purelib"], "celery", "__init__.py"))
+
+    installer.uninstall(dist)
+    assert not os.path.exists(celery_script)
+    assert "celery" not in project.environment.get_working_set()
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_install_trusted_cached_wheel_skips_record_validation(project, mocker, trusted):
+    from pdm.installers import installers
+
+    project.project_config["install.trust_cached_wheels"] = trusted
+    wheel = FIXTURES / "artifacts/demo-0.0.1-py2.py3-none-any.whl"
+    req = parse_requirement("demo==0.0.1")
+    candidate = Candidate(req, name="demo", version="0.0.1", link=Link(f"http://fixtures.test/artifacts/{wheel.name}"))
+    validate_record = mocker.spy(installers.WheelFile, "validate_record")
+    installer = InstallManager(project.environment)
+    installer.install(candidate)
+    assert "demo" in project.environment.get_working_set()
+    assert validate_record.call_count == (0 if trusted else 1)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_install_pipeline_stages(parallel):
+    from pdm.installers.pipeline import Pipeline, Stage
+
+    processed = []
+
+    def make_stage(name):
+        def func(job):
+            if name == "build" and job == "bad":
+                raise RuntimeError(job)
+            processed.append((name, job))
+
+        return Stage(name, func, workers=2)
+
+    results = {}
+    pipeline = Pipeline([make_stage(name) for name in ("download", "build", "install")], parallel=parallel)
+    pipeline.run(["foo", "bad", "bar"], lambda job, error: results.setdefault(job, error))
+    assert results["foo"] is None and results["bar"] is None
+    assert isinstance(results["bad"], RuntimeError)
+    for job in ("foo", "bar"):
+        stages = [name for name, j in processed if j == job]
+        assert stages == ["download", "build", "install"]
+    assert ("install", "bad") not in processed
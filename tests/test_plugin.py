@@ -1,3 +1,4 @@
+import importlib
 import sys
 from unittest import mock
 
@@ -107,6 +108,26 @@ def test_old_entry_point_compatibility(pdm, mocker, core):
     assert result.output.strip() == "bar"
 
 
+def test_commands_and_plugins_loaded_on_dispatch(mocker, core, project, pdm):
+    new_core = type(core)()
+    assert not new_core.plugins_loaded
+    assert "info" in new_core.subparsers.loaders
+    with pytest.raises(SystemExit):
+        new_core.main(["--version"], obj=project)
+    assert not new_core.plugins_loaded
+
+    entry_points = mocker.patch.object(
+        importlib_metadata, "entry_points", return_value=[make_entry_point(replace_command)]
+    )
+    import_module = mocker.spy(importlib, "import_module")
+    new_core.main(["info", "-n", "Frost"], obj=project)
+    assert new_core.plugins_loaded
+    entry_points.assert_called()
+    # The built-in command replaced by the plugin is never imported
+    assert "info" not in new_core.subparsers.loaders
+    assert mocker.call("pdm.cli.commands.info") not in import_module.call_args_list
+
+
 @pytest.mark.usefixtures("local_finder")
 def test_project_plugin_library(pdm, project, core, monkeypatch):
     monkeypatch.setattr(sys, "path", sys.path[:])
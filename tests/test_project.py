@@ -11,7 +11,7 @@ from pytest_httpserver import HTTPServer
 
 from pdm.environments import PythonEnvironment
 from pdm.exceptions import PdmException
-from pdm.models.requirements import parse_requirement
+from pdm.models.requirements import Requirement, parse_requirement
 from pdm.models.specifiers import PySpecSet
 from pdm.models.venv import get_venv_python
 from pdm.utils import cd
@@ -389,3 +389,143 @@ def test_filter_sources_with_config(project):
     expect_sources("foo-bar", ["source1", "source2"])
     expect_sources("bar-extra", ["source2"])
     expect_sources("baz-extra", ["source1", "pypi"])
+
+
+def test_locked_repository_find_candidates_by_index(project):
+    project.lockfile.set_data(
+        {
+            "metadata": {"lock_version": "4.4", "content_hash": "sha256:abc", "groups": ["default"]},
+            "package": [
+                {"name": "foo", "version": "1.0", "requires_python": ">=3.7"},
+                {"name": "bar", "version": "2.0"},
+                {"name": "demo", "version": "0.0.1", "path": "./demo"},
+            ],
+        }
+    )
+    repository = project.locked_repository
+    assert list(repository.all_candidates) == ["foo", "bar", "demo"]
+    assert repository.all_candidates is repository.all_candidates
+
+    assert [c.version for c in repository.find_candidates(parse_requirement("foo"))] == ["1.0"]
+    assert not list(repository.find_candidates(parse_requirement("baz")))
+    with cd(project.root):
+        (found,) = repository.find_candidates(parse_requirement("./demo"))
+        assert found.name == "demo"
+        assert not list(repository.find_candidates(parse_requirement("./other")))
+
+
+def test_locked_repository_builds_requested_packages_only(project, mocker):
+    project.lockfile.set_data(
+        {
+            "metadata": {"lock_version": "4.4", "content_hash": "sha256:abc", "groups": ["default"]},
+            "package": [
+                {"name": "foo", "version": "1.0"},
+                {"name": "bar", "version": "2.0"},
+            ],
+        }
+    )
+    from_req_dict = mocker.spy(Requirement, "from_req_dict")
+    repository = project.locked_repository
+    from_req_dict.assert_not_called()
+    assert "foo" in repository.all_candidates
+    assert [c.version for c in repository.find_candidates(parse_requirement("foo"))] == ["1.0"]
+    assert from_req_dict.call_count == 1
+    assert [key[0] for key in repository.packages] == ["foo", "bar"]
+    assert from_req_dict.call_count == 2
+
+
+def test_locked_repository_keeps_lockfile_order(project):
+    project.lockfile.set_data(
+        {
+            "metadata": {"lock_version": "4.4", "content_hash": "sha256:abc", "groups": ["default"]},
+            "package": [
+                {"name": "foo", "version": "1.0"},
+                {"name": "bar", "version": "2.0"},
+            ],
+        }
+    )
+    repository = project.locked_repository
+    # All packages are loaded by the lookups, in the reverse order
+    for name in ("bar", "foo"):
+        assert list(repository.find_candidates(parse_requirement(name)))
+    assert [key[0] for key in repository.packages] == ["foo", "bar"]
+
+
+def test_locked_repository_evaluate_markers(project):
+    project.lockfile.set_data(
+        {
+            "metadata": {"lock_version": "4.4", "content_hash": "sha256:abc", "groups": ["default"]},
+            "package": [
+                {"name": "foo", "version": "1.0", "groups": ["default"], "marker": "sys_platform == 'win32'"},
+                {"name": "bar", "version": "2.0", "groups": ["default"], "marker": "sys_platform == 'linux'"},
+                {"name": "baz", "version": "3.0", "groups": ["default"]},
+            ],
+        }
+    )
+    repository = project.locked_repository
+    result = repository.evaluate_markers({"sys_platform": "linux"})
+    assert {key[0]: value for key, value in result.items()} == {"foo": False, "bar": True, "baz": True}
+
+
+def test_lockfile_read_without_tomlkit(project, tmp_path, mocker):
+    from pdm.compat import tomllib
+    from pdm.project.lockfile import Lockfile
+
+    project.lockfile.set_data({"metadata": {"lock_version": "4.4", "content_hash": "sha256:abc"}})
+    project.lockfile.write(False)
+    read = mocker.patch("tomlkit.toml_file.TOMLFile.read")
+    lockfile = Lockfile(project.lockfile.path, ui=project.core.ui, cache_dir=tmp_path / "lockfiles")
+    assert lockfile.hash == "sha256:abc"
+    read.assert_not_called()
+    assert len(list(tmp_path.joinpath("lockfiles").iterdir())) == 1
+
+    # Loaded from the binary cache the next time
+    loads = mocker.spy(tomllib, "loads")
+    lockfile = Lockfile(project.lockfile.path, ui=project.core.ui, cache_dir=tmp_path / "lockfiles")
+    assert lockfile.file_version == "4.4"
+    loads.assert_not_called()
+
+
+def test_lockfile_data_unwrapped_once(project, mocker):
+    from tomlkit.toml_document import TOMLDocument
+
+    project.lockfile.set_data({"metadata": {"lock_version": "4.4", "content_hash": "sha256:abc"}})
+    unwrap = mocker.spy(TOMLDocument, "unwrap")
+    assert project.lockfile.hash == "sha256:abc"
+    assert project.lockfile.file_version == "4.4"
+    assert unwrap.call_count == 1
+
+    project.lockfile["metadata"]["content_hash"] = "sha256:def"
+    assert project.lockfile.hash == "sha256:def"
+    project.lockfile.set_data({"metadata": {"lock_version": "4.4", "content_hash": "sha256:123"}})
+    assert project.lockfile.hash == "sha256:123"
+
+
+def test_interpreter_facts_of_running_python_without_subprocess(mocker):
+    from pdm.models.in_process import get_interpreter_facts
+
+    check_output = mocker.patch("subprocess.check_output")
+    facts = get_interpreter_facts.__wrapped__(sys.executable)
+    check_output.assert_not_called()
+    assert facts["pep508"]["python_full_version"] == ".".join(map(str, sys.version_info[:3]))
+    assert facts["paths"]["default"]["purelib"]
+
+
+def test_interpreter_facts_persistent_cache(tmp_path, mocker):
+    from pdm.models.in_process import get_interpreter_facts
+
+    venv.create(tmp_path / "venv", symlinks=True)
+    python = get_venv_python(tmp_path / "venv").as_posix()
+    cache_dir = (tmp_path / "cache").as_posix()
+    facts = get_interpreter_facts.__wrapped__(python, cache_dir)
+    assert facts["paths"]["default"]["purelib"].startswith(str(tmp_path / "venv"))
+
+    check_output = mocker.patch("subprocess.check_output", side_effect=RuntimeError("should not run"))
+    assert get_interpreter_facts.__wrapped__(python, cache_dir) == facts
+    check_output.assert_not_called()
+
+    # Changing pyvenv.cfg invalidates the cached facts
+    with open(tmp_path / "venv/pyvenv.cfg", "a") as f:
+        f.write("prompt = changed\n")
+    with pytest.raises(RuntimeError):
+        get_interpreter_facts.__wrapped__(python, cache_dir)